@@ -1,23 +1,16 @@
-f"""
+"""
 Quizy - A professional Python quiz framework
 """
 
-from .core import (
-    Quiz,
-    Question,
-    QuestionType,
-    MultipleChoiceQuestion,
-    MultipleSelectQuestion,
-    ShortTextQuestion,
-    TrueFalseQuestion,
-    MatchingQuestion,
-    QuizResult,
-    QuestionResult,
-    ResultStatus,
-)
-from .cli import QuizCLI, TimerDisplay
-
-__version__ = "0.4.8"
+import importlib
+from importlib.metadata import PackageNotFoundError, version
+
+try:
+    # Single source of truth: the version in pyproject.toml
+    __version__ = version("quizy")
+except PackageNotFoundError:  # running from a source checkout that isn't installed
+    __version__ = "0.0.0+unknown"
+
 __all__ = [
     "Quiz",
     "Question",
@@ -33,3 +26,32 @@ __all__ = [
     "QuizCLI",
     "TimerDisplay",
 ]
+
+# Public names and the submodule defining them, imported on first access (PEP 562)
+_LAZY = {
+    "Quiz": ".core",
+    "Question": ".core",
+    "QuestionType": ".core",
+    "MultipleChoiceQuestion": ".core",
+    "MultipleSelectQuestion": ".core",
+    "ShortTextQuestion": ".core",
+    "TrueFalseQuestion": ".core",
+    "MatchingQuestion": ".core",
+    "QuizResult": ".core",
+    "QuestionResult": ".core",
+    "ResultStatus": ".core",
+    "QuizCLI": ".cli",
+    "TimerDisplay": ".cli",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,46 @@
+"""
+Optional dependencies shared across quizy modules
+Both are imported on first use, so importing quizy never pays for them up front
+"""
+
+import functools
+import json
+from typing import Any, Union
+
+
+@functools.lru_cache(maxsize=None)
+def optional_numpy():
+    """Get the numpy module, or None when it is not installed"""
+    try:
+        import numpy
+    except ImportError:  # numpy is optional, callers fall back to pure Python
+        return None
+    return numpy
+
+
+@functools.lru_cache(maxsize=None)
+def _optional_orjson():
+    """Get the orjson module, or None when it is not installed"""
+    try:
+        import orjson
+    except ImportError:  # orjson is optional, stdlib json reads and writes the same format
+        return None
+    return orjson
+
+
+def json_dumps(data: Any, pretty: bool = False) -> str:
+    """Serialize to compact JSON text (indented when pretty), using orjson when installed"""
+    orjson = _optional_orjson()
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    if pretty:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text, using orjson when installed"""
+    orjson = _optional_orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,9 +1,14 @@
 import os
-import json
-from typing import List, Dict, Any, Optional, Union
+import time
+import atexit
+import random
+import functools
+import itertools
+import threading
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple, Union, Coroutine, Type
 import asyncio
 
-from openai import OpenAI, AsyncOpenAI
+from quizy.cache import PromptCache
 from quizy.core import (
     MultipleChoiceQuestion,
     TrueFalseQuestion,
@@ -15,14 +20,169 @@ from quizy.core import (
 )
 
 
+def _import_openai() -> Any:
+    """Import the OpenAI SDK on first use, so importing this module stays cheap"""
+    try:
+        import openai
+    except ImportError as e:
+        raise ImportError(
+            "AI question generation requires the OpenAI SDK. Install it with: pip install quizy[openai]"
+        ) from e
+    return openai
+
+
+class _LoopThread:
+    """Event loop running in a daemon thread, shared by the synchronous wrappers"""
+
+    _lock = threading.Lock()
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def get_loop(cls) -> asyncio.AbstractEventLoop:
+        """Get the shared loop, starting it on first use"""
+        with cls._lock:
+            if cls._loop is None:
+                cls._loop = asyncio.new_event_loop()
+                cls._thread = threading.Thread(
+                    target=cls._loop.run_forever, name="quizy-ai-loop", daemon=True
+                )
+                cls._thread.start()
+            return cls._loop
+
+    @classmethod
+    def run(cls, coro: Coroutine) -> Any:
+        """Run a coroutine on the shared loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, cls.get_loop()).result()
+
+    @classmethod
+    def stop(cls) -> None:
+        """Cancel pending tasks and stop the shared loop"""
+        with cls._lock:
+            loop, thread = cls._loop, cls._thread
+            cls._loop = cls._thread = None
+        if loop is None:
+            return
+
+        def _cancel_all() -> None:
+            for task in asyncio.all_tasks(loop):
+                task.cancel()
+            loop.stop()
+
+        loop.call_soon_threadsafe(_cancel_all)
+        thread.join()
+        loop.close()
+
+
+atexit.register(_LoopThread.stop)
+
+# Per-type instructions appended to generation prompts
+_TYPE_GUIDANCE = {
+    QuestionType.MULTIPLE_CHOICE: "Provide exactly {num_options} options, one of them correct. Ensure options are plausible but clearly distinguishable.",
+    QuestionType.TRUE_FALSE: "The question should be a statement to evaluate as true or false.",
+    QuestionType.SHORT_TEXT: "Include acceptable alternative spellings or phrasings of the expected answer.",
+    QuestionType.MULTIPLE_SELECT: "The question should ask to select all correct answers. Ensure at least 2 correct answers and 2 incorrect options.",
+    QuestionType.MATCHING: "Ensure 3-5 pairs of logically related items.",
+}
+
+# Question type names as written in prompts
+_TYPE_DISPLAY = {
+    question_type: "short answer"
+    if question_type is QuestionType.SHORT_TEXT
+    else question_type.value.replace("_", " ")
+    for question_type in QuestionType
+}
+
+# Full single-question prompts, filled in by _create_prompt
+_PROMPT_TEMPLATES = {
+    question_type: (
+        "Generate a {difficulty} difficulty "
+        + _TYPE_DISPLAY[question_type]
+        + " question about: {topic}{context_block}\n\n"
+        + guidance
+    )
+    for question_type, guidance in _TYPE_GUIDANCE.items()
+}
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.tokens = per_minute
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until `amount` tokens are available, then consume them"""
+        amount = min(amount, self.capacity)
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
 class AIQuestionGenerator:
     """Generate quiz questions using OpenAI's API"""
 
+    # Questions requested per call by generate_questions_set_async
+    MAX_BATCH_SIZE = 10
+
+    # Question builders for parsed AI data, keyed by type: (data, time_limit) -> Question
+    _BUILDERS = {
+        QuestionType.MULTIPLE_CHOICE: lambda d, tl: MultipleChoiceQuestion(
+            text=d["question"],
+            options=d["options"],
+            correct_answer=d["correct_answer"],
+            explanation=d.get("explanation"),
+            time_limit=tl,
+        ),
+        QuestionType.TRUE_FALSE: lambda d, tl: TrueFalseQuestion(
+            text=d["question"],
+            correct_answer=d["correct_answer"],
+            explanation=d.get("explanation"),
+        ),
+        QuestionType.SHORT_TEXT: lambda d, tl: ShortTextQuestion(
+            text=d["question"],
+            correct_answer=d["correct_answer"],
+            accepted_variations=d.get("acceptable_variations"),
+            explanation=d.get("explanation"),
+            time_limit=tl,
+        ),
+        QuestionType.MULTIPLE_SELECT: lambda d, tl: MultipleSelectQuestion(
+            text=d["question"],
+            options=d["options"],
+            correct_answers=d["correct_answers"],
+            explanation=d.get("explanation"),
+            time_limit=tl,
+        ),
+        QuestionType.MATCHING: lambda d, tl: MatchingQuestion(
+            text=d["question"],
+            pairs=d["pairs"],
+            explanation=d.get("explanation"),
+            time_limit=tl,
+        ),
+    }
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: str = "gpt-4o-mini",  # default
         temperature: float = 0.9,
+        enable_cache: bool = False,
+        cache_path: Optional[str] = None,
+        similarity_threshold: Optional[float] = None,
+        embedding_model: str = "text-embedding-3-small",
+        max_concurrent: int = 10,
+        max_requests_per_minute: float = 500,
+        max_tokens_per_minute: float = 200_000,
+        max_retries: int = 3,
+        stream: bool = False,
     ):
         """
         Initialize the AI question generator
@@ -31,6 +191,16 @@ class AIQuestionGenerator:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env variable)
             model: OpenAI model to use (default: gpt-4o-mini)
             temperature: Temperature for generation (0.0-1.0, higher = more creative)
+            enable_cache: Reuse stored responses for prompts seen before
+            cache_path: SQLite file for the cache (default: ~/.cache/quizy/prompts.sqlite3)
+            similarity_threshold: Also reuse responses for prompts whose embedding
+                similarity reaches this value (e.g. 0.95); None for exact matches only
+            embedding_model: OpenAI model used for similarity lookups
+            max_concurrent: Maximum number of requests in flight at once
+            max_requests_per_minute: Request rate limit to stay under
+            max_tokens_per_minute: Token rate limit to stay under (estimated from prompt length)
+            max_retries: Retries with exponential backoff on rate-limit or connection errors
+            stream: Stream responses token by token instead of waiting for the full body
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
@@ -38,23 +208,53 @@ class AIQuestionGenerator:
                 "OpenAI API key required. Set OPENAI_API_KEY environment variable or pass api_key parameter"
             )
 
-        self.client = OpenAI(api_key=self.api_key)
-        self.async_client = AsyncOpenAI(api_key=self.api_key)
+        _import_openai()  # fail fast if the SDK is missing
+        # Clients are built on first use: most callers only ever need one of them
+        self._client = None
+        self._async_client = None
         self.model = model
         self.temperature = temperature
+        self.cache = PromptCache(cache_path) if enable_cache else None
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        self.max_concurrent = max_concurrent
+        self.max_retries = max_retries
+        self.stream = stream
+        self._rpm_bucket = _TokenBucket(max_requests_per_minute)
+        self._tpm_bucket = _TokenBucket(max_tokens_per_minute)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> Any:
+        """Synchronous OpenAI client, created on first access"""
+        if self._client is None:
+            self._client = _import_openai().OpenAI(api_key=self.api_key)
+        return self._client
+
+    @property
+    def async_client(self) -> Any:
+        """Asynchronous OpenAI client, created on first access"""
+        if self._async_client is None:
+            # Retries are handled by _create_completion so they respect the rate limits
+            self._async_client = _import_openai().AsyncOpenAI(
+                api_key=self.api_key, max_retries=0
+            )
+        return self._async_client
 
     def generate_questions_set(
         self,
         topic: str,
         num_questions: int = 5,
-        question_types: Optional[List[QuestionType]] = None,
+        question_types: Optional[List[Union[QuestionType, str]]] = None,
         difficulty: str = "medium",
         context: Optional[str] = None,
     ) -> List[Question]:
         """
         Generate multiple questions for a quiz synchronously.
 
-        Internally uses async but runs synchronously for ease of use.
+        Internally uses async, running on an event loop shared by all
+        synchronous calls so connections are reused between them.
 
         Args:
             topic: Topic for all questions
@@ -66,7 +266,7 @@ class AIQuestionGenerator:
         Returns:
             List of generated Question objects
         """
-        return asyncio.run(
+        return _LoopThread.run(
             self.generate_questions_set_async(
                 topic=topic,
                 num_questions=num_questions,
@@ -88,7 +288,8 @@ class AIQuestionGenerator:
         """
         Generate a single question synchronously.
 
-        Internally uses async but runs synchronously for ease of use.
+        Internally uses async, running on an event loop shared by all
+        synchronous calls so connections are reused between them.
 
         Args:
             topic: Topic for the question
@@ -101,7 +302,7 @@ class AIQuestionGenerator:
         Returns:
             Generated Question object or None if generation fails
         """
-        return asyncio.run(
+        return _LoopThread.run(
             self.generate_question_async(
                 topic=topic,
                 question_type=question_type,
@@ -112,6 +313,17 @@ class AIQuestionGenerator:
             )
         )
 
+    def close(self) -> None:
+        """Close the OpenAI clients and their connection pools"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self._async_client is not None:
+            _LoopThread.run(self._async_client.close())
+            self._async_client = None
+        if self.cache is not None:
+            self.cache.close()
+
     async def generate_question_async(
         self,
         topic: str,
@@ -122,29 +334,43 @@ class AIQuestionGenerator:
         context: Optional[str] = None,
     ) -> Optional[Question]:
         """Generate a single question asynchronously (internal)"""
-        if isinstance(question_type, str):
-            type_str = question_type.upper()
-            if type_str == "SHORT_ANSWER":
-                type_str = "SHORT_TEXT"
-            question_type = QuestionType[type_str]
+        question_type = self._coerce_type(question_type)
 
         prompt = self._create_prompt(
             topic, question_type, difficulty, num_options, context
         )
 
+        cache_key = None
+        embedding = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(prompt, self.model)
+            question_data = self.cache.get(cache_key)
+            if question_data is None and self.similarity_threshold is not None:
+                embedding = await self._embed(prompt)
+                question_data = self.cache.get_similar(
+                    embedding, self._cache_namespace(question_type), self.similarity_threshold
+                )
+            if question_data is not None:
+                return self._parse_question_data(question_data, question_type, time_limit)
+
         try:
-            response = await self.async_client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=self.temperature,
-            )
+            from quizy.ai_schemas import SCHEMA_FOR_TYPE
 
-            content = response.choices[0].message.content
-            question_data = json.loads(content)
+            response = await self._create_completion(prompt, SCHEMA_FOR_TYPE[question_type])
 
-            return self._parse_question_data(question_data, question_type, time_limit)
+            message = response.choices[0].message
+            if message.parsed is None:
+                raise ValueError(message.refusal or "No structured output returned")
+            question_data = message.parsed.to_question_data()
+
+            question = self._parse_question_data(question_data, question_type, time_limit)
+            if question is not None and cache_key is not None:
+                self.cache.set(
+                    cache_key, question_data, self._cache_namespace(question_type), embedding
+                )
+            return question
 
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (KeyError, ValueError) as e:
             print(f"Error parsing AI response: {e}")
             return None
 
@@ -152,166 +378,289 @@ class AIQuestionGenerator:
         self,
         topic: str,
         num_questions: int = 5,
-        question_types: Optional[List[QuestionType]] = None,
+        question_types: Optional[List[Union[QuestionType, str]]] = None,
         difficulty: str = "medium",
         context: Optional[str] = None,
     ) -> List[Question]:
         """Generate multiple questions for a quiz asynchronously (internal)"""
+        tasks = self._set_batches(topic, num_questions, question_types, difficulty, context)
+        batches = await asyncio.gather(*tasks)
+        return [question for batch in batches for question in batch]
+
+    async def generate_questions_set_stream_async(
+        self,
+        topic: str,
+        num_questions: int = 5,
+        question_types: Optional[List[Union[QuestionType, str]]] = None,
+        difficulty: str = "medium",
+        context: Optional[str] = None,
+    ) -> AsyncIterator[Question]:
+        """
+        Generate multiple questions for a quiz, yielding each batch as it completes
+
+        Takes the same arguments as generate_questions_set_async, but questions
+        can be consumed before the slowest request finishes. Order is not
+        preserved and invalid questions are dropped.
+        """
+        tasks = [
+            asyncio.ensure_future(task)
+            for task in self._set_batches(topic, num_questions, question_types, difficulty, context)
+        ]
+        try:
+            for next_batch in asyncio.as_completed(tasks):
+                for question in await next_batch:
+                    if question is not None:
+                        yield question
+        finally:
+            # Consumer stopped early, don't leave requests running
+            for task in tasks:
+                task.cancel()
+
+    def _set_batches(
+        self,
+        topic: str,
+        num_questions: int,
+        question_types: Optional[List[Union[QuestionType, str]]],
+        difficulty: str,
+        context: Optional[str],
+    ) -> List[Coroutine]:
+        """Split a question set into batch requests"""
         if question_types is None:
             question_types = [QuestionType.MULTIPLE_CHOICE]
 
-        tasks = []
-        for i in range(num_questions):
-            qtype = question_types[i % len(question_types)]
-            task = self.generate_question_async(
-                topic, qtype, difficulty, context=context
-            )
-            tasks.append(task)
+        question_types = [self._coerce_type(qtype) for qtype in question_types]
+        specs = [
+            (qtype, 4)
+            for qtype in itertools.islice(itertools.cycle(question_types), num_questions)
+        ]
 
-        return await asyncio.gather(*tasks)
+        # All questions share topic and context, so request them in batches
+        return [
+            self.generate_questions_batch_async(
+                topic, specs[start : start + self.MAX_BATCH_SIZE], difficulty, context=context
+            )
+            for start in range(0, len(specs), self.MAX_BATCH_SIZE)
+        ]
 
-    def _create_prompt(
+    async def generate_questions_batch_async(
         self,
         topic: str,
-        question_type: QuestionType,
+        specs: List[Tuple[Union[QuestionType, str], int]],
         difficulty: str = "medium",
-        num_options: int = 4,
+        time_limit: int = 20,
         context: Optional[str] = None,
-    ) -> str:
-        """Create a prompt for question generation"""
-
-        # Map SHORT_TEXT to "short answer" for prompt
-        type_display = (
-            "short answer"
-            if question_type == QuestionType.SHORT_TEXT
-            else question_type.value.replace("_", " ")
-        )
-        base_prompt = f"""Generate a {difficulty} difficulty {type_display} question about: {topic}"""
-
-        if context:
-            base_prompt += f"\n\nContext: {context}"
-
-        if question_type == QuestionType.MULTIPLE_CHOICE:
-            return f"""{base_prompt}
+    ) -> List[Optional[Question]]:
+        """
+        Generate several questions about one topic with a single request
 
-Return a JSON object with the following structure:
-{{
-    "question": "The question text",
-    "options": should contain {num_options} options and options should be array e.g. ["option1", "option2", ..., "optionN"],
-    "correct_answer": "correct option",
-    "explanation": "Why this is the correct answer"
-}}
+        Args:
+            topic: Topic for all questions
+            specs: (question_type, num_options) for each question to generate
+            difficulty: Difficulty level (easy, medium, hard)
+            time_limit: Time limit for each question in seconds
+            context: Optional context/reading material
 
-Ensure options are plausible but clearly distinguishable. Return only valid JSON."""
+        Returns:
+            Generated questions in spec order (None where a question was invalid)
+        """
+        if not specs:
+            return []
 
-        elif question_type == QuestionType.TRUE_FALSE:
-            return f"""{base_prompt}
+        specs = [(self._coerce_type(qtype), num_options) for qtype, num_options in specs]
+        prompt = self._create_batch_prompt(topic, tuple(specs), difficulty, context)
 
-Return a JSON object with the following structure:
-{{
-    "question": "The statement to evaluate as true or false",
-    "correct_answer": true,
-    "explanation": "Why this statement is true/false"
-}}
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(prompt, self.model)
+            batch_data = self.cache.get(cache_key)
+            if batch_data is not None and self._batch_matches(batch_data, specs):
+                return self._parse_batch_data(batch_data, time_limit)
 
-Return only valid JSON."""
+        try:
+            from quizy.ai_schemas import QuestionBatchSchema
 
-        elif question_type == QuestionType.SHORT_TEXT:
-            return f"""{base_prompt}
+            response = await self._create_completion(prompt, QuestionBatchSchema)
 
-Return a JSON object with the following structure:
-{{
-    "question": "The question text",
-    "correct_answer": "The expected answer",
-    "acceptable_variations": ["alternative answer 1", "alternative answer 2"],
-    "explanation": "Explanation of the answer"
-}}
+            message = response.choices[0].message
+            if message.parsed is None:
+                raise ValueError(message.refusal or "No structured output returned")
+            batch_data = {
+                "questions": [item.to_question_data() for item in message.parsed.questions]
+            }
 
-Return only valid JSON."""
+        except (KeyError, ValueError) as e:
+            print(f"Error parsing AI response: {e}")
+            return [None] * len(specs)
 
-        elif question_type == QuestionType.MULTIPLE_SELECT:
-            return f"""{base_prompt}
+        if not self._batch_matches(batch_data, specs):
+            return await self._regenerate_mismatched(
+                topic, specs, batch_data, difficulty, time_limit, context
+            )
 
-Return a JSON object with the following structure:
-{{
-    "question": "The question text (should ask to select all correct answers)",
-    "options": ["option1", "option2", "option3", "option4", "option5"],
-    "correct_answers": ["correct1", "correct2"],
-    "explanation": "Why these are the correct answers"
-}}
+        questions = self._parse_batch_data(batch_data, time_limit)
+        if cache_key is not None and all(questions):
+            self.cache.set(cache_key, batch_data)
+        return questions
 
-Ensure at least 2 correct answers and 2 incorrect options. Return only valid JSON."""
+    @staticmethod
+    def _batch_matches(data: Dict[str, Any], specs: List[Tuple[QuestionType, int]]) -> bool:
+        """Check a batch response holds exactly one item per spec, each of the requested type"""
+        items = data["questions"]
+        return len(items) == len(specs) and all(
+            item.get("type") == qtype.value for item, (qtype, _) in zip(items, specs)
+        )
 
-        elif question_type == QuestionType.MATCHING:
-            return f"""{base_prompt}
+    async def _regenerate_mismatched(
+        self,
+        topic: str,
+        specs: List[Tuple[QuestionType, int]],
+        data: Dict[str, Any],
+        difficulty: str,
+        time_limit: int,
+        context: Optional[str],
+    ) -> List[Optional[Question]]:
+        """Keep batch items that match their spec and request the others one by one"""
+        items = data["questions"]
+        questions: List[Optional[Question]] = [None] * len(specs)
+        missing = []
+        for i, (qtype, num_options) in enumerate(specs):
+            if i < len(items) and items[i].get("type") == qtype.value:
+                questions[i] = self._parse_question_data(items[i], qtype, time_limit)
+            else:
+                missing.append(i)
+
+        regenerated = await asyncio.gather(
+            *(
+                self.generate_question_async(
+                    topic, specs[i][0], difficulty, specs[i][1], time_limit, context
+                )
+                for i in missing
+            )
+        )
+        for i, question in zip(missing, regenerated):
+            questions[i] = question
+        return questions
+
+    async def _create_completion(self, prompt: str, response_format: Type[Any]) -> Any:
+        """Send a structured-output request, throttled and retried on rate limits"""
+        openai = _import_openai()
+        estimated_tokens = len(prompt) // 4
+        request = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": self.temperature,
+            "response_format": response_format,
+        }
+
+        for attempt in itertools.count():
+            await self._rpm_bucket.acquire()
+            await self._tpm_bucket.acquire(estimated_tokens)
+            try:
+                async with self._get_semaphore():
+                    if self.stream:
+                        # Tokens arrive as they are generated, so long batch responses
+                        # never sit idle long enough to hit read timeouts
+                        async with self.async_client.chat.completions.stream(**request) as stream:
+                            return await stream.get_final_completion()
+                    return await self.async_client.chat.completions.parse(**request)
+            except (openai.RateLimitError, openai.APIConnectionError):
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(2**attempt + random.random())
 
-Return a JSON object with the following structure:
-{{
-    "question": "Matching question prompt",
-    "pairs": {{
-        "item1": "match1",
-        "item2": "match2",
-        "item3": "match3"
-    }},
-    "explanation": "Explanation of the matches"
-}}
+    @staticmethod
+    def _coerce_type(question_type: Union[QuestionType, str]) -> QuestionType:
+        """Accept a QuestionType or its name in any case ("SHORT_ANSWER" means SHORT_TEXT)"""
+        if isinstance(question_type, QuestionType):
+            return question_type
+        type_str = question_type.upper()
+        if type_str == "SHORT_ANSWER":
+            type_str = "SHORT_TEXT"
+        return QuestionType[type_str]
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _embed(self, text: str) -> List[float]:
+        """Embed text for similarity cache lookups"""
+        response = await self.async_client.embeddings.create(
+            model=self.embedding_model, input=text
+        )
+        return response.data[0].embedding
 
-Ensure 3-5 pairs of logically related items. Return only valid JSON."""
+    def _cache_namespace(self, question_type: QuestionType) -> str:
+        """Similarity lookups only match prompts for the same model and question type"""
+        return f"{self.model}:{question_type.value}"
 
-        return base_prompt
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _create_prompt(
+        topic: str,
+        question_type: QuestionType,
+        difficulty: str = "medium",
+        num_options: int = 4,
+        context: Optional[str] = None,
+    ) -> str:
+        """Create a prompt for question generation"""
+        context_block = f"\n\nContext: {context}" if context else ""
+        return _PROMPT_TEMPLATES[question_type].format_map(
+            {
+                "topic": topic,
+                "difficulty": difficulty,
+                "num_options": num_options,
+                "context_block": context_block,
+            }
+        )
 
     @staticmethod
+    def _create_batch_prompt(
+        topic: str,
+        specs: Tuple[Tuple[QuestionType, int], ...],
+        difficulty: str = "medium",
+        context: Optional[str] = None,
+    ) -> str:
+        """Create a prompt asking for several questions in one response"""
+        lines = [f"Generate the following {len(specs)} {difficulty} difficulty questions about: {topic}"]
+        if context:
+            lines.append(f"\nContext: {context}")
+        lines.append("")
+
+        for i, (question_type, num_options) in enumerate(specs, 1):
+            guidance = _TYPE_GUIDANCE[question_type].format(num_options=num_options)
+            lines.append(f'{i}. A question of type "{question_type.value}". {guidance}')
+
+        lines.append("\nReturn the questions in this order, each with its requested type.")
+        return "\n".join(lines)
+
+    @classmethod
+    def _parse_batch_data(
+        cls, data: Dict[str, Any], time_limit: int
+    ) -> List[Optional[Question]]:
+        """Parse a batch response into Question objects"""
+        return [
+            cls._parse_question_data(item, QuestionType(item["type"]), time_limit)
+            for item in data["questions"]
+        ]
+
+    @classmethod
     def _parse_question_data(
+        cls,
         data: Dict[str, Any],
         question_type: QuestionType,
         time_limit: int,
     ) -> Optional[Question]:
         """Parse AI response data into Question objects"""
+        builder = cls._BUILDERS.get(question_type)
+        if builder is None:
+            return None
 
         try:
-            if question_type == QuestionType.MULTIPLE_CHOICE:
-                return MultipleChoiceQuestion(
-                    text=data["question"],
-                    options=data["options"],
-                    correct_answer=data["correct_answer"],
-                    explanation=data.get("explanation"),
-                    time_limit=time_limit,
-                )
-
-            elif question_type == QuestionType.TRUE_FALSE:
-                return TrueFalseQuestion(
-                    text=data["question"],
-                    correct_answer=data["correct_answer"],
-                    explanation=data.get("explanation"),
-                )
-
-            elif question_type == QuestionType.SHORT_TEXT:
-                return ShortTextQuestion(
-                    text=data["question"],
-                    correct_answer=data["correct_answer"],
-                    explanation=data.get("explanation"),
-                    time_limit=time_limit,
-                )
-
-            elif question_type == QuestionType.MULTIPLE_SELECT:
-                return MultipleSelectQuestion(
-                    text=data["question"],
-                    options=data["options"],
-                    correct_answers=data["correct_answers"],
-                    explanation=data.get("explanation"),
-                    time_limit=time_limit,
-                )
-
-            elif question_type == QuestionType.MATCHING:
-                return MatchingQuestion(
-                    text=data["question"],
-                    pairs=data["pairs"],
-                    explanation=data.get("explanation"),
-                    time_limit=time_limit,
-                )
-
+            return builder(data, time_limit)
         except (KeyError, TypeError, ValueError) as e:
             print(f"Error creating question from AI data: {e}")
             return None
-
-        return None
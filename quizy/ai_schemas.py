@@ -0,0 +1,113 @@
+"""
+Structured output schemas for AI question generation
+Each schema mirrors the question data read by AIQuestionGenerator._parse_question_data,
+so OpenAI returns JSON that is guaranteed to parse into the expected keys.
+"""
+
+from typing import Any, Dict, List, Literal, Union
+
+from pydantic import BaseModel
+
+from quizy.core import QuestionType
+
+
+class QuestionSchema(BaseModel):
+    """Base schema for a generated question"""
+
+    question: str
+    explanation: str
+
+    def to_question_data(self) -> Dict[str, Any]:
+        """Convert to the dictionary consumed by _parse_question_data"""
+        return self.model_dump()
+
+
+class MCSchema(QuestionSchema):
+    """Multiple choice question"""
+
+    options: List[str]
+    correct_answer: str
+
+
+class TFSchema(QuestionSchema):
+    """True/false statement"""
+
+    correct_answer: bool
+
+
+class STSchema(QuestionSchema):
+    """Short answer question"""
+
+    correct_answer: str
+    acceptable_variations: List[str]
+
+
+class MSSchema(QuestionSchema):
+    """Multiple select question"""
+
+    options: List[str]
+    correct_answers: List[str]
+
+
+class MatchPair(BaseModel):
+    """Single item/match pair"""
+
+    item: str
+    match: str
+
+
+class MatchSchema(QuestionSchema):
+    """Matching question (pairs as a list, since strict schemas have no free-form keys)"""
+
+    pairs: List[MatchPair]
+
+    def to_question_data(self) -> Dict[str, Any]:
+        """Convert to the dictionary consumed by _parse_question_data"""
+        data = self.model_dump()
+        data["pairs"] = {pair.item: pair.match for pair in self.pairs}
+        return data
+
+
+SCHEMA_FOR_TYPE = {
+    QuestionType.MULTIPLE_CHOICE: MCSchema,
+    QuestionType.TRUE_FALSE: TFSchema,
+    QuestionType.SHORT_TEXT: STSchema,
+    QuestionType.MULTIPLE_SELECT: MSSchema,
+    QuestionType.MATCHING: MatchSchema,
+}
+
+
+class MCItem(MCSchema):
+    """Multiple choice question in a batch"""
+
+    type: Literal["multiple_choice"]
+
+
+class TFItem(TFSchema):
+    """True/false statement in a batch"""
+
+    type: Literal["true_false"]
+
+
+class STItem(STSchema):
+    """Short answer question in a batch"""
+
+    type: Literal["short_text"]
+
+
+class MSItem(MSSchema):
+    """Multiple select question in a batch"""
+
+    type: Literal["multiple_select"]
+
+
+class MatchItem(MatchSchema):
+    """Matching question in a batch"""
+
+    type: Literal["matching"]
+
+
+class QuestionBatchSchema(BaseModel):
+    """Several generated questions returned by one request"""
+
+    questions: List[Union[MCItem, TFItem, STItem, MSItem, MatchItem]]
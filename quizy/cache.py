@@ -0,0 +1,203 @@
+"""
+Prompt cache for AI question generation - avoids repeat OpenAI round-trips
+Features:
+- Exact-match lookups keyed by a hash of the model and prompt
+- In-memory layer backed by a SQLite file that survives restarts
+- Optional embedding-similarity lookups for near-duplicate prompts
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from quizy._compat import json_dumps, json_loads, optional_numpy
+
+DEFAULT_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", str(Path.home() / ".cache"))) / "quizy"
+
+
+def _normalize(vector: Sequence[float]) -> List[float]:
+    """L2-normalize a vector so a dot product equals cosine similarity"""
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm == 0:
+        return list(vector)
+    return [v / norm for v in vector]
+
+
+class _VectorIndex:
+    """Normalized embeddings for one namespace, one row per key (caller holds the cache lock)"""
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.rows: Dict[str, int] = {}
+        # A numpy matrix when numpy is installed, otherwise a list of rows
+        self.matrix: Any = None if optional_numpy() is not None else []
+
+    def put(self, key: str, vector: List[float]) -> None:
+        """Add a vector for key, replacing the one already stored for it"""
+        np = optional_numpy()
+        row = self.rows.get(key)
+        if row is not None:
+            self.matrix[row] = vector
+            return
+
+        self.rows[key] = len(self.keys)
+        self.keys.append(key)
+        if np is None:
+            self.matrix.append(vector)
+        elif self.matrix is None:
+            self.matrix = np.asarray([vector], dtype=float)
+        else:
+            self.matrix = np.vstack([self.matrix, vector])
+
+    def discard(self, key: str) -> None:
+        """Remove the vector stored for key, if any"""
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        del self.keys[row]
+        np = optional_numpy()
+        if np is None:
+            del self.matrix[row]
+        else:
+            self.matrix = np.delete(self.matrix, row, axis=0)
+        self.rows = {k: i for i, k in enumerate(self.keys)}
+
+    def best(self, query: List[float]) -> Tuple[Optional[str], float]:
+        """Key of the most similar stored vector and its cosine similarity"""
+        if not self.keys:
+            return None, -1.0
+        np = optional_numpy()
+        if np is not None:
+            similarities = self.matrix @ np.asarray(query)
+            best = int(similarities.argmax())
+            return self.keys[best], float(similarities[best])
+        scores = [sum(a * b for a, b in zip(vector, query)) for vector in self.matrix]
+        best = max(range(len(scores)), key=scores.__getitem__)
+        return self.keys[best], scores[best]
+
+
+class PromptCache:
+    """In-memory + on-disk cache of AI responses keyed by prompt"""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            path: SQLite file to persist entries in (default: ~/.cache/quizy/prompts.sqlite3)
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_DIR / "prompts.sqlite3"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._vectors: Optional[Dict[str, _VectorIndex]] = None
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS prompts ("
+            "key TEXT PRIMARY KEY, namespace TEXT, data TEXT NOT NULL, embedding TEXT)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(prompt: str, model: str) -> str:
+        """Build the exact-match key for a prompt sent to a model"""
+        return hashlib.blake2b(f"{model}\0{prompt}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get cached response data for an exact key"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                return data
+
+            row = self._conn.execute("SELECT data FROM prompts WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            data = json_loads(row[0])
+            self._memory[key] = data
+            return data
+
+    def get_similar(
+        self,
+        embedding: Sequence[float],
+        namespace: str,
+        threshold: float = 0.95,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get cached response data for the most similar prompt embedding
+
+        Args:
+            embedding: Embedding of the prompt being looked up
+            namespace: Only entries stored under this namespace are considered
+            threshold: Minimum cosine similarity for a hit
+
+        Returns:
+            Cached data, or None if nothing is similar enough
+        """
+        query = _normalize(embedding)
+        with self._lock:
+            index = self._load_vectors().get(namespace)
+            if index is None:
+                return None
+            key, score = index.best(query)
+
+        if key is None or score < threshold:
+            return None
+        return self.get(key)
+
+    def set(
+        self,
+        key: str,
+        data: Dict[str, Any],
+        namespace: Optional[str] = None,
+        embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Store response data, optionally with an embedding for similarity lookups"""
+        vector = _normalize(embedding) if embedding is not None else None
+        with self._lock:
+            self._memory[key] = data
+            self._conn.execute(
+                "INSERT OR REPLACE INTO prompts (key, namespace, data, embedding) VALUES (?, ?, ?, ?)",
+                (key, namespace, json_dumps(data), json_dumps(vector) if vector else None),
+            )
+            self._conn.commit()
+
+            if self._vectors is not None:
+                # The row was replaced, so drop any vector stored for it under another namespace
+                for other, index in self._vectors.items():
+                    if vector is None or other != namespace:
+                        index.discard(key)
+                if vector is not None:
+                    self._vectors.setdefault(namespace, _VectorIndex()).put(key, vector)
+
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        with self._lock:
+            self._memory.clear()
+            self._vectors = None
+            self._conn.execute("DELETE FROM prompts")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM prompts").fetchone()[0]
+
+    def _load_vectors(self) -> Dict[str, _VectorIndex]:
+        """Load stored embeddings grouped by namespace (caller holds the lock)"""
+        if self._vectors is None:
+            self._vectors = {}
+            rows = self._conn.execute(
+                "SELECT key, namespace, embedding FROM prompts WHERE embedding IS NOT NULL"
+            )
+            for key, namespace, embedding in rows:
+                self._vectors.setdefault(namespace, _VectorIndex()).put(key, json_loads(embedding))
+        return self._vectors
@@ -1,8 +1,16 @@
+import io
+import os
+import re
 import sys
+import queue
+import select
 import time
+import asyncio
+import functools
 import threading
-from typing import Optional, Any, Callable, Coroutine
-from datetime import timedelta
+import contextvars
+from string import ascii_lowercase
+from typing import Optional, Any, Callable, Coroutine, Dict, Final, List, Tuple
 
 from .core import (
     Quiz,
@@ -16,49 +24,83 @@ from .core import (
 )
 
 
+@functools.lru_cache(maxsize=64)
+def _format_whole_seconds(seconds: int) -> str:
+    """MM:SS for a whole number of seconds"""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
 class TimerDisplay:
     """Displays and manages live countdown timer"""
 
     def __init__(self, duration: float):
+        self.reset(duration)
+
+    def reset(self, duration: float) -> None:
+        """Restart the countdown with a new duration"""
         self.duration = duration
-        self.start_time = time.time()
-        self.paused_time = 0.0
+        self._duration_ns = int(duration * 1e9)
+        # Absolute deadline on the monotonic nanosecond clock: each reading is
+        # one clock call and a subtraction, immune to wall-clock jumps
+        self._deadline_ns = time.monotonic_ns() + self._duration_ns
+        self._paused_remaining_ns = self._duration_ns
         self.is_paused = False
 
+    @property
+    def start_time(self) -> float:
+        """Wall-clock time the countdown started, shifted forward by time spent paused"""
+        return time.time() - self.get_elapsed()
+
+    @property
+    def paused_time(self) -> float:
+        """Elapsed seconds when the timer was last paused (0.0 if never paused)"""
+        return (self._duration_ns - self._paused_remaining_ns) / 1e9
+
+    def _remaining_ns(self) -> int:
+        """Get remaining time in nanoseconds (negative once expired)"""
+        if self.is_paused:
+            return self._paused_remaining_ns
+        return self._deadline_ns - time.monotonic_ns()
+
+    def _snapshot(self) -> Tuple[float, float]:
+        """Get (elapsed, remaining) seconds from a single clock read"""
+        remaining_ns = self._remaining_ns()
+        return (self._duration_ns - remaining_ns) / 1e9, max(0, remaining_ns) / 1e9
+
     def get_elapsed(self) -> float:
         """Get elapsed time in seconds"""
-        if self.is_paused:
-            return self.paused_time
-        return time.time() - self.start_time
+        return self._snapshot()[0]
 
     def get_remaining(self) -> float:
         """Get remaining time"""
-        return max(0.0, self.duration - self.get_elapsed())
+        return self._snapshot()[1]
 
     def pause(self) -> None:
         """Pause the timer"""
-        self.paused_time = self.get_elapsed()
+        self._paused_remaining_ns = self._remaining_ns()
         self.is_paused = True
 
     def resume(self) -> None:
         """Resume the timer"""
         if self.is_paused:
-            self.start_time = time.time() - self.paused_time
+            self._deadline_ns = time.monotonic_ns() + self._paused_remaining_ns
             self.is_paused = False
 
     def is_expired(self) -> bool:
         """Check if time is up"""
-        return self.get_remaining() <= 0
+        return self._remaining_ns() <= 0
 
-    def format_time(self, seconds: float) -> str:
+    @staticmethod
+    def format_time(seconds: float) -> str:
         """Format seconds as MM:SS"""
-        td = timedelta(seconds=int(seconds))
-        minutes, seconds = divmod(int(seconds), 60)
-        return f"{minutes:02d}:{seconds:02d}"
+        # Redraws within the same second reuse the cached string
+        return _format_whole_seconds(int(seconds))
 
-    def get_warning_symbol(self) -> str:
-        """Get visual indicator based on remaining time"""
-        remaining = self.get_remaining()
+    def get_warning_symbol(self, remaining: Optional[float] = None) -> str:
+        """Get visual indicator based on remaining time (read now if not given)"""
+        if remaining is None:
+            remaining = self.get_remaining()
         if remaining <= 10:
             return "⚠️ " if remaining > 0 else "❌"
         elif remaining <= 30:
@@ -67,22 +109,79 @@ class TimerDisplay:
             return "✓ "
 
 
+# ANSI sequences are only emitted to a terminal; piped or redirected output stays plain
+_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+# NO_COLOR turns off styling only, cursor control still works
+_USE_COLOR = _IS_TTY and "NO_COLOR" not in os.environ
+
+
+def _letter_label(index: int) -> str:
+    """0-based index to a spreadsheet-style label: a..z, then aa, ab, ..."""
+    if index < 26:
+        return ascii_lowercase[index]
+    label = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        label = ascii_lowercase[rem] + label
+    return label
+
+
+class _AsyncAnswer:
+    """Event loop serving stdin reads for one get_answer_async call"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self._lock = threading.Lock()
+        self._read = None
+        self._cancelled = False
+
+    def prompt(self, prompt: str, timer: Optional[TimerDisplay]) -> str:
+        """Read a line on the loop from the worker thread running get_answer"""
+        with self._lock:
+            if self._cancelled:
+                raise EOFError
+            self._read = asyncio.run_coroutine_threadsafe(
+                QuizCLI._prompt_input_async(prompt, timer), self.loop
+            )
+        return self._read.result()
+
+    def cancel(self) -> None:
+        """Stop the in-flight read so it can't consume the next answer"""
+        with self._lock:
+            self._cancelled = True
+            if self._read is not None:
+                self._read.cancel()
+
+
+# Set while get_answer runs on behalf of get_answer_async
+_async_answer: contextvars.ContextVar = contextvars.ContextVar("quizy_async_answer", default=None)
+
+
 class QuizCLI:
     """Enhanced CLI for interactive quiz sessions with live feedback"""
 
-    BOLD = "\033[1m"
-    GREEN = "\033[92m"
-    RED = "\033[91m"
-    YELLOW = "\033[93m"
-    BLUE = "\033[94m"
-    RESET = "\033[0m"
-    CLEAR_LINE = "\033[K"
+    BOLD = "\033[1m" if _USE_COLOR else ""
+    GREEN = "\033[92m" if _USE_COLOR else ""
+    RED = "\033[91m" if _USE_COLOR else ""
+    YELLOW = "\033[93m" if _USE_COLOR else ""
+    BLUE = "\033[94m" if _USE_COLOR else ""
+    RESET = "\033[0m" if _USE_COLOR else ""
+    CLEAR_LINE = "\033[K" if _IS_TTY else ""
+
+    # Decorative strings built once rather than on every display call
+    _HLINE: Final[str] = f"{BOLD}{BLUE}{'=' * 60}{RESET}"
+    _HEADER_TEMPLATE: Final[str] = f"\n{_HLINE}\n{BOLD}  {{}}{RESET}\n{_HLINE}\n"
+
+    # Option numbers: ASCII digits, no leading zero, so int() never raises
+    _DIGIT_RE = re.compile(r"[1-9][0-9]*")
+    # A well-formed multiple select answer, e.g. "1, 3"
+    _MULTI_RE = re.compile(r"\s*[1-9][0-9]*(?:\s*,\s*[1-9][0-9]*)*\s*")
 
     @staticmethod
     def format_header(text: str) -> str:
         """Format a header"""
-        width = 60
-        return f"\n{QuizCLI.BOLD}{QuizCLI.BLUE}{'=' * width}{QuizCLI.RESET}\n{QuizCLI.BOLD}  {text}{QuizCLI.RESET}\n{QuizCLI.BOLD}{QuizCLI.BLUE}{'=' * width}{QuizCLI.RESET}\n"
+        return QuizCLI._HEADER_TEMPLATE.format(text)
 
     @staticmethod
     def format_question_header(
@@ -102,35 +201,64 @@ class QuizCLI:
         timer: Optional[TimerDisplay] = None,
     ) -> None:
         """Display a question with appropriate format for its type"""
+        # One write instead of a print per line
+        sys.stdout.write(QuizCLI.render_question(question, question_num, total_questions))
+
+    @staticmethod
+    def render_question(question: Question, question_num: int, total_questions: int) -> str:
+        """Format a question for display without writing it"""
         header = QuizCLI.format_question_header(
             question_num, total_questions, question.time_limit
         )
-        print(header)
-        print(f"{QuizCLI.BOLD}{question.text}{QuizCLI.RESET}\n")
+        lines = [header, f"{QuizCLI.BOLD}{question.text}{QuizCLI.RESET}\n"]
 
-        if isinstance(question, (MultipleChoiceQuestion, MultipleSelectQuestion)):
-            for idx, opt in enumerate(question.display_options, 1):
-                print(f"  {QuizCLI.BLUE}{idx}.{QuizCLI.RESET} {opt}")
+        display_lines = _dispatch(_DISPLAYERS, type(question))
+        if display_lines is not None:
+            lines.extend(display_lines(question))
 
-        elif isinstance(question, TrueFalseQuestion):
-            print(f"  {QuizCLI.BLUE}1.{QuizCLI.RESET} True")
-            print(f"  {QuizCLI.BLUE}2.{QuizCLI.RESET} False")
+        return "\n".join(lines) + "\n"
 
-        elif isinstance(question, MatchingQuestion):
-            print(f"{QuizCLI.BOLD}Left side (prompts):{QuizCLI.RESET}")
-            for i, prompt in enumerate(question.prompts, 1):
-                print(f"  {QuizCLI.BLUE}{i}.{QuizCLI.RESET} {prompt}")
+    @staticmethod
+    def _choice_lines(question: Question) -> List[str]:
+        """Option lines for multiple choice and multiple select"""
+        return [
+            f"  {QuizCLI.BLUE}{idx}.{QuizCLI.RESET} {opt}"
+            for idx, opt in enumerate(question.display_options, 1)
+        ]
 
-            print(f"\n{QuizCLI.BOLD}Right side (options):{QuizCLI.RESET}")
-            for j, answer in enumerate(question.display_answers, 1):
-                print(f"  {QuizCLI.BLUE}{chr(96+j)}.{QuizCLI.RESET} {answer}")
+    @staticmethod
+    def _true_false_lines(question: Question) -> List[str]:
+        """Option lines for true/false"""
+        return [
+            f"  {QuizCLI.BLUE}1.{QuizCLI.RESET} True",
+            f"  {QuizCLI.BLUE}2.{QuizCLI.RESET} False",
+        ]
 
-        elif isinstance(question, ShortTextQuestion):
-            print(f"{QuizCLI.BLUE}Answer type:{QuizCLI.RESET} Text input")
-            if question.accepted_variations:
-                print(
-                    f"{QuizCLI.BLUE}Accepted variations:{QuizCLI.RESET} {', '.join(question.accepted_variations)}"
-                )
+    @staticmethod
+    def _matching_lines(question: MatchingQuestion) -> List[str]:
+        """Prompt and option columns for matching"""
+        lines = [f"{QuizCLI.BOLD}Left side (prompts):{QuizCLI.RESET}"]
+        lines.extend(
+            f"  {QuizCLI.BLUE}{i}.{QuizCLI.RESET} {prompt}"
+            for i, prompt in enumerate(question.prompts, 1)
+        )
+
+        lines.append(f"\n{QuizCLI.BOLD}Right side (options):{QuizCLI.RESET}")
+        lines.extend(
+            f"  {QuizCLI.BLUE}{_letter_label(j)}.{QuizCLI.RESET} {answer}"
+            for j, answer in enumerate(question.display_answers)
+        )
+        return lines
+
+    @staticmethod
+    def _text_lines(question: ShortTextQuestion) -> List[str]:
+        """Answer hint lines for short text"""
+        lines = [f"{QuizCLI.BLUE}Answer type:{QuizCLI.RESET} Text input"]
+        if question.accepted_variations:
+            lines.append(
+                f"{QuizCLI.BLUE}Accepted variations:{QuizCLI.RESET} {', '.join(question.accepted_variations)}"
+            )
+        return lines
 
     @staticmethod
     def get_answer(
@@ -142,46 +270,190 @@ class QuizCLI:
         skip_help = " (or press Enter to skip)" if allow_skip else ""
 
         try:
-            if isinstance(question, (MultipleChoiceQuestion, MultipleSelectQuestion)):
-                return QuizCLI._get_choice_answer(
-                    question, allow_skip, skip_help, timer
-                )
-            elif isinstance(question, TrueFalseQuestion):
-                return QuizCLI._get_true_false_answer(allow_skip, skip_help, timer)
-            elif isinstance(question, MatchingQuestion):
-                return QuizCLI._get_matching_answer(
-                    question, allow_skip, skip_help, timer
-                )
-            elif isinstance(question, ShortTextQuestion):
-                return QuizCLI._get_text_answer(allow_skip, skip_help, timer)
-            else:
-                answer = QuizCLI._prompt_input(f"Your answer{skip_help}: ", timer)
-                if not answer and allow_skip:
-                    return None
-                return answer
+            get_typed_answer = _dispatch(_ANSWER_GETTERS, type(question))
+            if get_typed_answer is not None:
+                return get_typed_answer(question, allow_skip, skip_help, timer)
+
+            answer = QuizCLI._prompt_input(f"Your answer{skip_help}: ", timer)
+            if not answer and allow_skip:
+                return None
+            return answer
 
-        except (KeyboardInterrupt, EOFError):
+        except (KeyboardInterrupt, EOFError, TimeoutError):
             return None
 
+    @staticmethod
+    async def get_answer_async(
+        question: Question,
+        allow_skip: bool = False,
+        timer: Optional[TimerDisplay] = None,
+    ) -> Optional[Any]:
+        """Get user answer, reading stdin on the event loop so the timer is enforced"""
+        loop = asyncio.get_running_loop()
+        session = _AsyncAnswer(loop)
+        ctx = contextvars.copy_context()
+        ctx.run(_async_answer.set, session)
+        # Answer validation stays synchronous; every line it asks for is read by the loop
+        try:
+            return await loop.run_in_executor(
+                None, ctx.run, QuizCLI.get_answer, question, allow_skip, timer
+            )
+        except asyncio.CancelledError:
+            # Quiz.execute_async timed the question out
+            session.cancel()
+            raise
+
     @staticmethod
     def _prompt_input(prompt: str, timer: Optional[TimerDisplay] = None) -> str:
         """Get input with optional timer display and live refresh"""
+        session = _async_answer.get()
+        if session is not None:
+            return session.prompt(prompt, timer)
         if timer:
             return QuizCLI._prompt_input_with_timer(prompt, timer)
-        return input(f"\n{prompt}").strip()
+        return QuizCLI._read_line(f"\n{prompt}").strip()
+
+    @staticmethod
+    def _read_line(prompt: str) -> str:
+        """Write the prompt and read one line of input"""
+        if sys.stdin.isatty() and "readline" in sys.modules:
+            # Keep input() for terminals with GNU readline loaded so line editing works
+            return input(prompt)
+
+        # Piped/scripted stdin, or a terminal without readline's editing:
+        # skip input()'s wrapper and read directly
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
+
+    @staticmethod
+    async def _prompt_input_async(prompt: str, timer: Optional[TimerDisplay] = None) -> str:
+        """Read one line on the event loop, raising TimeoutError when the timer runs out"""
+        read = QuizCLI._read_line_async()
+        if read is None:
+            # stdin can't be watched by the loop (regular file, StringIO, Windows)
+            read = asyncio.get_running_loop().run_in_executor(None, sys.stdin.readline)
+
+        if timer is None:
+            sys.stdout.write(f"\n{prompt}")
+            sys.stdout.flush()
+            line = await read
+        else:
+            sys.stdout.write(f"\n{QuizCLI._timer_line(timer)}\n{prompt}")
+            sys.stdout.flush()
+            refresh = asyncio.ensure_future(QuizCLI._refresh_timer(timer))
+            try:
+                line = await asyncio.wait_for(read, timeout=timer.get_remaining())
+            except asyncio.TimeoutError:
+                sys.stdout.write(f"\n{QuizCLI.RED}Time's up!{QuizCLI.RESET}\n")
+                raise TimeoutError from None
+            finally:
+                refresh.cancel()
+
+        if not line:
+            raise EOFError
+        if isinstance(line, bytes):
+            line = line.decode(sys.stdin.encoding or "utf-8", errors="replace")
+        return line.strip()
+
+    @staticmethod
+    def _read_line_async() -> Optional[asyncio.Future]:
+        """Future for one line of stdin read by the running loop (None if unsupported)"""
+        loop = asyncio.get_running_loop()
+        try:
+            fd = sys.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+        line = loop.create_future()
+        buf = bytearray()
+
+        def on_readable() -> None:
+            # One byte per wakeup: a readable fd can't block on it, stdin stays in
+            # blocking mode, and nothing past the newline is taken from the next read
+            try:
+                chunk = os.read(fd, 1)
+            except OSError as exc:
+                if not line.done():
+                    line.set_exception(exc)
+                return
+            buf.extend(chunk)
+            if (not chunk or chunk == b"\n") and not line.done():
+                line.set_result(bytes(buf))
+
+        try:
+            loop.add_reader(fd, on_readable)
+        except (NotImplementedError, OSError, ValueError):
+            return None
+        # Stop watching stdin once the line arrives or the read is cancelled/timed out
+        line.add_done_callback(lambda _: loop.remove_reader(fd))
+        return line
+
+    @staticmethod
+    def _timer_line(timer: TimerDisplay) -> str:
+        """Format the countdown line shown above a timed prompt"""
+        remaining = timer.get_remaining()
+        return f"{timer.get_warning_symbol(remaining)} Time remaining: {timer.format_time(remaining)}"
+
+    @staticmethod
+    async def _refresh_timer(timer: TimerDisplay) -> None:
+        """Redraw the countdown line above the prompt each time the second changes"""
+        if not sys.stdout.isatty():
+            # Cursor movement is meaningless in a pipe or file
+            return
+        while True:
+            # Wake exactly when MM:SS changes; polling faster would redraw identical text
+            await asyncio.sleep(timer.get_remaining() % 1 or 1)
+            # Save cursor, rewrite the line above the prompt, restore cursor
+            sys.stdout.write(
+                f"\0337\033[F{QuizCLI.CLEAR_LINE}{QuizCLI._timer_line(timer)}\0338"
+            )
+            sys.stdout.flush()
+            if timer.is_expired():
+                return
+
+    @staticmethod
+    def _prompt_yesno(prompt: str, timeout: float = 30) -> bool:
+        """Ask a y/n question; no answer within timeout counts as no"""
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+
+        if not sys.stdin.isatty():
+            # Piped answers may already sit in stdin's buffer where select can't see them
+            line = sys.stdin.readline()
+        else:
+            try:
+                ready, _, _ = select.select([sys.stdin], [], [], timeout)
+                line = sys.stdin.readline() if ready else ""
+            except (OSError, ValueError):
+                # Console handles can't be polled on Windows: wait on a thread
+                answers = queue.Queue()
+                threading.Thread(
+                    target=lambda: answers.put(sys.stdin.readline()), daemon=True
+                ).start()
+                try:
+                    line = answers.get(timeout=timeout)
+                except queue.Empty:
+                    line = ""
+
+        if not line.endswith("\n"):
+            # Timed out or hit EOF mid-prompt: end the prompt line
+            sys.stdout.write("\n")
+        return line.strip().lower() == "y"
 
     @staticmethod
     def _prompt_input_with_timer(prompt: str, timer: TimerDisplay) -> str:
         """Get input with live timer refresh in background"""
-        import queue
-
         input_queue = queue.Queue()
         stop_timer = threading.Event()
         timer_started = False
 
         def input_thread():
             try:
-                user_input = input(f"\n{prompt}")
+                user_input = QuizCLI._read_line(f"\n{prompt}")
                 input_queue.put(user_input)
             finally:
                 stop_timer.set()
@@ -191,10 +463,11 @@ class QuizCLI:
             last_remaining = None
 
             while not stop_timer.is_set():
+                # One clock read per tick, shared by the redraw and expiry check
                 remaining = timer.get_remaining()
                 if int(remaining) != int(last_remaining or remaining):
                     last_remaining = remaining
-                    warning = timer.get_warning_symbol()
+                    warning = timer.get_warning_symbol(remaining)
                     time_str = timer.format_time(remaining)
 
                     if timer_started:
@@ -205,11 +478,12 @@ class QuizCLI:
                     sys.stdout.write(f"{warning} Time remaining: {time_str}\n")
                     sys.stdout.flush()
 
-                if timer.is_expired():
+                if remaining <= 0:
                     stop_timer.set()
                     break
 
-                time.sleep(0.05)
+                # Sleep until the displayed second changes, waking early on input
+                stop_timer.wait(remaining % 1 or 1)
 
         input_t = threading.Thread(target=input_thread, daemon=True)
         timer_t = threading.Thread(target=timer_refresh_thread, daemon=True)
@@ -227,6 +501,16 @@ class QuizCLI:
             stop_timer.set()
             return ""
 
+    @staticmethod
+    def _option_index(text: str) -> Optional[int]:
+        """Convert a 1-based option number to a 0-based index (None if not a number)"""
+        # Nearly every answer is a single digit: compare characters, skip the regex
+        if len(text) == 1:
+            return ord(text) - 49 if "1" <= text <= "9" else None
+        if QuizCLI._DIGIT_RE.fullmatch(text):
+            return int(text) - 1
+        return None
+
     @staticmethod
     def _get_choice_answer(
         question: Question,
@@ -240,46 +524,48 @@ class QuizCLI:
         prompt_text = f"Enter option number(s) 1-{max_option}{skip_help}: "
 
         while True:
-            try:
-                answer_input = QuizCLI._prompt_input(prompt_text, timer)
+            answer_input = QuizCLI._prompt_input(prompt_text, timer)
 
-                if not answer_input:
-                    if allow_skip:
-                        return None
-                    print(
-                        f"{QuizCLI.YELLOW}Please enter a number between 1 and {max_option}{QuizCLI.RESET}"
-                    )
-                    continue
+            if not answer_input:
+                if allow_skip:
+                    return None
+                print(
+                    f"{QuizCLI.YELLOW}Please enter a number between 1 and {max_option}{QuizCLI.RESET}"
+                )
+                continue
 
-                if is_multiple:
-                    selections = [s.strip() for s in answer_input.split(",")]
-                    indices = []
-
-                    for sel in selections:
-                        try:
-                            idx = int(sel) - 1
-                            if 0 <= idx < max_option:
-                                indices.append(idx)
-                            else:
-                                print(
-                                    f"{QuizCLI.RED}Option {idx + 1} out of range{QuizCLI.RESET}"
-                                )
-                        except ValueError:
-                            print(f"{QuizCLI.RED}Invalid number: {sel}{QuizCLI.RESET}")
-
-                    if indices:
+            if is_multiple:
+                if QuizCLI._MULTI_RE.fullmatch(answer_input):
+                    # Every token is a valid number, only the range is left to check
+                    indices = [int(sel) - 1 for sel in answer_input.split(",")]
+                    if all(idx < max_option for idx in indices):
                         return [question.display_options[i] for i in indices]
-                else:
-                    answer_idx = int(answer_input) - 1
-                    if 0 <= answer_idx < max_option:
-                        return question.display_options[answer_idx]
+
+                selections = [s.strip() for s in answer_input.split(",")]
+                indices = []
+
+                for sel in selections:
+                    idx = QuizCLI._option_index(sel)
+                    if idx is None:
+                        print(f"{QuizCLI.RED}Invalid number: {sel}{QuizCLI.RESET}")
+                        continue
+                    if idx < max_option:
+                        indices.append(idx)
                     else:
                         print(
-                            f"{QuizCLI.YELLOW}Please enter 1-{max_option}{QuizCLI.RESET}"
+                            f"{QuizCLI.RED}Option {idx + 1} out of range{QuizCLI.RESET}"
                         )
 
-            except ValueError:
-                print(f"{QuizCLI.RED}Invalid input{QuizCLI.RESET}")
+                if indices:
+                    return [question.display_options[i] for i in indices]
+            else:
+                answer_idx = QuizCLI._option_index(answer_input)
+                if answer_idx is None:
+                    print(f"{QuizCLI.RED}Invalid input{QuizCLI.RESET}")
+                    continue
+                if answer_idx < max_option:
+                    return question.display_options[answer_idx]
+                print(f"{QuizCLI.YELLOW}Please enter 1-{max_option}{QuizCLI.RESET}")
 
     @staticmethod
     def _get_true_false_answer(
@@ -320,42 +606,50 @@ class QuizCLI:
         timer: Optional[TimerDisplay] = None,
     ) -> Optional[dict]:
         """Get answer for matching questions"""
-        matches = {}
+        # One slot per prompt; the dict is built once at the end
+        chosen: List[Optional[str]] = [None] * len(question.prompts)
 
         print(
             f"\n{QuizCLI.BOLD}Match each item on the left with one on the right:{QuizCLI.RESET}"
         )
 
-        for prompt in question.prompts:
-            print(
-                f"\n{QuizCLI.BLUE}{prompt}{QuizCLI.RESET} {'matches with' if not question.metadata.get('prompt_key') else question.metadata.get('prompt_key')}:"
-            )
-            for idx, answer in enumerate(question.display_answers, 1):
-                print(f"  {QuizCLI.BLUE}{idx}.{QuizCLI.RESET} {answer}")
+        # Same options and prompt under every item, so render them once
+        relation = question.metadata.get("prompt_key") or "matches with"
+        option_lines = "\n".join(
+            f"  {QuizCLI.BLUE}{idx}.{QuizCLI.RESET} {answer}"
+            for idx, answer in enumerate(question.display_answers, 1)
+        )
+        prompt_text = f"Match with (1-{len(question.display_answers)}){' or skip' if allow_skip else ''}: "
 
-            prompt_text = f"Match with (1-{len(question.display_answers)}){' or skip' if allow_skip else ''}: "
+        for i, prompt in enumerate(question.prompts):
+            sys.stdout.write(
+                f"\n{QuizCLI.BLUE}{prompt}{QuizCLI.RESET} {relation}:\n{option_lines}\n"
+            )
 
             while True:
-                try:
-                    answer_input = QuizCLI._prompt_input(prompt_text, timer)
-
-                    if not answer_input:
-                        if allow_skip:
-                            break
-                        continue
+                answer_input = QuizCLI._prompt_input(prompt_text, timer)
 
-                    idx = int(answer_input) - 1
-                    if 0 <= idx < len(question.display_answers):
-                        matches[prompt] = question.display_answers[idx]
+                if not answer_input:
+                    if allow_skip:
                         break
-                    else:
-                        print(
-                            f"{QuizCLI.YELLOW}Select 1-{len(question.display_answers)}{QuizCLI.RESET}"
-                        )
+                    continue
 
-                except ValueError:
+                idx = QuizCLI._option_index(answer_input)
+                if idx is None:
                     print(f"{QuizCLI.RED}Invalid number{QuizCLI.RESET}")
+                    continue
+                if idx < len(question.display_answers):
+                    chosen[i] = question.display_answers[idx]
+                    break
+                print(
+                    f"{QuizCLI.YELLOW}Select 1-{len(question.display_answers)}{QuizCLI.RESET}"
+                )
 
+        matches = {
+            prompt: answer
+            for prompt, answer in zip(question.prompts, chosen)
+            if answer is not None
+        }
         return matches if matches else (None if allow_skip else {})
 
     @staticmethod
@@ -367,71 +661,67 @@ class QuizCLI:
         """Get answer for short text questions"""
         prompt_text = f"Your answer{skip_help}: "
 
-        try:
-            answer = QuizCLI._prompt_input(prompt_text, timer)
+        while True:
+            try:
+                answer = QuizCLI._prompt_input(prompt_text, timer)
 
-            if not answer:
+                if answer:
+                    return answer
                 if allow_skip:
                     return None
                 print(f"{QuizCLI.YELLOW}Please enter an answer{QuizCLI.RESET}")
-                return QuizCLI._get_text_answer(allow_skip, skip_help, timer)
 
-            return answer
-
-        except (ValueError, KeyError):
-            print(f"{QuizCLI.RED}Invalid input{QuizCLI.RESET}")
-            return QuizCLI._get_text_answer(allow_skip, skip_help, timer)
+            except (ValueError, KeyError):
+                print(f"{QuizCLI.RED}Invalid input{QuizCLI.RESET}")
 
     @staticmethod
     def display_result(result) -> None:
         """Display quiz result summary"""
-        print(QuizCLI.format_header(f"Quiz Results - {result.title}"))
-
-        print(f"{QuizCLI.BOLD}Overall Performance:{QuizCLI.RESET}")
-        print(f"  Total Questions:     {result.total_questions}")
-        print(
-            f"  Correct Answers:     {QuizCLI.GREEN}{result.correct_answers}{QuizCLI.RESET}"
-        )
-        print(
+        lines = [
+            QuizCLI.format_header(f"Quiz Results - {result.title}"),
+            f"{QuizCLI.BOLD}Overall Performance:{QuizCLI.RESET}",
+            f"  Total Questions:     {result.total_questions}",
+            f"  Correct Answers:     {QuizCLI.GREEN}{result.correct_answers}{QuizCLI.RESET}",
             f"  Partial Answers:     {QuizCLI.YELLOW}{result.partial_answers}{QuizCLI.RESET}"
             if result.partial_answers > 0
-            else ""
-        )
-        print(
-            f"  Score:               {QuizCLI._format_score(result.score_percentage)}"
-        )
-        print(
-            f"  Time Taken:          {QuizCLI._format_time_duration(result.time_taken)}"
-        )
-        print(f"  Avg Time/Question:   {result.average_time_per_question:.1f}s")
+            else "",
+            f"  Score:               {QuizCLI._format_score(result.score_percentage)}",
+            f"  Time Taken:          {QuizCLI._format_time_duration(result.time_taken)}",
+            f"  Avg Time/Question:   {result.average_time_per_question:.1f}s",
+        ]
 
         if result.skipped_count > 0:
-            print(
+            lines.append(
                 f"  Skipped:             {QuizCLI.YELLOW}{result.skipped_count}{QuizCLI.RESET}"
             )
         if result.timeout_count > 0:
-            print(
+            lines.append(
                 f"  Timeout:             {QuizCLI.RED}{result.timeout_count}{QuizCLI.RESET}"
             )
 
-        print(f"\n{QuizCLI.BOLD}{QuizCLI.BLUE}{'=' * 60}{QuizCLI.RESET}\n")
+        lines.append(f"\n{QuizCLI._HLINE}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     @staticmethod
     def display_detailed_results(result) -> None:
         """Display detailed results for each question"""
-        print(QuizCLI.format_header("Detailed Results"))
+        out = io.StringIO()
+        out.write(QuizCLI.format_header("Detailed Results") + "\n")
 
         for res in result.question_results:
-            status_icon = QuizCLI._get_status_icon(res.status)
-            print(
-                f"{status_icon} Question {res.question_index + 1}: {QuizCLI._format_status(res.status)}"
+            status_icon, status_label = _STATUS_DISPLAY[res.status]
+            out.write(
+                f"{status_icon} Question {res.question_index + 1}: {status_label}\n"
             )
-            print(f"   Your Answer:     {res.user_answer}")
-            print(f"   Correct Answer:  {res.correct_answer}")
-            print(f"   Time Taken:      {res.time_taken:.2f}s")
+            out.write(f"   Your Answer:     {res.user_answer}\n")
+            out.write(f"   Correct Answer:  {res.correct_answer}\n")
+            out.write(f"   Time Taken:      {res.time_taken:.2f}s\n")
             if res.score < 1.0:
-                print(f"   Score:           {res.score * 100:.0f}%")
-            print()
+                out.write(f"   Score:           {res.score * 100:.0f}%\n")
+            out.write("\n")
+
+        sys.stdout.write(out.getvalue())
 
     @staticmethod
     def run_interactive(quiz: Quiz, show_timer: bool = True) -> None:
@@ -455,18 +745,17 @@ class QuizCLI:
                 else None
             )
 
-            def question_callback(q: Question, idx: int, total: int) -> None:
-                """Display question before answering"""
-                QuizCLI.display_question(
-                    q, idx, total, quiz_timer if show_timer else None
-                )
+            # One countdown reused for every question
+            question_timer = TimerDisplay(0.0) if show_timer else None
+
+            # Display question before answering
+            question_callback = functools.partial(QuizCLI.display_question, timer=quiz_timer)
 
             def answer_provider(q: Question, idx: int) -> Optional[Any]:
                 """Get answer from user"""
-                question_timer = (
-                    TimerDisplay(q.time_limit) if q.time_limit and show_timer else None
+                return QuizCLI.get_answer(
+                    q, quiz.allow_skip, QuizCLI._restart_timer(question_timer, q)
                 )
-                return QuizCLI.get_answer(q, quiz.allow_skip, question_timer)
 
             result = quiz.execute(
                 answer_provider=answer_provider,
@@ -476,16 +765,25 @@ class QuizCLI:
             QuizCLI.display_result(result)
 
             try:
-                show_detail = input("Show detailed results? (y/n): ").strip().lower()
-                if show_detail == "y":
+                if QuizCLI._prompt_yesno("Show detailed results? (y/n): "):
                     QuizCLI.display_detailed_results(result)
-            except (EOFError, KeyboardInterrupt):
+            except KeyboardInterrupt:
                 pass
 
         except KeyboardInterrupt:
             print(f"\n\n{QuizCLI.YELLOW}Quiz interrupted!{QuizCLI.RESET}")
             sys.exit(0)
 
+    @staticmethod
+    def _restart_timer(
+        timer: Optional[TimerDisplay], question: Question
+    ) -> Optional[TimerDisplay]:
+        """Reset the shared question timer, or None if the question is untimed"""
+        if timer is None or not question.time_limit:
+            return None
+        timer.reset(question.time_limit)
+        return timer
+
     @staticmethod
     async def run_interactive_async(quiz: Quiz, show_timer: bool = True) -> None:
         """
@@ -508,18 +806,39 @@ class QuizCLI:
                 else None
             )
 
+            # One countdown reused for every question
+            question_timer = TimerDisplay(0.0) if show_timer else None
+
+            # Question N+1 is formatted while the user is still answering question N
+            next_key: Optional[Tuple[int, int]] = None
+            next_render: Optional[asyncio.Future] = None
+
+            async def render(q: Question, idx: int, total: int) -> str:
+                return QuizCLI.render_question(q, idx, total)
+
             async def question_callback(q: Question, idx: int, total: int) -> None:
                 """Display question before answering"""
-                QuizCLI.display_question(
-                    q, idx, total, quiz_timer if show_timer else None
-                )
+                nonlocal next_key, next_render
+                if next_render is not None and next_key == (id(q), idx):
+                    text = await next_render
+                else:
+                    if next_render is not None:
+                        next_render.cancel()
+                    text = QuizCLI.render_question(q, idx, total)
+                sys.stdout.write(text)
+
+                # The next question is only known up front when the order is fixed
+                next_key = next_render = None
+                if not quiz.randomize_order and idx < total:
+                    next_q = quiz.questions[idx]
+                    next_key = (id(next_q), idx + 1)
+                    next_render = asyncio.ensure_future(render(next_q, idx + 1, total))
 
             async def answer_provider(q: Question, idx: int) -> Optional[Any]:
                 """Get answer asynchronously"""
-                question_timer = (
-                    TimerDisplay(q.time_limit) if q.time_limit and show_timer else None
+                return await QuizCLI.get_answer_async(
+                    q, quiz.allow_skip, QuizCLI._restart_timer(question_timer, q)
                 )
-                return QuizCLI.get_answer(q, quiz.allow_skip, question_timer)
 
             result = await quiz.execute_async(
                 answer_provider=answer_provider,
@@ -558,24 +877,62 @@ class QuizCLI:
     @staticmethod
     def _format_status(status: ResultStatus) -> str:
         """Format status with color"""
-        status_text = status.value.upper()
-        if status == ResultStatus.CORRECT:
-            return f"{QuizCLI.GREEN}{status_text}{QuizCLI.RESET}"
-        elif status == ResultStatus.PARTIAL:
-            return f"{QuizCLI.YELLOW}{status_text}{QuizCLI.RESET}"
-        elif status == ResultStatus.TIMEOUT:
-            return f"{QuizCLI.RED}{status_text}{QuizCLI.RESET}"
-        else:
-            return status_text
+        return _STATUS_DISPLAY[status][1]
 
     @staticmethod
     def _get_status_icon(status: ResultStatus) -> str:
         """Get icon for status"""
-        icons = {
-            ResultStatus.CORRECT: f"{QuizCLI.GREEN}✓{QuizCLI.RESET}",
-            ResultStatus.INCORRECT: f"{QuizCLI.RED}✗{QuizCLI.RESET}",
-            ResultStatus.PARTIAL: f"{QuizCLI.YELLOW}◐{QuizCLI.RESET}",
-            ResultStatus.TIMEOUT: f"{QuizCLI.RED}⏱{QuizCLI.RESET}",
-            ResultStatus.SKIPPED: f"{QuizCLI.YELLOW}⊘{QuizCLI.RESET}",
-        }
-        return icons.get(status, "?")
+        display = _STATUS_DISPLAY.get(status)
+        return display[0] if display else "?"
+
+
+# (icon, label) per status, precomputed so result listings do a single lookup
+_STATUS_DISPLAY = {
+    ResultStatus.CORRECT: (
+        f"{QuizCLI.GREEN}✓{QuizCLI.RESET}",
+        f"{QuizCLI.GREEN}CORRECT{QuizCLI.RESET}",
+    ),
+    ResultStatus.INCORRECT: (f"{QuizCLI.RED}✗{QuizCLI.RESET}", "INCORRECT"),
+    ResultStatus.PARTIAL: (
+        f"{QuizCLI.YELLOW}◐{QuizCLI.RESET}",
+        f"{QuizCLI.YELLOW}PARTIAL{QuizCLI.RESET}",
+    ),
+    ResultStatus.TIMEOUT: (
+        f"{QuizCLI.RED}⏱{QuizCLI.RESET}",
+        f"{QuizCLI.RED}TIMEOUT{QuizCLI.RESET}",
+    ),
+    ResultStatus.SKIPPED: (f"{QuizCLI.YELLOW}⊘{QuizCLI.RESET}", "SKIPPED"),
+}
+
+
+def _dispatch(table: Dict[type, Callable], cls: type) -> Optional[Callable]:
+    """Look up the handler for a question class, caching subclasses on first use"""
+    try:
+        return table[cls]
+    except KeyError:
+        handler = next((h for base, h in table.items() if issubclass(cls, base)), None)
+        table[cls] = handler
+        return handler
+
+
+# Per-type handlers, so each question costs one dict lookup instead of an isinstance chain
+_DISPLAYERS: Dict[type, Callable[[Question], List[str]]] = {
+    MultipleChoiceQuestion: QuizCLI._choice_lines,
+    MultipleSelectQuestion: QuizCLI._choice_lines,
+    TrueFalseQuestion: QuizCLI._true_false_lines,
+    MatchingQuestion: QuizCLI._matching_lines,
+    ShortTextQuestion: QuizCLI._text_lines,
+}
+
+# (question, allow_skip, skip_help, timer) -> answer
+_ANSWER_GETTERS: Dict[type, Callable[..., Optional[Any]]] = {
+    MultipleChoiceQuestion: QuizCLI._get_choice_answer,
+    MultipleSelectQuestion: QuizCLI._get_choice_answer,
+    TrueFalseQuestion: lambda q, allow_skip, skip_help, timer: QuizCLI._get_true_false_answer(
+        allow_skip, skip_help, timer
+    ),
+    MatchingQuestion: QuizCLI._get_matching_answer,
+    ShortTextQuestion: lambda q, allow_skip, skip_help, timer: QuizCLI._get_text_answer(
+        allow_skip, skip_help, timer
+    ),
+}
@@ -9,12 +9,34 @@ Improvements:
 """
 
 import asyncio
+import sys
 import time
 import random
 from enum import Enum
-from typing import List, Optional, Callable, Dict, Any, Tuple, Union, Coroutine
+from typing import (
+    List,
+    Optional,
+    Callable,
+    ClassVar,
+    Dict,
+    Any,
+    Tuple,
+    Union,
+    Coroutine,
+    Awaitable,
+    Iterator,
+    Sequence,
+)
 from dataclasses import dataclass, field
 
+from ._compat import json_dumps, optional_numpy
+
+# Python 3.11+ deadline that times out the current task instead of wrapping it in a new one
+_asyncio_timeout = getattr(asyncio, "timeout", None)
+
+# Result dataclasses drop their per-instance __dict__ where dataclass supports slots (3.10+)
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ResultStatus(Enum):
     """Status of a quiz result"""
@@ -26,7 +48,7 @@ class ResultStatus(Enum):
     PARTIAL = "partial"  # New: for partial credit
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class QuestionResult:
     """Result of answering a single question"""
 
@@ -37,29 +59,51 @@ class QuestionResult:
     time_taken: float
     score: float = 1.0  # New: support partial credit (0.0 to 1.0)
 
+    # Column order of to_record()
+    RECORD_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "question_index",
+        "user_answer",
+        "correct_answer",
+        "status",
+        "time_taken",
+        "score",
+    )
+
     @property
     def is_correct(self) -> bool:
         """Check if answer was correct"""
-        return self.status == ResultStatus.CORRECT
+        return self.status is ResultStatus.CORRECT
 
     @property
     def is_partial(self) -> bool:
         """Check if answer was partially correct"""
-        return self.status == ResultStatus.PARTIAL
+        return self.status is ResultStatus.PARTIAL
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
+        # _value_ is a plain attribute, Enum.value goes through a Python-level descriptor
         return {
             "question_index": self.question_index,
             "user_answer": str(self.user_answer),
             "correct_answer": str(self.correct_answer),
-            "status": self.status.value,
+            "status": self.status._value_,
             "time_taken": self.time_taken,
             "score": self.score,
         }
 
+    def to_record(self) -> Tuple[Any, ...]:
+        """Convert to a tuple with the same values as to_dict, ordered as RECORD_FIELDS"""
+        return (
+            self.question_index,
+            str(self.user_answer),
+            str(self.correct_answer),
+            self.status._value_,
+            self.time_taken,
+            self.score,
+        )
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class QuizResult:
     """Complete quiz result with enhanced metrics"""
 
@@ -70,23 +114,37 @@ class QuizResult:
     question_results: List[QuestionResult] = field(default_factory=list)
     partial_answers: int = 0
 
+    def _tally(self) -> Tuple[float, int, int]:
+        """Get (total score, skipped, timeouts) in one pass over the current results"""
+        total_score = 0.0
+        skipped = timeouts = 0
+        # Enum members are singletons, so identity tests avoid Enum.__eq__ dispatch
+        skipped_status, timeout_status = ResultStatus.SKIPPED, ResultStatus.TIMEOUT
+        for r in self.question_results:
+            total_score += r.score
+            status = r.status
+            if status is skipped_status:
+                skipped += 1
+            elif status is timeout_status:
+                timeouts += 1
+        return total_score, skipped, timeouts
+
     @property
     def score_percentage(self) -> float:
         """Get score as percentage (including partial credit)"""
         if self.total_questions == 0:
             return 0.0
-        total_score = sum(r.score for r in self.question_results)
-        return (total_score / self.total_questions) * 100
+        return (self._tally()[0] / self.total_questions) * 100
 
     @property
     def skipped_count(self) -> int:
         """Count skipped questions"""
-        return sum(1 for r in self.question_results if r.status == ResultStatus.SKIPPED)
+        return self._tally()[1]
 
     @property
     def timeout_count(self) -> int:
         """Count timeout questions"""
-        return sum(1 for r in self.question_results if r.status == ResultStatus.TIMEOUT)
+        return self._tally()[2]
 
     @property
     def average_time_per_question(self) -> float:
@@ -95,8 +153,10 @@ class QuizResult:
             return 0.0
         return self.time_taken / self.total_questions
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert result to dictionary"""
+    def to_summary_dict(self) -> Dict[str, Any]:
+        """Convert aggregate statistics to a dictionary, without per-question results"""
+        # The counts come from a single (cached) pass over question_results
+        _, skipped, timeouts = self._tally()
         return {
             "title": self.title,
             "total_questions": self.total_questions,
@@ -105,11 +165,57 @@ class QuizResult:
             "score_percentage": self.score_percentage,
             "time_taken": self.time_taken,
             "average_time_per_question": self.average_time_per_question,
-            "skipped_count": self.skipped_count,
-            "timeout_count": self.timeout_count,
-            "question_results": [r.to_dict() for r in self.question_results],
+            "skipped_count": skipped,
+            "timeout_count": timeouts,
         }
 
+    def iter_question_results(self) -> Iterator[Dict[str, Any]]:
+        """Lazily convert each question result to a dictionary"""
+        return (r.to_dict() for r in self.question_results)
+
+    def to_dict(self, include_details: bool = True) -> Dict[str, Any]:
+        """
+        Convert result to dictionary
+
+        Args:
+            include_details: Include the per-question results list
+        """
+        data = self.to_summary_dict()
+        if include_details:
+            data["question_results"] = [r.to_dict() for r in self.question_results]
+        return data
+
+    def to_json(self, include_details: bool = True) -> str:
+        """
+        Serialize result to a compact JSON string with the same content as to_dict
+
+        Args:
+            include_details: Include the per-question results list
+        """
+        return json_dumps(self.to_dict(include_details))
+
+    def to_records(self) -> Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]:
+        """
+        Get per-question results as rows without building a dict per row
+
+        Returns:
+            (column names, rows), e.g. for pandas.DataFrame.from_records(rows, columns=columns)
+        """
+        return QuestionResult.RECORD_FIELDS, [r.to_record() for r in self.question_results]
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """
+        Get per-question results as one list per field (struct-of-arrays)
+
+        Returns:
+            Field name -> values in question order, e.g. for numpy.asarray(columns["score"])
+        """
+        fields, rows = self.to_records()
+        # zip(*rows) transposes in C; with no rows it yields nothing, so default to empty lists
+        columns: Dict[str, List[Any]] = {name: [] for name in fields}
+        columns.update(zip(fields, map(list, zip(*rows))))
+        return columns
+
 
 class QuestionType(Enum):
     """Types of questions supported"""
@@ -124,6 +230,15 @@ class QuestionType(Enum):
 class Question:
     """Base class for quiz questions with enhanced features"""
 
+    __slots__ = (
+        "text",
+        "correct_answer",
+        "explanation",
+        "time_limit",
+        "metadata",
+        "question_type",
+    )
+
     def __init__(
         self,
         text: str,
@@ -174,9 +289,25 @@ class Question:
         return True, None
 
 
-class MultipleChoiceQuestion(Question):
+class _ShuffledOrder:
+    """Mixin for questions that can show a list in a random order chosen once"""
+
+    __slots__ = ()  # the _shuffled slot is declared by each question class
+
+    def _shuffled_order(self, source: List[str], enabled: bool) -> List[str]:
+        """Get source shuffled on first use and reused after, or source itself when disabled"""
+        if not enabled:
+            return source
+        if self._shuffled is None:
+            self._shuffled = random.sample(source, len(source))
+        return self._shuffled
+
+
+class MultipleChoiceQuestion(_ShuffledOrder, Question):
     """Single-answer multiple choice question"""
 
+    __slots__ = ("options", "shuffle_options", "_shuffled")
+
     def __init__(
         self,
         text: str,
@@ -210,15 +341,12 @@ class MultipleChoiceQuestion(Question):
         )
         self.options = options
         self.shuffle_options = shuffle_options
-        self._shuffled_options = None
+        self._shuffled = None
 
     @property
     def display_options(self) -> List[str]:
         """Get options, shuffled if configured"""
-        if self.shuffle_options and self._shuffled_options is None:
-            self._shuffled_options = self.options.copy()
-            random.shuffle(self._shuffled_options)
-        return self._shuffled_options if self._shuffled_options else self.options
+        return self._shuffled_order(self.options, self.shuffle_options)
 
     def check_answer(self, user_answer: str) -> bool:
         """Check if answer matches exactly"""
@@ -244,9 +372,16 @@ class MultipleChoiceQuestion(Question):
         return True, None
 
 
-class MultipleSelectQuestion(Question):
+class MultipleSelectQuestion(_ShuffledOrder, Question):
     """Multiple-answer question where user must select all correct answers"""
 
+    __slots__ = (
+        "options",
+        "allow_partial_credit",
+        "shuffle_options",
+        "_shuffled",
+    )
+
     def __init__(
         self,
         text: str,
@@ -269,9 +404,11 @@ class MultipleSelectQuestion(Question):
             allow_partial_credit: Award points for partially correct answers
             shuffle_options: Whether to shuffle options
         """
-        for answer in correct_answers:
-            if answer not in options:
-                raise ValueError(f"Answer '{answer}' must be in options")
+        correct_set = frozenset(correct_answers)
+        option_set = frozenset(options)
+        if not correct_set <= option_set:
+            missing = [answer for answer in correct_answers if answer not in option_set]
+            raise ValueError(f"Answers {missing} must be in options")
 
         if len(correct_answers) < 2:
             raise ValueError("Multiple select must have at least 2 correct answers")
@@ -287,39 +424,37 @@ class MultipleSelectQuestion(Question):
         self.options = options
         self.allow_partial_credit = allow_partial_credit
         self.shuffle_options = shuffle_options
-        self._shuffled_options = None
+        self._shuffled = None
 
     @property
     def display_options(self) -> List[str]:
         """Get options, shuffled if configured"""
-        if self.shuffle_options and self._shuffled_options is None:
-            self._shuffled_options = self.options.copy()
-            random.shuffle(self._shuffled_options)
-        return self._shuffled_options if self._shuffled_options else self.options
+        return self._shuffled_order(self.options, self.shuffle_options)
 
     def check_answer(self, user_answer: List[str]) -> Union[bool, float]:
         """Check if answers are correct, with optional partial credit"""
-        if not isinstance(user_answer, list):
+        if isinstance(user_answer, (set, frozenset)):
+            selected = user_answer  # already hashed, no copy needed
+        elif isinstance(user_answer, (list, tuple)):
+            selected = set(user_answer)
+        else:
             return False
 
-        if set(user_answer) == set(self.correct_answer):
+        # Built per check, so in-place edits to correct_answer are always graded
+        correct_set = set(self.correct_answer)
+        if selected == correct_set:
             return True
 
         if not self.allow_partial_credit:
             return False
 
-        # Calculate partial credit
-        correct_selected = len(set(user_answer) & set(self.correct_answer))
-        incorrect_selected = len(set(user_answer) - set(self.correct_answer))
-        missed = len(set(self.correct_answer) - set(user_answer))
-
-        if incorrect_selected > 0:
+        # Calculate partial credit; anything selected outside the key is a wrong selection
+        correct_selected = len(selected & correct_set)
+        if correct_selected < len(selected):
             return 0.0  # Any wrong selection = no credit
 
-        if missed > 0:
-            return correct_selected / len(self.correct_answer)
-
-        return True
+        # Not equal to the key and nothing wrong, so some answers were missed
+        return correct_selected / len(self.correct_answer)
 
     def get_options(self) -> List[str]:
         """Get all options"""
@@ -338,6 +473,8 @@ class MultipleSelectQuestion(Question):
 class ShortTextQuestion(Question):
     """Free-form text input question with case sensitivity option"""
 
+    __slots__ = ("case_sensitive", "accepted_variations")
+
     def __init__(
         self,
         text: str,
@@ -370,29 +507,28 @@ class ShortTextQuestion(Question):
         self.accepted_variations = accepted_variations or []
 
     def check_answer(self, user_answer: str) -> bool:
-        """Check if answer matches"""
+        """Check if answer matches the correct answer or an accepted variation"""
         user_text = user_answer.strip()
+        # Read on every check, so edits to accepted_variations take effect at once
+        answers = (answer.strip() for answer in (self.correct_answer, *self.accepted_variations))
+        if self.case_sensitive:
+            return any(user_text == answer for answer in answers)
+        user_text = user_text.lower()
+        return any(user_text == answer.lower() for answer in answers)
 
-        if not self.case_sensitive:
-            user_text = user_text.lower()
-            correct = self.correct_answer.lower()
-        else:
-            correct = self.correct_answer
-
-        if user_text == correct:
-            return True
-
-        for variation in self.accepted_variations:
-            compare_variation = variation.lower() if not self.case_sensitive else variation
-            if user_text == compare_variation:
-                return True
 
-        return False
+# Text answers accepted for true/false questions, mapped to the value they mean
+_BOOL_TOKENS = {
+    **dict.fromkeys(("true", "t", "yes", "y", "1"), True),
+    **dict.fromkeys(("false", "f", "no", "n", "0"), False),
+}
 
 
 class TrueFalseQuestion(Question):
     """True/False question"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         text: str,
@@ -423,25 +559,55 @@ class TrueFalseQuestion(Question):
 
     def check_answer(self, user_answer: Any) -> bool:
         """Check if answer is correct"""
-        if isinstance(user_answer, bool):
-            return user_answer == self.correct_answer
+        answer_type = type(user_answer)
+        try:
+            check = self._CHECKS[answer_type]
+        except KeyError:
+            # Other types (e.g. str/int subclasses) are resolved once, then cached
+            check = next(
+                (c for base, c in self._CHECKS.items() if issubclass(answer_type, base)),
+                None,
+            )
+            self._CHECKS[answer_type] = check
+        if check is None:
+            return False
+        return check(self, user_answer)
 
-        if isinstance(user_answer, str):
-            normalized = user_answer.strip().lower()
-            if self.correct_answer:
-                return normalized in ("true", "t", "yes", "y", "1")
-            else:
-                return normalized in ("false", "f", "no", "n", "0")
+    def _check_bool(self, user_answer: bool) -> bool:
+        return user_answer == self.correct_answer
+
+    def _check_text(self, user_answer: str) -> bool:
+        # Unknown text maps to None, which equals neither True nor False
+        return _BOOL_TOKENS.get(user_answer.strip().lower()) == self.correct_answer
+
+    def _check_number(self, user_answer: Union[int, float]) -> bool:
+        return bool(user_answer) == self.correct_answer
 
-        if isinstance(user_answer, (int, float)):
-            return (user_answer != 0) == self.correct_answer
+    # Answer type -> checker, so the common case is one dict lookup
+    _CHECKS = {
+        bool: _check_bool,
+        str: _check_text,
+        int: _check_number,
+        float: _check_number,
+    }
 
-        return False
 
+# Default for lookups where None is a legitimate value
+_MISSING = object()
 
-class MatchingQuestion(Question):
+
+class MatchingQuestion(_ShuffledOrder, Question):
     """Enhanced matching question with shuffling and partial credit"""
 
+    __slots__ = (
+        "pairs",
+        "prompts",
+        "answers",
+        "shuffle_answers",
+        "allow_partial_credit",
+        "_shuffled",
+    )
+
     def __init__(
         self,
         text: str,
@@ -478,29 +644,27 @@ class MatchingQuestion(Question):
         self.answers = list(pairs.values())
         self.shuffle_answers = shuffle_answers
         self.allow_partial_credit = allow_partial_credit
-        self._shuffled_answers = None
+        self._shuffled = None
 
     @property
     def display_answers(self) -> List[str]:
         """Get answers, shuffled if configured"""
-        if self.shuffle_answers and self._shuffled_answers is None:
-            self._shuffled_answers = self.answers.copy()
-            random.shuffle(self._shuffled_answers)
-        return self._shuffled_answers if self._shuffled_answers else self.answers
+        return self._shuffled_order(self.answers, self.shuffle_answers)
 
     def check_answer(self, user_answer: Dict[str, str]) -> Union[bool, float]:
         """Check matches, with optional partial credit"""
         if not isinstance(user_answer, dict):
             return False
 
-        if user_answer == self.pairs:
-            return True
-
         if not self.allow_partial_credit:
-            return False
+            # dict equality rejects a size mismatch before comparing any values
+            return user_answer == self.pairs
 
-        # Calculate partial credit
-        correct_matches = sum(1 for k, v in user_answer.items() if self.pairs.get(k) == v)
+        # One pass serves both the exact match and the partial credit
+        pairs_get = self.pairs.get
+        correct_matches = sum(1 for k, v in user_answer.items() if pairs_get(k, _MISSING) == v)
+        if correct_matches == len(self.pairs) == len(user_answer):
+            return True
         return correct_matches / len(self.pairs)
 
     def get_options(self) -> Dict[str, List[str]]:
@@ -508,6 +672,68 @@ class MatchingQuestion(Question):
         return {"prompts": self.prompts, "answers": self.display_answers}
 
 
+def count_matches(rows: Sequence[Sequence[Any]], key: Sequence[Any]) -> List[int]:
+    """
+    Count, for each row, the positions holding the same value as the key
+
+    Args:
+        rows: Equal-length rows of answers, e.g. short answers mapped to vocabulary token IDs
+        key: Expected value at each position
+
+    Returns:
+        Number of matching positions in each row
+
+    Raises:
+        ValueError: If a row's length differs from the key's
+    """
+    width = len(key)
+    shape = getattr(rows, "shape", None)
+    if shape is not None and len(shape) == 2:
+        if shape[1] != width:
+            raise ValueError(f"Rows hold {shape[1]} answers but the key has {width}")
+    elif any(len(row) != width for row in rows):
+        raise ValueError(f"Every row must hold {width} answers, one per key position")
+
+    np = optional_numpy()
+    if np is not None:
+        matrix = np.asarray(rows)
+        if matrix.ndim == 2:
+            # Numeric IDs compare in one native loop; object arrays still avoid per-row Python
+            return (matrix == np.asarray(key)).sum(axis=1).tolist()
+    return [sum(a == b for a, b in zip(row, key)) for row in rows]
+
+
+async def _bounded(awaitable: Awaitable[Any], time_limit: Optional[float]) -> Any:
+    """Await with an optional time limit, raising asyncio.TimeoutError once it passes"""
+    if not time_limit:
+        return await awaitable
+    if _asyncio_timeout is not None:
+        async with _asyncio_timeout(time_limit):
+            return await awaitable
+    return await asyncio.wait_for(awaitable, timeout=time_limit)
+
+
+def _frozen(value: Any) -> Any:
+    """Hashable stand-in for an answer or option value"""
+    if isinstance(value, dict):
+        return frozenset((key, _frozen(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _memo_key(question: Question) -> Tuple:
+    """Everything that decides a question's answer: class, text, options and correct answer"""
+    return (
+        type(question),
+        question.text,
+        _frozen(getattr(question, "options", None)),
+        _frozen(question.correct_answer),
+    )
+
+
 class Quiz:
     """Enhanced Quiz with async support and live timer management"""
 
@@ -520,6 +746,7 @@ class Quiz:
         shuffle_options: bool = False,
         randomize_order: bool = False,
         show_progress: bool = True,
+        enable_memoize: bool = False,
     ):
         """
         Args:
@@ -530,6 +757,7 @@ class Quiz:
             shuffle_options: Shuffle answer options for each question
             randomize_order: Randomize question order
             show_progress: Show progress indicator during quiz
+            enable_memoize: Within one run, reuse the answer given to an identical question
         """
         self.title = title
         self.questions = questions or []
@@ -538,6 +766,7 @@ class Quiz:
         self.shuffle_options = shuffle_options
         self.randomize_order = randomize_order
         self.show_progress = show_progress
+        self.enable_memoize = enable_memoize
         self._result: Optional[QuizResult] = None
         self._start_time: Optional[float] = None
 
@@ -573,7 +802,7 @@ class Quiz:
         """Get remaining time for quiz"""
         if self.time_limit is None or self._start_time is None:
             return None
-        elapsed = time.time() - self._start_time
+        elapsed = time.perf_counter() - self._start_time
         return max(0.0, self.time_limit - elapsed)
 
     def is_time_up(self) -> bool:
@@ -586,6 +815,69 @@ class Quiz:
         self.questions = []
         self._result = None
 
+    @staticmethod
+    def _memoized(answer_provider: Callable) -> Callable:
+        """Wrap a provider so repeated questions reuse their first non-skipped answer"""
+        # Fresh for every run, so answers never carry over to another provider
+        memo: Dict[Tuple, Any] = {}
+
+        def provider(question: Question, index: int) -> Any:
+            key = _memo_key(question)
+            answer = memo.get(key)
+            if answer is None:
+                answer = answer_provider(question, index)
+                if answer is not None:
+                    memo[key] = answer
+            return answer
+
+        return provider
+
+    @staticmethod
+    def _memoized_async(answer_provider: Callable[..., Coroutine]) -> Callable[..., Coroutine]:
+        """Async counterpart of _memoized"""
+        memo: Dict[Tuple, Any] = {}
+
+        async def provider(question: Question, index: int) -> Any:
+            key = _memo_key(question)
+            answer = memo.get(key)
+            if answer is None:
+                answer = await answer_provider(question, index)
+                if answer is not None:
+                    memo[key] = answer
+            return answer
+
+        return provider
+
+    def _question_order(self) -> List[Question]:
+        """Get the questions in the order they will be asked (never mutated by the caller)"""
+        if self.randomize_order:
+            # One call builds the shuffled copy, no separate copy + in-place shuffle
+            return random.sample(self.questions, len(self.questions))
+        return self.questions
+
+    def grade_batch(self, answers: Sequence[Sequence[Any]]) -> List[int]:
+        """
+        Count correct multiple choice answers for many submissions at once
+
+        Args:
+            answers: One row per submission, holding one answer per question in quiz order
+
+        Returns:
+            Number of correct multiple choice answers in each row
+        """
+        columns = [
+            i for i, q in enumerate(self.questions) if isinstance(q, MultipleChoiceQuestion)
+        ]
+        key = [self.questions[i].correct_answer for i in columns]
+
+        np = optional_numpy()
+        if np is not None:
+            matrix = np.asarray(answers, dtype=object)
+            # Rows holding list answers (e.g. multiple select) don't form a 2D array
+            if matrix.ndim == 2:
+                return count_matches(matrix[:, columns], np.asarray(key, dtype=object))
+        return count_matches([[row[i] for i in columns] for row in answers], key)
+
     def execute(
         self,
         answer_provider: Callable,
@@ -608,77 +900,90 @@ class Quiz:
         if not self.questions:
             raise ValueError("No questions in quiz")
 
-        self._start_time = time.time()
+        if self.enable_memoize:
+            answer_provider = self._memoized(answer_provider)
+
+        # Monotonic high-resolution clock: only durations are reported
+        now = time.perf_counter
+        self._start_time = now()
         results = []
         correct_count = 0
         partial_count = 0
 
-        questions_to_run = self.questions.copy()
-        if self.randomize_order:
-            random.shuffle(questions_to_run)
+        questions_to_run = self._question_order()
+
+        # Untimed quizzes skip the per-question clock check entirely
+        time_limited = self.time_limit is not None
+        # Same test as is_time_up(), as one clock read and compare per question
+        deadline = self._start_time + self.time_limit if time_limited else None
+
+        # Bind loop invariants to locals once rather than per question
+        correct, incorrect = ResultStatus.CORRECT, ResultStatus.INCORRECT
+        skipped, partial = ResultStatus.SKIPPED, ResultStatus.PARTIAL
+        results_append = results.append
+        make_result = QuestionResult
+        total = len(questions_to_run)
 
         for i, question in enumerate(questions_to_run, 1):
             # Check time limit
-            if self.is_time_up():
-                if timeout_callback:
-                    timeout_callback(question, i, len(questions_to_run))
-                remaining_questions = len(questions_to_run) - i
-                for j in range(remaining_questions):
-                    results.append(
-                        QuestionResult(
-                            question_index=i + j - 1,
-                            user_answer="",
-                            correct_answer=question.correct_answer,
-                            status=ResultStatus.TIMEOUT,
-                            time_taken=0.0,
-                            score=0.0,
-                        )
-                    )
+            if time_limited and now() >= deadline:
+                if timeout_callback is not None:
+                    timeout_callback(question, i, total)
+                # This question and every one after it ran out of time, each with its own answer
+                timed_out = ResultStatus.TIMEOUT
+                results.extend(
+                    make_result(index, "", unasked.correct_answer, timed_out, 0.0, 0.0)
+                    for index, unasked in enumerate(questions_to_run[i - 1 :], i - 1)
+                )
                 break
 
-            if question_callback:
-                question_callback(question, i, len(questions_to_run))
+            if question_callback is not None:
+                question_callback(question, i, total)
 
-            question_start = time.time()
+            question_start = now()
             user_answer = answer_provider(question, i - 1)
-            time_taken = time.time() - question_start
+            time_taken = now() - question_start
 
             # Determine status and score
             if user_answer is None:
-                status = ResultStatus.SKIPPED
+                status = skipped
                 score = 0.0
             else:
                 check_result = question.check_answer(user_answer)
-                if isinstance(check_result, bool):
-                    status = ResultStatus.CORRECT if check_result else ResultStatus.INCORRECT
-                    score = 1.0 if check_result else 0.0
-                    if check_result:
-                        correct_count += 1
-                else:
+                # True/False are singletons, so identity tests route bools without isinstance
+                if check_result is True:
+                    status = correct
+                    score = 1.0
+                    correct_count += 1
+                elif check_result is not False and check_result > 0:
                     # Partial credit
-                    status = ResultStatus.PARTIAL if check_result > 0 else ResultStatus.INCORRECT
+                    status = partial
                     score = check_result
-                    if check_result > 0:
-                        partial_count += 1
+                    partial_count += 1
+                else:
+                    status = incorrect
+                    score = 0.0 if check_result is False else check_result
 
-            result = QuestionResult(
+            # Only a missing answer is recorded as "", so False, 0 and {} are kept as given
+            recorded_answer = "" if user_answer is None else user_answer
+            result = make_result(
                 question_index=i - 1,
-                user_answer=user_answer or "",
+                user_answer=recorded_answer,
                 correct_answer=question.correct_answer,
                 status=status,
                 time_taken=time_taken,
                 score=score,
             )
-            results.append(result)
+            results_append(result)
 
-            if result_callback:
-                result_callback(question, i, user_answer or "", status, time_taken)
+            if result_callback is not None:
+                result_callback(question, i, recorded_answer, status, time_taken)
 
-        total_time = time.time() - self._start_time
+        total_time = now() - self._start_time
 
         quiz_result = QuizResult(
             title=self.title,
-            total_questions=len(questions_to_run),
+            total_questions=total,
             correct_answers=correct_count,
             time_taken=total_time,
             question_results=results,
@@ -710,42 +1015,69 @@ class Quiz:
         if not self.questions:
             raise ValueError("No questions in quiz")
 
-        self._start_time = time.time()
+        return await self._execute_async(
+            self._question_order(), answer_provider, result_callback, question_callback, timeout_callback
+        )
+
+    async def _execute_async(
+        self,
+        questions_to_run: List[Question],
+        answer_provider: Callable[..., Coroutine],
+        result_callback: Optional[Callable],
+        question_callback: Optional[Callable],
+        timeout_callback: Optional[Callable],
+        time_limited_answers: bool = True,
+    ) -> QuizResult:
+        """
+        Ask questions_to_run in order, as execute_async
+
+        time_limited_answers=False leaves question time limits to answer_provider,
+        for answers that were already requested under their own limit
+        """
+        if self.enable_memoize:
+            answer_provider = self._memoized_async(answer_provider)
+
+        # Monotonic high-resolution clock: only durations are reported
+        now = time.perf_counter
+        self._start_time = now()
         results = []
         correct_count = 0
         partial_count = 0
 
-        questions_to_run = self.questions.copy()
-        if self.randomize_order:
-            random.shuffle(questions_to_run)
+        # Untimed quizzes skip the per-question clock check entirely
+        time_limited = self.time_limit is not None
+        # Same test as is_time_up(), as one clock read and compare per question
+        deadline = self._start_time + self.time_limit if time_limited else None
+
+        # Bind loop invariants to locals once rather than per question
+        correct, incorrect = ResultStatus.CORRECT, ResultStatus.INCORRECT
+        skipped, partial = ResultStatus.SKIPPED, ResultStatus.PARTIAL
+        results_append = results.append
+        make_result = QuestionResult
+        total = len(questions_to_run)
 
         for i, question in enumerate(questions_to_run, 1):
             # Check time limit
-            if self.is_time_up():
-                if timeout_callback:
-                    await timeout_callback(question, i, len(questions_to_run))
+            if time_limited and now() >= deadline:
+                if timeout_callback is not None:
+                    await timeout_callback(question, i, total)
                 break
 
-            if question_callback:
-                await question_callback(question, i, len(questions_to_run))
+            if question_callback is not None:
+                await question_callback(question, i, total)
 
-            question_start = time.time()
+            question_start = now()
             try:
                 # Get answer with timeout if question has time limit
-                if question.time_limit:
-                    user_answer = await asyncio.wait_for(
-                        answer_provider(question, i - 1),
-                        timeout=question.time_limit,
-                    )
-                else:
-                    user_answer = await answer_provider(question, i - 1)
+                time_limit = question.time_limit if time_limited_answers else None
+                user_answer = await _bounded(answer_provider(question, i - 1), time_limit)
             except asyncio.TimeoutError:
                 user_answer = None
                 status = ResultStatus.TIMEOUT
                 score = 0.0
-                time_taken = time.time() - question_start
-                results.append(
-                    QuestionResult(
+                time_taken = now() - question_start
+                results_append(
+                    make_result(
                         question_index=i - 1,
                         user_answer="",
                         correct_answer=question.correct_answer,
@@ -756,43 +1088,48 @@ class Quiz:
                 )
                 continue
 
-            time_taken = time.time() - question_start
+            time_taken = now() - question_start
 
             # Determine status and score
             if user_answer is None:
-                status = ResultStatus.SKIPPED
+                status = skipped
                 score = 0.0
             else:
                 check_result = question.check_answer(user_answer)
-                if isinstance(check_result, bool):
-                    status = ResultStatus.CORRECT if check_result else ResultStatus.INCORRECT
-                    score = 1.0 if check_result else 0.0
-                    if check_result:
-                        correct_count += 1
-                else:
-                    status = ResultStatus.PARTIAL if check_result > 0 else ResultStatus.INCORRECT
+                # True/False are singletons, so identity tests route bools without isinstance
+                if check_result is True:
+                    status = correct
+                    score = 1.0
+                    correct_count += 1
+                elif check_result is not False and check_result > 0:
+                    # Partial credit
+                    status = partial
                     score = check_result
-                    if check_result > 0:
-                        partial_count += 1
+                    partial_count += 1
+                else:
+                    status = incorrect
+                    score = 0.0 if check_result is False else check_result
 
-            result = QuestionResult(
+            # Only a missing answer is recorded as "", so False, 0 and {} are kept as given
+            recorded_answer = "" if user_answer is None else user_answer
+            result = make_result(
                 question_index=i - 1,
-                user_answer=user_answer or "",
+                user_answer=recorded_answer,
                 correct_answer=question.correct_answer,
                 status=status,
                 time_taken=time_taken,
                 score=score,
             )
-            results.append(result)
+            results_append(result)
 
-            if result_callback:
-                await result_callback(question, i, user_answer or "", status, time_taken)
+            if result_callback is not None:
+                await result_callback(question, i, recorded_answer, status, time_taken)
 
-        total_time = time.time() - self._start_time
+        total_time = now() - self._start_time
 
         quiz_result = QuizResult(
             title=self.title,
-            total_questions=len(questions_to_run),
+            total_questions=total,
             correct_answers=correct_count,
             time_taken=total_time,
             question_results=results,
@@ -802,6 +1139,66 @@ class Quiz:
         self._result = quiz_result
         return quiz_result
 
+    async def execute_async_concurrent(
+        self,
+        answer_provider: Callable[..., Coroutine],
+        max_concurrency: int = 8,
+        result_callback: Optional[Callable] = None,
+        question_callback: Optional[Callable] = None,
+        timeout_callback: Optional[Callable] = None,
+    ) -> QuizResult:
+        """
+        Execute the quiz asynchronously, fetching several answers at once
+
+        Suited to independent, I/O-bound providers (e.g. API calls). Answers are requested ahead
+        in run order, then graded one by one exactly as in execute_async, so time_taken is
+        the wait for each answer once its turn comes. A question added twice is requested twice.
+
+        Args:
+            answer_provider: Async callable(question, index) -> answer or None
+            max_concurrency: Maximum number of answer_provider calls in flight
+            result_callback: Optional callback after each question
+            question_callback: Optional callback before each question
+            timeout_callback: Optional callback when time expires
+
+        Returns:
+            QuizResult with complete statistics
+        """
+        if not self.questions:
+            raise ValueError("No questions in quiz")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(question: Question, index: int) -> Any:
+            async with semaphore:
+                return await _bounded(answer_provider(question, index), question.time_limit)
+
+        # One request per position in run order, with the index execute_async would pass
+        questions_to_run = self._question_order()
+        pending = [
+            asyncio.ensure_future(fetch(question, index))
+            for index, question in enumerate(questions_to_run)
+        ]
+
+        async def prefetched(question: Question, index: int) -> Any:
+            return await pending[index]
+
+        try:
+            # fetch already applies each question's time limit, so no second timer here
+            return await self._execute_async(
+                questions_to_run,
+                prefetched,
+                result_callback,
+                question_callback,
+                timeout_callback,
+                time_limited_answers=False,
+            )
+        finally:
+            # Quiz time limit reached: drop answers that will never be graded
+            for task in pending:
+                if not task.cancel() and not task.cancelled():
+                    task.exception()  # already finished; mark any error as retrieved
+
     def validate(self) -> Tuple[bool, List[str]]:
         """Validate quiz configuration"""
         errors = []
@@ -3,13 +3,25 @@ MCP Server for Quizy - Exposes quiz functionality to AI assistants
 """
 
 import asyncio
+import hashlib
+import inspect
 import json
 import logging
+import math
+import os
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable
 
 import mcp.server.stdio
 import mcp.types as types
 from mcp.server import Server
 
+from quizy._compat import json_dumps, json_loads
+
+# Responses are read by a client, not a person: compact unless QUIZY_MCP_PRETTY=1 asks otherwise
+_PRETTY = os.getenv("QUIZY_MCP_PRETTY") == "1"
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -22,133 +34,305 @@ except ImportError as e:
     logger.error(f"Failed to import Quizy modules: {e}")
 
 
-@server.list_tools()
-async def list_tools() -> list[types.Tool]:
+# Spellings validate_question accepts as a TRUE_FALSE answer
+_TF_ANSWERS = frozenset({"True", "False", "true", "false"})
+
+
+def _respond(data) -> list[types.TextContent]:
+    """Wrap a JSON-serializable result as the tool's text content"""
+    # TextContent.text is a str and the stdio transport re-encodes the whole JSON-RPC message,
+    # so the encoded bytes cannot be passed through; this is the one place they are decoded
+    return [types.TextContent(type="text", text=json_dumps(data, pretty=_PRETTY))]
+
+
+def _is_json_array(text: str) -> bool:
+    """Cheap shape check so empty or non-array questions_json never reaches the parser"""
+    return bool(text) and text.lstrip()[:1] == "["
+
+
+# Optional attributes copied into generated question payloads, in output order
+_QUESTION_FIELDS = ("options", "correct_answer", "correct_answers", "pairs")
+# Question class -> the _QUESTION_FIELDS its instances carry, found from the first one serialized
+_PAYLOAD_FIELDS: dict[type, tuple[str, ...]] = {}
+
+
+_GENERATOR = None
+
+
+def _get_generator():
+    """Get the AIQuestionGenerator shared by every tool call (its client and rate limits are reused)"""
+    global _GENERATOR
+    if _GENERATOR is None:
+        _GENERATOR = AIQuestionGenerator()
+    return _GENERATOR
+
+
+def _env_seconds(name: str, default: float) -> float:
+    """Read a duration in seconds from the environment, keeping the default on a bad value"""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = math.nan
+    if not math.isfinite(value):
+        logger.warning(f"Ignoring {name}={raw!r}, using {default}")
+        return default
+    return value
+
+
+# generate_quiz results, keyed by request: key -> (expiry, result); QUIZY_MCP_CACHE_TTL=0 disables
+_CACHE_TTL = _env_seconds("QUIZY_MCP_CACHE_TTL", 1800.0)
+_CACHE_SIZE = 512
+_RESPONSE_CACHE: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+
+
+def _response_key(topic: str, num_questions: int, difficulty: str, question_types: list) -> str:
+    """Build the response cache key for a generate_quiz request"""
+    # Types stay in caller order: batches cycle through them, so order changes the type mix
+    request = [topic.strip().lower(), num_questions, difficulty, [str(t) for t in question_types]]
+    return hashlib.blake2b(json_dumps(request).encode(), digest_size=16).hexdigest()
+
+
+def _cached_response(key: str):
+    """Get a cached generate_quiz result that has not expired, or None"""
+    entry = _RESPONSE_CACHE.get(key)
+    if entry is None:
+        return None
+    expiry, result = entry
+    if time.monotonic() >= expiry:
+        del _RESPONSE_CACHE[key]
+        return None
+    _RESPONSE_CACHE.move_to_end(key)
+    return result
+
+
+def _store_response(key: str, result: dict) -> None:
+    """Cache a generate_quiz result, evicting the least recently used entry when full"""
+    if _CACHE_TTL <= 0:
+        return
+    _RESPONSE_CACHE[key] = (time.monotonic() + _CACHE_TTL, result)
+    _RESPONSE_CACHE.move_to_end(key)
+    if len(_RESPONSE_CACHE) > _CACHE_SIZE:
+        _RESPONSE_CACHE.popitem(last=False)
+
+
+def _question_payload(q) -> dict:
+    """Serialize a generated question for a tool response"""
+    cls = type(q)
+    fields = _PAYLOAD_FIELDS.get(cls)
+    if fields is None:
+        # Checked on an instance, so attributes a subclass only sets in __init__ are included
+        fields = _PAYLOAD_FIELDS[cls] = tuple(name for name in _QUESTION_FIELDS if hasattr(q, name))
+    payload = {"text": q.text, "type": cls.__name__, "time_limit": getattr(q, "time_limit", None)}
+    for name in fields:
+        payload[name] = getattr(q, name)
+    return payload
+
+
+def _default_question_types() -> list:
+    """Question types generated when a request does not name any"""
     return [
-        types.Tool(
-            name="generate_quiz",
-            description="Generate a quiz using AI on a given topic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {"type": "string", "description": "Topic for questions"},
-                    "num_questions": {"type": "integer", "description": "Number of questions (default 5)"},
-                    "difficulty": {"type": "string", "enum": ["easy", "medium", "hard"], "description": "Difficulty level"},
-                    "question_types": {"type": "array", "description": "Question types to generate"}
-                },
-                "required": ["topic"]
-            }
-        ),
-        types.Tool(
-            name="validate_question",
-            description="Validate a question for quality issues",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "question_text": {"type": "string"},
-                    "question_type": {"type": "string"},
-                    "options": {"type": "array"},
-                    "correct_answer": {"type": "string"},
-                    "pairs": {"type": "object"}
-                },
-                "required": ["question_text", "question_type"]
-            }
-        ),
-        types.Tool(
-            name="create_quiz_from_questions",
-            description="Create a quiz object from questions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string"},
-                    "questions_json": {"type": "string"},
-                    "time_limit": {"type": "integer"},
-                    "shuffle_options": {"type": "boolean"}
-                },
-                "required": ["title", "questions_json"]
-            }
-        ),
-        types.Tool(
-            name="analyze_difficulty",
-            description="Analyze question difficulty distribution",
-            inputSchema={
-                "type": "object",
-                "properties": {"questions_json": {"type": "string"}},
-                "required": ["questions_json"]
-            }
-        )
+        QuestionType.MULTIPLE_CHOICE,
+        QuestionType.TRUE_FALSE,
+        QuestionType.MULTIPLE_SELECT,
+        QuestionType.SHORT_TEXT,
     ]
 
 
-@server.call_tool()
+# Tool schemas are static, so they are built once at import rather than per request
+_TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="generate_quiz",
+        description="Generate a quiz using AI on a given topic",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic": {"type": "string", "description": "Topic for questions"},
+                "num_questions": {"type": "integer", "description": "Number of questions (default 5)"},
+                "difficulty": {"type": "string", "enum": ["easy", "medium", "hard"], "description": "Difficulty level"},
+                "question_types": {"type": "array", "description": "Question types to generate"}
+            },
+            "required": ["topic"]
+        }
+    ),
+    types.Tool(
+        name="generate_quizzes_batch",
+        description="Generate quizzes for several topics at once using AI",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topics": {"type": "array", "items": {"type": "string"}, "description": "Topics to generate a quiz for"},
+                "num_questions": {"type": "integer", "description": "Number of questions per topic (default 5)"},
+                "difficulty": {"type": "string", "enum": ["easy", "medium", "hard"], "description": "Difficulty level"},
+                "question_types": {"type": "array", "description": "Question types to generate"}
+            },
+            "required": ["topics"]
+        }
+    ),
+    types.Tool(
+        name="validate_question",
+        description="Validate a question for quality issues",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "question_text": {"type": "string"},
+                "question_type": {"type": "string"},
+                "options": {"type": "array"},
+                "correct_answer": {"type": "string"},
+                "pairs": {"type": "object"}
+            },
+            "required": ["question_text", "question_type"]
+        }
+    ),
+    types.Tool(
+        name="create_quiz_from_questions",
+        description="Create a quiz object from questions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "questions_json": {"type": "string"},
+                "time_limit": {"type": "integer"},
+                "shuffle_options": {"type": "boolean"}
+            },
+            "required": ["title", "questions_json"]
+        }
+    ),
+    types.Tool(
+        name="analyze_difficulty",
+        description="Analyze question difficulty distribution",
+        inputSchema={
+            "type": "object",
+            "properties": {"questions_json": {"type": "string"}},
+            "required": ["questions_json"]
+        }
+    )
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[types.Tool]:
+    return _TOOLS
+
+
+async def _quiz_for_topic(topic: str, num_questions: int, difficulty: str, question_types: list) -> dict:
+    """Generate the quiz for one topic, or reuse a cached result for the same request"""
+    cache_key = _response_key(topic, num_questions, difficulty, question_types)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        # The key ignores topic case and padding; echo the topic as this caller wrote it
+        return {**cached, "topic": topic}
+
+    generator = _get_generator()
+    questions = await generator.generate_questions_set_async(topic=topic, num_questions=num_questions, question_types=question_types, difficulty=difficulty)
+
+    questions_data = [_question_payload(q) for q in questions]
+    result = {"topic": topic, "num_questions": len(questions_data), "difficulty": difficulty, "questions": questions_data}
+    _store_response(cache_key, result)
+    return result
+
+
 async def handle_generate_quiz(topic: str, num_questions: int = 5, difficulty: str = "medium", question_types: list = None) -> list[types.TextContent]:
     if not topic or not topic.strip():
-        return [types.TextContent(type="text", text=json.dumps({"error": "Topic cannot be empty"}))]
+        return _respond({"error": "Topic cannot be empty"})
 
     if question_types is None:
-        question_types = [
-            QuestionType.MULTIPLE_CHOICE,
-            QuestionType.TRUE_FALSE,
-            QuestionType.MULTIPLE_SELECT,
-            QuestionType.SHORT_TEXT,
-        ]
+        question_types = _default_question_types()
 
     try:
-        generator = AIQuestionGenerator()
-        questions = await generator.generate_questions_set_async(topic=topic, num_questions=num_questions, question_types=question_types, difficulty=difficulty)
-
-        questions_data = []
-        for q in questions:
-            q_dict = {"text": q.text, "type": q.__class__.__name__, "time_limit": getattr(q, "time_limit", None)}
-            if hasattr(q, "options"):
-                q_dict["options"] = q.options
-            if hasattr(q, "correct_answer"):
-                q_dict["correct_answer"] = q.correct_answer
-            if hasattr(q, "correct_answers"):
-                q_dict["correct_answers"] = q.correct_answers
-            if hasattr(q, "pairs"):
-                q_dict["pairs"] = q.pairs
-            questions_data.append(q_dict)
-
-        result = {"topic": topic, "num_questions": len(questions_data), "difficulty": difficulty, "questions": questions_data}
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
-
+        return _respond(await _quiz_for_topic(topic, num_questions, difficulty, question_types))
     except Exception as e:
         logger.error(f"Error generating quiz: {e}")
-        return [types.TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return _respond({"error": str(e)})
+
+
+async def generate_quizzes_batch(topics: list, num_questions: int = 5, difficulty: str = "medium", question_types: list = None) -> list[types.TextContent]:
+    topics = [topic for topic in topics or [] if topic and topic.strip()]
+    if not topics:
+        return _respond({"error": "At least one non-empty topic is required"})
+
+    if question_types is None:
+        question_types = _default_question_types()
+
+    try:
+        _get_generator()
+    except Exception as e:
+        logger.error(f"Error generating quizzes: {e}")
+        return _respond({"error": str(e)})
+
+    # Topics are generated concurrently; one failing topic does not fail the others
+    outcomes = await asyncio.gather(
+        *(_quiz_for_topic(topic, num_questions, difficulty, question_types) for topic in topics),
+        return_exceptions=True,
+    )
+
+    quizzes = []
+    for topic, outcome in zip(topics, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(f"Error generating quiz for {topic!r}: {outcome}")
+            quizzes.append({"topic": topic, "error": str(outcome)})
+        else:
+            quizzes.append(outcome)
+
+    return _respond({"quizzes": quizzes})
+
+
+def _validate_multiple_choice(options, correct_answer, pairs) -> list[str]:
+    """Type-specific issues for a multiple choice question"""
+    issues = []
+    if not options or len(options) < 2:
+        issues.append("Need at least 2 options")
+    if not correct_answer:
+        issues.append("Correct answer required")
+    elif correct_answer not in options:
+        issues.append("Correct answer must be in options")
+    return issues
+
+
+def _validate_true_false(options, correct_answer, pairs) -> list[str]:
+    """Type-specific issues for a true/false question"""
+    if not isinstance(correct_answer, str) or correct_answer not in _TF_ANSWERS:
+        return ["Answer must be True or False"]
+    return []
+
+
+def _validate_matching(options, correct_answer, pairs) -> list[str]:
+    """Type-specific issues for a matching question"""
+    if not pairs or len(pairs) < 2:
+        return ["Need at least 2 pairs"]
+    return []
+
+
+# Question type name -> validator(options, correct_answer, pairs); other types get no extra checks
+_VALIDATORS: dict[str, Callable[[Any, Any, Any], list[str]]] = {
+    "MULTIPLE_CHOICE": _validate_multiple_choice,
+    "TRUE_FALSE": _validate_true_false,
+    "MATCHING": _validate_matching,
+}
 
 
-@server.call_tool()
 async def validate_question(question_text: str, question_type: str, options: list = None, correct_answer: str = None, pairs: dict = None) -> list[types.TextContent]:
     issues = []
 
     if not question_text or len(question_text.strip()) < 10:
         issues.append("Question text too short (minimum 10 characters)")
 
-    if question_type == "MULTIPLE_CHOICE":
-        if not options or len(options) < 2:
-            issues.append("Need at least 2 options")
-        if not correct_answer:
-            issues.append("Correct answer required")
-        elif correct_answer not in options:
-            issues.append("Correct answer must be in options")
-
-    elif question_type == "TRUE_FALSE":
-        if correct_answer not in ["True", "False", "true", "false"]:
-            issues.append("Answer must be True or False")
-
-    elif question_type == "MATCHING":
-        if not pairs or len(pairs) < 2:
-            issues.append("Need at least 2 pairs")
+    validator = _VALIDATORS.get(question_type)
+    if validator is not None:
+        issues.extend(validator(options, correct_answer, pairs))
 
     result = {"valid": len(issues) == 0, "issues": issues, "score": max(0, 100 - len(issues) * 20)}
-    return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+    return _respond(result)
 
 
-@server.call_tool()
 async def create_quiz_from_questions(title: str, questions_json: str, time_limit: int = None, shuffle_options: bool = False) -> list[types.TextContent]:
+    if not _is_json_array(questions_json):
+        return _respond({"error": "Invalid JSON format"})
+
     try:
-        questions_data = json.loads(questions_json)
+        questions_data = json_loads(questions_json)
         result = {
             "title": title,
             "time_limit": time_limit,
@@ -157,35 +341,57 @@ async def create_quiz_from_questions(title: str, questions_json: str, time_limit
             "questions_summary": [{"text": q.get("text", ""), "type": q.get("type", "")} for q in questions_data],
             "ready_to_execute": True
         }
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return _respond(result)
     except json.JSONDecodeError:
-        return [types.TextContent(type="text", text=json.dumps({"error": "Invalid JSON format"}))]
+        return _respond({"error": "Invalid JSON format"})
     except Exception as e:
         logger.error(f"Error creating quiz: {e}")
-        return [types.TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return _respond({"error": str(e)})
 
 
-@server.call_tool()
 async def analyze_difficulty(questions_json: str) -> list[types.TextContent]:
+    if not _is_json_array(questions_json):
+        return _respond({"error": "Invalid JSON format"})
+
     try:
-        questions_data = json.loads(questions_json)
-        type_count = {}
-        for q in questions_data:
-            q_type = q.get("type", "Unknown")
-            type_count[q_type] = type_count.get(q_type, 0) + 1
+        questions_data = json_loads(questions_json)
+        type_count = dict(Counter(q.get("type", "Unknown") for q in questions_data))
 
         recommendations = ["Good mix of question types" if len(type_count) >= 3 else "Consider adding more variety in question types"]
 
         result = {"total_questions": len(questions_data), "type_distribution": type_count, "recommendations": recommendations}
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return _respond(result)
     except Exception as e:
         logger.error(f"Error analyzing difficulty: {e}")
-        return [types.TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return _respond({"error": str(e)})
+
+
+# Tool name -> handler; MCP allows one CallToolRequest handler, which routes on the name
+_HANDLERS: dict[str, Callable[..., Any]] = {
+    "generate_quiz": handle_generate_quiz,
+    "generate_quizzes_batch": generate_quizzes_batch,
+    "validate_question": validate_question,
+    "create_quiz_from_questions": create_quiz_from_questions,
+    "analyze_difficulty": analyze_difficulty,
+}
+_SIGNATURES = {name: inspect.signature(handler) for name, handler in _HANDLERS.items()}
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return _respond({"error": f"Unknown tool: {name}"})
+    try:
+        bound = _SIGNATURES[name].bind(**(arguments or {}))
+    except TypeError as e:
+        return _respond({"error": f"Invalid arguments for {name}: {e}"})
+    return await handler(*bound.args, **bound.kwargs)
 
 
 async def main():
     logger.info("Quizy MCP Server starting...")
-    logger.info("Available tools: generate_quiz, validate_question, create_quiz_from_questions, analyze_difficulty")
+    logger.info("Available tools: generate_quiz, generate_quizzes_batch, validate_question, create_quiz_from_questions, analyze_difficulty")
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, asyncio.get_event_loop())
 
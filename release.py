@@ -3,17 +3,27 @@
 import re
 import os
 import sys
+import shutil
 import subprocess
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11 has no TOML parser, fall back to matching the version line
+    tomllib = None
 
 # Package configuration
 PACKAGE_NAME = "quizy"
 PYPROJECT_FILE = "pyproject.toml"
-INIT_FILE = "quizy/__init__.py"
 ENV_FILE = ".env"
 
+# The first `version = "..."` in pyproject.toml is the [project] version
+_PYPROJECT_VERSION_RE = re.compile(r'version = "([^"]+)"')
+
 # ANSI color codes
 class Colors:
     BLUE = '\033[0;34m'
@@ -37,33 +47,51 @@ class Colors:
 if not Colors.is_supported() or os.name == 'nt':
     Colors.disable()
 
+# Message prefixes, built once now that the colors are settled
+_INFO = f"{Colors.BLUE}ℹ{Colors.NC} "
+_SUCCESS = f"{Colors.GREEN}✓{Colors.NC} "
+_WARNING = f"{Colors.YELLOW}⚠{Colors.NC} "
+_ERROR = f"{Colors.RED}✗{Colors.NC} "
+
 
 def print_info(message: str):
     """Print info message"""
-    print(f"{Colors.BLUE}ℹ{Colors.NC} {message}")
+    print(_INFO + message)
 
 
 def print_success(message: str):
     """Print success message"""
-    print(f"{Colors.GREEN}✓{Colors.NC} {message}")
+    print(_SUCCESS + message)
 
 
 def print_warning(message: str):
     """Print warning message"""
-    print(f"{Colors.YELLOW}⚠{Colors.NC} {message}")
+    print(_WARNING + message)
 
 
 def print_error(message: str):
     """Print error message"""
-    print(f"{Colors.RED}✗{Colors.NC} {message}")
+    print(_ERROR + message)
 
 
 def load_env() -> dict:
     """Load environment variables from .env file"""
-    env_vars = {}
+    try:
+        stat = Path(ENV_FILE).stat()
+    except OSError:
+        return {}
+    
+    if not stat.st_size:
+        return {}
     
-    if not Path(ENV_FILE).exists():
-        return env_vars
+    # Parsed once per file version; callers get a copy they are free to modify
+    return dict(_parse_env_file(stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_env_file(mtime_ns: int, size: int) -> dict:
+    """Parse ENV_FILE (the arguments only key the cache on the file's version)"""
+    env_vars = {}
     
     try:
         with open(ENV_FILE, 'r') as f:
@@ -108,11 +136,10 @@ def get_pypi_token(test_mode: bool = False) -> Optional[str]:
     return token
 
 
-def run_command(command: str, check: bool = True) -> subprocess.CompletedProcess:
-    """Run shell command"""
+def run_command(command: List[str], check: bool = True) -> subprocess.CompletedProcess:
+    """Run a command directly, without a shell"""
     return subprocess.run(
         command,
-        shell=True,
         check=check,
         capture_output=False
     )
@@ -120,10 +147,17 @@ def run_command(command: str, check: bool = True) -> subprocess.CompletedProcess
 
 def get_current_version() -> str:
     """Get current version from pyproject.toml"""
+    if tomllib is not None:
+        with open(PYPROJECT_FILE, 'rb') as f:
+            version = tomllib.load(f).get('project', {}).get('version')
+        if not version:
+            raise ValueError(f"Could not find version in {PYPROJECT_FILE}")
+        return version
+    
     with open(PYPROJECT_FILE, 'r') as f:
         content = f.read()
     
-    match = re.search(r'version = "([^"]+)"', content)
+    match = _PYPROJECT_VERSION_RE.search(content)
     if not match:
         raise ValueError(f"Could not find version in {PYPROJECT_FILE}")
     
@@ -149,37 +183,16 @@ def increment_version(version: str, version_type: str) -> str:
     return f"{major}.{minor}.{patch}"
 
 
+def _replace_in_file(path: Path, pattern: "re.Pattern[str]", replacement: str):
+    """Replace the first match of pattern in a file, reading and writing it once each"""
+    path.write_text(pattern.sub(replacement, path.read_text(), count=1))
+
+
 def update_version_in_files(new_version: str):
-    """Update version in pyproject.toml and __init__.py"""
-    # Update pyproject.toml
-    with open(PYPROJECT_FILE, 'r') as f:
-        content = f.read()
-    
-    content = re.sub(
-        r'version = "[^"]+"',
-        f'version = "{new_version}"',
-        content
-    )
-    
-    with open(PYPROJECT_FILE, 'w') as f:
-        f.write(content)
-    
-    # Update __init__.py
-    with open(INIT_FILE, 'r') as f:
-        content = f.read()
-    
-    content = re.sub(
-        r'__version__ = "[^"]+"',
-        f'__version__ = "{new_version}"',
-        content
-    )
+    """Update version in pyproject.toml (quizy.__version__ is read from package metadata)"""
+    _replace_in_file(Path(PYPROJECT_FILE), _PYPROJECT_VERSION_RE, f'version = "{new_version}"')
     
-    with open(INIT_FILE, 'w') as f:
-        f.write(content)
-    
-    print_success(f"Updated version to {new_version} in:")
-    print(f"  - {PYPROJECT_FILE}")
-    print(f"  - {INIT_FILE}")
+    print_success(f"Updated version to {new_version} in {PYPROJECT_FILE}")
 
 
 def clean_build():
@@ -188,18 +201,20 @@ def clean_build():
     
     dirs_to_remove = ['dist', 'build', '*.egg-info', f'{PACKAGE_NAME}.egg-info']
     
+    paths = set()
     for pattern in dirs_to_remove:
         if '*' in pattern:
             # Handle wildcards
-            for path in Path('.').glob(pattern):
-                if path.is_dir():
-                    import shutil
-                    shutil.rmtree(path)
+            paths.update(path for path in Path('.').glob(pattern) if path.is_dir())
         else:
             path = Path(pattern)
             if path.exists():
-                import shutil
-                shutil.rmtree(path)
+                paths.add(path)
+    
+    # rmtree spends its time in filesystem calls, so the trees are removed side by side
+    if paths:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            list(executor.map(shutil.rmtree, paths))
     
     print_success("Cleaned build directories")
 
@@ -207,7 +222,7 @@ def clean_build():
 def build_package():
     """Build the package"""
     print_info("Building package...")
-    run_command("python -m build")
+    run_command(['python', '-m', 'build'])
     print_success("Package built successfully")
 
 
@@ -216,15 +231,20 @@ def upload_to_pypi(version: str, test_mode: bool = False):
     # Get API token
     token = get_pypi_token(test_mode)
     
+    # Expanded here since no shell is involved; the token is passed as-is, never quoted
+    dist_files = sorted(str(path) for path in Path('dist').glob(f'{PACKAGE_NAME}-{version}*'))
+    if not dist_files:
+        raise FileNotFoundError(f"No dist files found for {PACKAGE_NAME} {version}")
+    
     # Build twine command
     if test_mode:
         print_info("Uploading to TestPyPI...")
         if token:
             # Use token authentication
-            cmd = f'twine upload --repository testpypi -u __token__ -p "{token}" dist/{PACKAGE_NAME}-{version}*'
+            cmd = ['twine', 'upload', '--repository', 'testpypi', '-u', '__token__', '-p', token, *dist_files]
         else:
             # Let twine prompt for credentials
-            cmd = f'twine upload --repository testpypi dist/{PACKAGE_NAME}-{version}*'
+            cmd = ['twine', 'upload', '--repository', 'testpypi', *dist_files]
         
         run_command(cmd)
         print_success("Uploaded to TestPyPI")
@@ -234,10 +254,10 @@ def upload_to_pypi(version: str, test_mode: bool = False):
         print_info("Uploading to PyPI...")
         if token:
             # Use token authentication
-            cmd = f'twine upload -u __token__ -p "{token}" dist/{PACKAGE_NAME}-{version}*'
+            cmd = ['twine', 'upload', '-u', '__token__', '-p', token, *dist_files]
         else:
             # Let twine prompt for credentials
-            cmd = f'twine upload dist/{PACKAGE_NAME}-{version}*'
+            cmd = ['twine', 'upload', *dist_files]
         
         run_command(cmd)
         print_success("Uploaded to PyPI")
@@ -253,17 +273,16 @@ def create_git_tag(version: str, skip_git: bool = False):
     try:
         # Check if we're in a git repository
         result = subprocess.run(
-            "git rev-parse --git-dir",
-            shell=True,
+            ['git', 'rev-parse', '--git-dir'],
             check=False,
             capture_output=True
         )
         
         if result.returncode == 0:
             print_info(f"Creating git tag v{version}...")
-            run_command(f'git add {PYPROJECT_FILE} {INIT_FILE}')
-            run_command(f'git commit -m "Bump version to {version}"')
-            run_command(f'git tag -a "v{version}" -m "Release version {version}"')
+            run_command(['git', 'add', PYPROJECT_FILE])
+            run_command(['git', 'commit', '-m', f'Bump version to {version}'])
+            run_command(['git', 'tag', '-a', f'v{version}', '-m', f'Release version {version}'])
             print_success(f"Created git tag v{version}")
             print_warning("Don't forget to: git push && git push --tags")
     except Exception:
@@ -335,7 +354,7 @@ Examples:
             print_warning("DRY RUN MODE - No changes will be made")
             print()
             print("Would perform the following steps:")
-            print(f"  1. Update version in {PYPROJECT_FILE} and {INIT_FILE}")
+            print(f"  1. Update version in {PYPROJECT_FILE}")
             print("  2. Clean build artifacts")
             print("  3. Build package")
             print(f"  4. Upload to {'TestPyPI' if args.test else 'PyPI'}")
@@ -373,8 +392,7 @@ Examples:
         if not args.no_git:
             try:
                 result = subprocess.run(
-                    "git rev-parse --git-dir",
-                    shell=True,
+                    ['git', 'rev-parse', '--git-dir'],
                     check=False,
                     capture_output=True
                 )
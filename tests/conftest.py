@@ -0,0 +1,9 @@
+"""Fixtures shared across the test modules"""
+import pytest
+from quizy.core import MultipleChoiceQuestion
+
+
+@pytest.fixture(scope="module")
+def mc_ab():
+    """Two-option filler question, for tests that only read it or add it to a quiz"""
+    return MultipleChoiceQuestion("Q?", ["A", "B"], "A")
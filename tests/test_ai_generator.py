@@ -0,0 +1,226 @@
+"""AI generator tests - rate limiting, retries and batching against a fake OpenAI client"""
+import asyncio
+import re
+from types import SimpleNamespace
+import pytest
+
+openai = pytest.importorskip("openai")
+pytest.importorskip("pydantic")
+
+import httpx
+from quizy import ai_generator
+from quizy.ai_generator import AIQuestionGenerator, _TokenBucket
+from quizy.ai_schemas import SCHEMA_FOR_TYPE, QuestionBatchSchema
+from quizy.core import MultipleChoiceQuestion, QuestionType, TrueFalseQuestion
+
+
+def rate_limit_error():
+    """RateLimitError as the SDK raises it for an HTTP 429"""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, request=request)
+    return openai.RateLimitError("Rate limit reached", response=response, body=None)
+
+
+# Answer fields for each question type the fake client can return
+ITEM_DATA = {
+    "true_false": {"correct_answer": True},
+    "multiple_choice": {"options": ["A", "B", "C", "D"], "correct_answer": "A"},
+}
+TYPE_FOR_SCHEMA = {schema: qtype.value for qtype, schema in SCHEMA_FOR_TYPE.items()}
+
+
+class FakeCompletions:
+    """Stands in for client.chat.completions, answering each prompt with the requested types"""
+
+    def __init__(self, failures=0, hold_after=None, reply_types=None):
+        self.failures = failures
+        self.hold_after = hold_after
+        # Maps the requested batch types to the ones returned, to simulate a model going off-spec
+        self.reply_types = reply_types
+        self.requests = []
+        self.cancelled = 0
+        self.release = asyncio.Event()
+
+    async def parse(self, **request):
+        self.requests.append(request)
+        if self.failures:
+            self.failures -= 1
+            raise rate_limit_error()
+        if self.hold_after is not None and len(self.requests) > self.hold_after:
+            try:
+                await self.release.wait()
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        schema = request["response_format"]
+        if schema is QuestionBatchSchema:
+            prompt = request["messages"][0]["content"]
+            types = re.findall(r'A question of type "(\w+)"', prompt)
+            if self.reply_types is not None:
+                types = self.reply_types(types)
+            parsed = QuestionBatchSchema(
+                questions=[
+                    {"type": t, "question": f"Statement {i}?", "explanation": "", **ITEM_DATA[t]}
+                    for i, t in enumerate(types)
+                ]
+            )
+        else:
+            parsed = schema(question="Single?", explanation="", **ITEM_DATA[TYPE_FOR_SCHEMA[schema]])
+        message = SimpleNamespace(parsed=parsed, refusal=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def fake_sleep(monkeypatch):
+    """Record asyncio.sleep delays without waiting"""
+    delays = []
+
+    async def _sleep(delay, result=None):
+        delays.append(delay)
+        return result
+
+    monkeypatch.setattr(asyncio, "sleep", _sleep)
+    return delays
+
+
+def make_generator(completions, **kwargs):
+    """Generator whose async client is the given fake completions"""
+    generator = AIQuestionGenerator(api_key="test-key", **kwargs)
+    generator._async_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return generator
+
+
+def batch_sizes(completions):
+    """Number of questions asked for by each recorded request"""
+    return [
+        int(re.match(r"Generate the following (\d+) ", r["messages"][0]["content"]).group(1))
+        for r in completions.requests
+    ]
+
+
+class TestTokenBucket:
+    """Test _TokenBucket throttling"""
+
+    def test_waits_for_refill_when_empty(self, monkeypatch, fake_sleep):
+        clock = SimpleNamespace(now=0.0)
+        monkeypatch.setattr(ai_generator, "time", SimpleNamespace(monotonic=lambda: clock.now))
+
+        async def advancing_sleep(delay, result=None):
+            fake_sleep.append(delay)
+            clock.now += delay
+
+        monkeypatch.setattr(asyncio, "sleep", advancing_sleep)
+        bucket = _TokenBucket(per_minute=60)
+
+        async def drain():
+            for _ in range(61):
+                await bucket.acquire()
+
+        asyncio.run(drain())
+        assert fake_sleep == [pytest.approx(1.0)]
+        assert clock.now == pytest.approx(1.0)
+
+    def test_request_larger_than_capacity_is_capped(self, fake_sleep):
+        bucket = _TokenBucket(per_minute=10)
+        asyncio.run(bucket.acquire(50))
+        assert fake_sleep == []
+
+
+class TestCreateCompletion:
+    """Test requests are retried on rate limits"""
+
+    def test_retries_after_429(self, fake_sleep):
+        completions = FakeCompletions(failures=1)
+        generator = make_generator(completions)
+        questions = asyncio.run(
+            generator.generate_questions_batch_async("Python", [(QuestionType.TRUE_FALSE, 2)])
+        )
+        assert len(completions.requests) == 2
+        assert len(fake_sleep) == 1 and 1 <= fake_sleep[0] < 2
+        assert all(isinstance(q, TrueFalseQuestion) for q in questions)
+
+    def test_gives_up_after_max_retries(self, fake_sleep):
+        completions = FakeCompletions(failures=3)
+        generator = make_generator(completions, max_retries=2)
+        with pytest.raises(openai.RateLimitError):
+            asyncio.run(generator._create_completion("prompt", QuestionBatchSchema))
+        assert len(completions.requests) == 3
+
+
+class TestBatching:
+    """Test question sets are split into MAX_BATCH_SIZE requests"""
+
+    def test_set_is_split_at_max_batch_size(self):
+        completions = FakeCompletions()
+        generator = make_generator(completions)
+        questions = asyncio.run(
+            generator.generate_questions_set_async(
+                "Python", num_questions=25, question_types=[QuestionType.TRUE_FALSE]
+            )
+        )
+        assert sorted(batch_sizes(completions)) == [5, 10, 10]
+        assert len(questions) == 25
+
+    def test_stream_close_cancels_pending_batches(self):
+        completions = FakeCompletions(hold_after=1)
+        generator = make_generator(completions)
+
+        async def first_question():
+            stream = generator.generate_questions_set_stream_async(
+                "Python", num_questions=30, question_types=[QuestionType.TRUE_FALSE]
+            )
+            question = await stream.__anext__()
+            await stream.aclose()
+            await asyncio.sleep(0)  # let the cancellations be delivered
+            return question
+
+        question = asyncio.run(first_question())
+        assert isinstance(question, TrueFalseQuestion)
+        assert len(completions.requests) == 3
+        assert completions.cancelled == 2
+
+    def test_string_question_types(self):
+        completions = FakeCompletions()
+        generator = make_generator(completions)
+        questions = asyncio.run(
+            generator.generate_questions_set_async(
+                "Python", num_questions=3, question_types=["MULTIPLE_CHOICE", "true_false"]
+            )
+        )
+        assert [type(q) for q in questions] == [
+            MultipleChoiceQuestion,
+            TrueFalseQuestion,
+            MultipleChoiceQuestion,
+        ]
+
+
+class TestBatchValidation:
+    """Test batch responses that do not match the requested specs"""
+
+    SPECS = [(QuestionType.MULTIPLE_CHOICE, 4), (QuestionType.TRUE_FALSE, 4), (QuestionType.TRUE_FALSE, 4)]
+
+    @pytest.mark.parametrize(
+        "reply_types",
+        [
+            lambda types: types[:1],
+            lambda types: types + ["true_false"],
+            lambda types: list(reversed(types)),
+        ],
+        ids=["too_few", "too_many", "wrong_order"],
+    )
+    def test_mismatched_items_are_requested_again(self, reply_types):
+        completions = FakeCompletions(reply_types=reply_types)
+        generator = make_generator(completions)
+        questions = asyncio.run(generator.generate_questions_batch_async("Python", self.SPECS))
+        assert [type(q) for q in questions] == [
+            MultipleChoiceQuestion,
+            TrueFalseQuestion,
+            TrueFalseQuestion,
+        ]
+
+    def test_matching_items_are_kept(self):
+        completions = FakeCompletions(reply_types=lambda types: types[:2] + ["multiple_choice"])
+        generator = make_generator(completions)
+        questions = asyncio.run(generator.generate_questions_batch_async("Python", self.SPECS))
+        assert [q.text for q in questions] == ["Statement 0?", "Statement 1?", "Single?"]
+        assert len(completions.requests) == 2
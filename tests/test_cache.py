@@ -0,0 +1,88 @@
+"""Prompt cache tests"""
+import contextlib
+import pytest
+from unittest.mock import patch
+
+from quizy.cache import PromptCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = PromptCache(tmp_path / "prompts.sqlite3")
+    yield cache
+    cache.close()
+
+
+class TestPromptCache:
+    """Test PromptCache class"""
+
+    def test_make_key_is_stable(self):
+        """Test same prompt and model give the same key"""
+        assert PromptCache.make_key("prompt", "gpt") == PromptCache.make_key("prompt", "gpt")
+
+    def test_make_key_depends_on_model(self):
+        """Test different models give different keys"""
+        assert PromptCache.make_key("prompt", "gpt-a") != PromptCache.make_key("prompt", "gpt-b")
+
+    def test_get_missing(self, cache):
+        """Test lookup of an unknown key"""
+        assert cache.get("missing") is None
+
+    def test_set_and_get(self, cache):
+        """Test storing and reading back an entry"""
+        cache.set("key", {"question": "Q?"})
+        assert cache.get("key") == {"question": "Q?"}
+        assert len(cache) == 1
+
+    def test_persists_to_disk(self, tmp_path):
+        """Test entries survive reopening the cache file"""
+        path = tmp_path / "prompts.sqlite3"
+        first = PromptCache(path)
+        first.set("key", {"question": "Q?"})
+        first.close()
+
+        second = PromptCache(path)
+        assert second.get("key") == {"question": "Q?"}
+        second.close()
+
+    def test_get_similar_hit(self, cache):
+        """Test similarity lookup above threshold"""
+        cache.set("key", {"question": "Q?"}, namespace="mc", embedding=[1.0, 0.0])
+        assert cache.get_similar([0.99, 0.01], "mc", threshold=0.95) == {"question": "Q?"}
+
+    def test_get_similar_miss(self, cache):
+        """Test similarity lookup below threshold"""
+        cache.set("key", {"question": "Q?"}, namespace="mc", embedding=[1.0, 0.0])
+        assert cache.get_similar([0.0, 1.0], "mc", threshold=0.95) is None
+
+    def test_get_similar_scoped_to_namespace(self, cache):
+        """Test similarity lookup ignores other namespaces"""
+        cache.set("key", {"question": "Q?"}, namespace="mc", embedding=[1.0, 0.0])
+        assert cache.get_similar([1.0, 0.0], "tf") is None
+
+    @pytest.mark.parametrize("numpy", [True, False], ids=["numpy", "pure_python"])
+    def test_set_existing_key_replaces_vector(self, cache, numpy):
+        """Test re-storing a key replaces its embedding instead of adding another"""
+        no_numpy = patch("quizy.cache.optional_numpy", return_value=None)
+        with contextlib.nullcontext() if numpy else no_numpy:
+            cache.get_similar([1.0, 0.0], "mc")  # load the index before updating it
+            cache.set("key", {"question": "Old?"}, namespace="mc", embedding=[1.0, 0.0])
+            cache.set("key", {"question": "New?"}, namespace="mc", embedding=[0.0, 1.0])
+            assert cache._vectors["mc"].keys == ["key"]
+            assert cache.get_similar([1.0, 0.0], "mc") is None
+            assert cache.get_similar([0.0, 1.0], "mc") == {"question": "New?"}
+
+    def test_set_existing_key_moves_namespace(self, cache):
+        """Test re-storing a key under another namespace drops it from the old one"""
+        cache.get_similar([1.0, 0.0], "mc")
+        cache.set("key", {"question": "Q?"}, namespace="mc", embedding=[1.0, 0.0])
+        cache.set("key", {"question": "Q?"}, namespace="tf", embedding=[1.0, 0.0])
+        assert cache.get_similar([1.0, 0.0], "mc") is None
+        assert cache.get_similar([1.0, 0.0], "tf") == {"question": "Q?"}
+
+    def test_clear(self, cache):
+        """Test clearing all entries"""
+        cache.set("key", {"question": "Q?"})
+        cache.clear()
+        assert cache.get("key") is None
+        assert len(cache) == 0
@@ -2,7 +2,11 @@
 import pytest
 import sys
 import io
+import os
+import re
+import asyncio
 import time
+from contextlib import contextmanager, redirect_stdout
 from unittest.mock import patch, MagicMock
 from datetime import timedelta
 
@@ -20,9 +24,76 @@ from quizy.core import (
 )
 
 
+@contextmanager
+def capture():
+    """Collect stdout in a StringIO for tests that only inspect printed text"""
+    with redirect_stdout(io.StringIO()) as buf:
+        yield buf
+
+
+def assert_contains_all(text: str, *needles: str) -> None:
+    """Assert every needle occurs in text, scanning it once"""
+    # Longest first, so a shorter needle sharing a prefix cannot shadow a longer one
+    pattern = re.compile("|".join(re.escape(n) for n in sorted(needles, key=len, reverse=True)))
+    missing = set(needles) - set(pattern.findall(text))
+    assert not missing, f"missing {sorted(missing)} in output:\n{text}"
+
+
+# Canonical questions shared by the display and answer tests, which only read them
+@pytest.fixture(scope="module")
+def mc_q():
+    return MultipleChoiceQuestion("Q?", ["A", "B"], "A")
+
+
+@pytest.fixture(scope="module")
+def mc3_q():
+    return MultipleChoiceQuestion("Q?", ["A", "B", "C"], "B")
+
+
+@pytest.fixture(scope="module")
+def tf_q():
+    return TrueFalseQuestion("Q?", True)
+
+
+@pytest.fixture(scope="module")
+def ms_q():
+    return MultipleSelectQuestion("Q?", ["A", "B", "C"], ["A", "B"])
+
+
+@pytest.fixture
+def fake_input(monkeypatch):
+    """Answer QuizCLI prompts with the given responses, in order"""
+
+    def feed(*responses):
+        pending = iter(responses)
+        monkeypatch.setattr(QuizCLI, "_prompt_input", staticmethod(lambda prompt, timer=None: next(pending)))
+
+    return feed
+
+
+class FakeClock:
+    """Virtual monotonic clock that only moves when advanced"""
+
+    def __init__(self, start_ns: int):
+        self.now_ns = start_ns
+
+    def monotonic_ns(self) -> int:
+        return self.now_ns
+
+    def advance(self, seconds: float) -> None:
+        self.now_ns += int(seconds * 1e9)
+
+
 class TestTimerDisplay:
     """Test TimerDisplay class"""
 
+    @pytest.fixture(autouse=True)
+    def fake_clock(self, monkeypatch):
+        """Drive TimerDisplay from a virtual clock so expiry needs no real sleeps"""
+        clock = FakeClock(time.monotonic_ns())
+        monkeypatch.setattr("quizy.cli.time.monotonic_ns", clock.monotonic_ns)
+        return clock
+
     def test_timer_initialization(self):
         """Test timer initialization"""
         timer = TimerDisplay(60.0)
@@ -51,10 +122,10 @@ class TestTimerDisplay:
         assert timer.is_paused is False
         assert abs(timer.get_elapsed() - paused_elapsed) < 0.1
 
-    def test_timer_is_expired(self):
+    def test_timer_is_expired(self, fake_clock):
         """Test expiration check"""
         timer = TimerDisplay(0.01)
-        time.sleep(0.02)
+        fake_clock.advance(0.02)
         assert timer.is_expired() is True
 
     def test_timer_is_not_expired(self):
@@ -62,30 +133,23 @@ class TestTimerDisplay:
         timer = TimerDisplay(60.0)
         assert timer.is_expired() is False
 
-    def test_timer_format_time(self):
-        """Test time formatting"""
-        timer = TimerDisplay(60.0)
-        assert timer.format_time(125) == "02:05"
-        assert timer.format_time(5) == "00:05"
-        assert timer.format_time(0) == "00:00"
-
-    def test_timer_get_warning_symbol_expired(self):
-        """Test warning symbol when expired"""
-        timer = TimerDisplay(0.01)
-        time.sleep(0.02)
-        assert timer.get_warning_symbol() == "❌"
-
-    def test_timer_get_warning_symbol_low_time(self):
-        """Test warning symbol with low time"""
-        timer = TimerDisplay(5.0)
-        symbol = timer.get_warning_symbol()
-        assert symbol == "⚠️ "
-
-    def test_timer_get_warning_symbol_medium_time(self):
-        """Test warning symbol with medium time"""
-        timer = TimerDisplay(60.0)
-        symbol = timer.get_warning_symbol()
-        assert symbol == "✓ "
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [(125, "02:05"), (5, "00:05"), (0, "00:00"), (61.9, "01:01"), (3661, "61:01")],
+    )
+    def test_timer_format_time(self, seconds, expected):
+        """Test time formatting, which needs no timer instance"""
+        assert TimerDisplay.format_time(seconds) == expected
+
+    @pytest.mark.parametrize(
+        "duration,expected",
+        [(0.01, "❌"), (5.0, "⚠️ "), (20.0, "⏱️ "), (60.0, "✓ ")],
+    )
+    def test_timer_get_warning_symbol(self, fake_clock, duration, expected):
+        """Test warning symbol for expired, low, medium and plenty of time"""
+        timer = TimerDisplay(duration)
+        fake_clock.advance(0.02)
+        assert timer.get_warning_symbol() == expected
 
     def test_timer_pause_when_paused(self):
         """Test pausing an already paused timer"""
@@ -94,10 +158,10 @@ class TestTimerDisplay:
         timer.pause()
         assert timer.is_paused is True
 
-    def test_timer_remaining_after_expiry(self):
+    def test_timer_remaining_after_expiry(self, fake_clock):
         """Test remaining time after expiry"""
         timer = TimerDisplay(0.01)
-        time.sleep(0.02)
+        fake_clock.advance(0.02)
         remaining = timer.get_remaining()
         assert remaining == 0.0
 
@@ -107,11 +171,35 @@ class TestTimerDisplay:
         remaining = timer.get_remaining()
         assert 99 < remaining <= 100
 
-    def test_timer_format_large_duration(self):
-        """Test formatting large time duration"""
-        timer = TimerDisplay(3600.0)
-        formatted = timer.format_time(3661)
-        assert ":" in formatted
+    def test_timer_start_and_paused_time(self, fake_clock):
+        """Test start_time and paused_time are still readable"""
+        timer = TimerDisplay(60.0)
+        assert timer.paused_time == 0.0
+        assert abs(timer.start_time - time.time()) < 1
+        fake_clock.advance(5)
+        timer.pause()
+        assert timer.paused_time == 5.0
+        with pytest.raises(AttributeError):
+            timer.start_time = 0.0
+
+    def test_timer_resume_moves_deadline(self, fake_clock):
+        """Test time spent paused is not counted"""
+        timer = TimerDisplay(60.0)
+        timer.pause()
+        remaining = timer.get_remaining()
+        fake_clock.advance(0.02)
+        timer.resume()
+        assert timer.get_remaining() == remaining
+
+    def test_timer_reset(self, fake_clock):
+        """Test resetting restarts the countdown with a new duration"""
+        timer = TimerDisplay(0.01)
+        timer.pause()
+        fake_clock.advance(0.02)
+        timer.reset(30.0)
+        assert timer.duration == 30.0
+        assert timer.is_paused is False
+        assert timer.get_remaining() == 30.0
 
 
 class TestQuizCLIFormatting:
@@ -146,255 +234,270 @@ class TestQuizCLIFormatting:
 class TestQuizCLIDisplayQuestion:
     """Test QuizCLI question display methods"""
 
-    def test_display_multiple_choice_question(self, capsys):
+    def test_display_multiple_choice_question(self):
         """Test displaying multiple choice question"""
         q = MultipleChoiceQuestion("What is 2+2?", ["3", "4", "5"], "4")
-        QuizCLI.display_question(q, 1, 5)
-        captured = capsys.readouterr()
-        assert "What is 2+2?" in captured.out
-        assert "3" in captured.out
-        assert "4" in captured.out
+        with capture() as buf:
+            QuizCLI.display_question(q, 1, 5)
+        assert_contains_all(buf.getvalue(), "What is 2+2?", "3", "4")
 
-    def test_display_true_false_question(self, capsys):
+    def test_display_true_false_question(self):
         """Test displaying true/false question"""
         q = TrueFalseQuestion("Is Python awesome?", True)
-        QuizCLI.display_question(q, 1, 3)
-        captured = capsys.readouterr()
-        assert "Is Python awesome?" in captured.out
-        assert "True" in captured.out
-        assert "False" in captured.out
+        with capture() as buf:
+            QuizCLI.display_question(q, 1, 3)
+        assert_contains_all(buf.getvalue(), "Is Python awesome?", "True", "False")
 
-    def test_display_matching_question(self, capsys):
+    def test_display_matching_question(self):
         """Test displaying matching question"""
         q = MatchingQuestion("Match countries", {"France": "Paris", "Germany": "Berlin"})
-        QuizCLI.display_question(q, 1, 2)
-        captured = capsys.readouterr()
-        assert "Match countries" in captured.out
-        assert "France" in captured.out
-        assert "Paris" in captured.out
+        with capture() as buf:
+            QuizCLI.display_question(q, 1, 2)
+        assert_contains_all(buf.getvalue(), "Match countries", "France", "Paris")
 
-    def test_display_short_text_question(self, capsys):
+    def test_display_short_text_question(self):
         """Test displaying short text question"""
         q = ShortTextQuestion("What year?", "1991")
-        QuizCLI.display_question(q, 1, 2)
-        captured = capsys.readouterr()
-        assert "What year?" in captured.out
-        assert "Text input" in captured.out
+        with capture() as buf:
+            QuizCLI.display_question(q, 1, 2)
+        out = buf.getvalue()
+        assert "What year?" in out
+        assert "Text input" in out
 
-    def test_display_question_with_timer(self, capsys):
+    def test_display_question_with_timer(self):
         """Test displaying question with time limit"""
         q = MultipleChoiceQuestion("Q?", ["A", "B"], "A", time_limit=30.0)
-        QuizCLI.display_question(q, 1, 1, timer=None)
-        captured = capsys.readouterr()
-        assert "Q?" in captured.out
+        with capture() as buf:
+            QuizCLI.display_question(q, 1, 1, timer=None)
+        out = buf.getvalue()
+        assert "Q?" in out
 
-    def test_display_multiple_select_question(self, capsys):
+    def test_display_multiple_select_question(self):
         """Test displaying multiple select question"""
         q = MultipleSelectQuestion("Select all", ["A", "B", "C"], ["A", "B"])
-        QuizCLI.display_question(q, 1, 2)
-        captured = capsys.readouterr()
-        assert "Select all" in captured.out
+        with capture() as buf:
+            QuizCLI.display_question(q, 1, 2)
+        out = buf.getvalue()
+        assert "Select all" in out
 
-    def test_display_question_with_matching(self, capsys):
+    def test_display_question_with_matching(self):
         """Test displaying matching question"""
         q = MatchingQuestion("Match", {"France": "Paris", "Germany": "Berlin"})
-        QuizCLI.display_question(q, 1, 1)
-        captured = capsys.readouterr()
-        assert "France" in captured.out or "Match" in captured.out
-
-    def test_display_question_with_short_text_variations(self, capsys):
+        with capture() as buf:
+            QuizCLI.display_question(q, 1, 1)
+        out = buf.getvalue()
+        assert "France" in out or "Match" in out
+
+    def test_render_question_matches_display(self):
+        """Test rendering returns exactly what display_question writes"""
+        q = MultipleChoiceQuestion("Q?", ["A", "B"], "A", time_limit=10)
+        with capture() as buf:
+            QuizCLI.display_question(q, 2, 3)
+        assert buf.getvalue() == QuizCLI.render_question(q, 2, 3)
+
+    def test_display_question_matching_many_options(self):
+        """Test option labels continue past z instead of running into symbols"""
+        pairs = {f"item{i}": f"match{i}" for i in range(28)}
+        q = MatchingQuestion("Match", pairs)
+        with capture() as buf:
+            QuizCLI.display_question(q, 1, 1)
+        out = buf.getvalue()
+        assert "z." in out and "ab." in out
+        assert "{." not in out
+
+    def test_display_question_with_short_text_variations(self):
         """Test displaying short text with variations"""
         q = ShortTextQuestion("Q?", "answer", accepted_variations=["alternate", "other"])
-        QuizCLI.display_question(q, 1, 1)
-        captured = capsys.readouterr()
-        assert "alternate" in captured.out or "Q?" in captured.out
+        with capture() as buf:
+            QuizCLI.display_question(q, 1, 1)
+        out = buf.getvalue()
+        assert "alternate" in out or "Q?" in out
 
 
 class TestQuizCLIGetAnswer:
     """Test QuizCLI get_answer methods"""
 
-    def test_get_answer_multiple_choice(self):
+    def test_get_answer_multiple_choice(self, mc3_q):
         """Test getting multiple choice answer"""
-        q = MultipleChoiceQuestion("Q?", ["A", "B", "C"], "B")
-        with patch("builtins.input", return_value="2"):
-            answer = QuizCLI.get_answer(q, allow_skip=False)
+        with patch("sys.stdin", io.StringIO("2\n")):
+            answer = QuizCLI.get_answer(mc3_q, allow_skip=False)
             assert answer == "B"
 
-    def test_get_answer_true_false_true(self):
+    def test_get_answer_true_false_true(self, tf_q):
         """Test getting true/false answer (true)"""
-        q = TrueFalseQuestion("Q?", True)
-        with patch("builtins.input", return_value="1"):
-            answer = QuizCLI.get_answer(q, allow_skip=False)
+        with patch("sys.stdin", io.StringIO("1\n")):
+            answer = QuizCLI.get_answer(tf_q, allow_skip=False)
             assert answer is True
 
     def test_get_answer_true_false_false(self):
         """Test getting true/false answer (false)"""
         q = TrueFalseQuestion("Q?", False)
-        with patch("builtins.input", return_value="2"):
+        with patch("sys.stdin", io.StringIO("2\n")):
             answer = QuizCLI.get_answer(q, allow_skip=False)
             assert answer is False
 
     def test_get_answer_short_text(self):
         """Test getting short text answer"""
         q = ShortTextQuestion("Q?", "hello")
-        with patch("builtins.input", return_value="hello"):
+        with patch("sys.stdin", io.StringIO("hello\n")):
             answer = QuizCLI.get_answer(q, allow_skip=False)
             assert answer == "hello"
 
-    def test_get_answer_with_skip_none(self):
+    def test_get_answer_with_skip_none(self, mc_q):
         """Test getting answer with skip enabled"""
-        q = MultipleChoiceQuestion("Q?", ["A", "B"], "A")
-        with patch("builtins.input", return_value=""):
-            answer = QuizCLI.get_answer(q, allow_skip=True)
+        with patch("sys.stdin", io.StringIO("\n")):
+            answer = QuizCLI.get_answer(mc_q, allow_skip=True)
             assert answer is None
 
-    def test_get_answer_keyboard_interrupt(self):
+    def test_get_answer_question_subclass(self):
+        """Test subclasses use their base type's answer handler"""
+
+        class CustomTrueFalse(TrueFalseQuestion):
+            pass
+
+        q = CustomTrueFalse("Q?", True)
+        with patch("sys.stdin", io.StringIO("1\n")):
+            assert QuizCLI.get_answer(q, allow_skip=False) is True
+
+    def test_get_answer_keyboard_interrupt(self, mc_q):
         """Test handling keyboard interrupt"""
-        q = MultipleChoiceQuestion("Q?", ["A", "B"], "A")
-        with patch("builtins.input", side_effect=KeyboardInterrupt()):
-            answer = QuizCLI.get_answer(q, allow_skip=False)
+        with patch.object(QuizCLI, "_read_line", side_effect=KeyboardInterrupt()):
+            answer = QuizCLI.get_answer(mc_q, allow_skip=False)
             assert answer is None
 
-    def test_get_answer_eof_error(self):
+    def test_get_answer_eof_error(self, mc_q):
         """Test handling EOF error"""
-        q = MultipleChoiceQuestion("Q?", ["A", "B"], "A")
-        with patch("builtins.input", side_effect=EOFError()):
-            answer = QuizCLI.get_answer(q, allow_skip=False)
+        with patch("sys.stdin", io.StringIO("")):
+            answer = QuizCLI.get_answer(mc_q, allow_skip=False)
             assert answer is None
 
 
 class TestQuizCLIChoiceAnswer:
     """Test choice answer handling"""
 
-    def test_get_choice_answer_valid(self):
+    def test_get_choice_answer_valid(self, fake_input, mc3_q):
         """Test valid choice input"""
-        q = MultipleChoiceQuestion("Q?", ["A", "B", "C"], "B")
-        with patch.object(QuizCLI, "_prompt_input", return_value="2"):
-            answer = QuizCLI._get_choice_answer(q, False, "", None)
-            assert answer == "B"
+        fake_input("2")
+        answer = QuizCLI._get_choice_answer(mc3_q, False, "", None)
+        assert answer == "B"
 
-    def test_get_choice_answer_invalid_range(self):
+    def test_get_choice_answer_invalid_range(self, fake_input, mc_q):
         """Test invalid choice - out of range"""
-        q = MultipleChoiceQuestion("Q?", ["A", "B"], "A")
-        with patch.object(QuizCLI, "_prompt_input", side_effect=["5", "1"]):
-            with patch("builtins.print"):
-                answer = QuizCLI._get_choice_answer(q, False, "", None)
-                assert answer == "A"
+        fake_input("5", "1")
+        answer = QuizCLI._get_choice_answer(mc_q, False, "", None)
+        assert answer == "A"
 
-    def test_get_choice_answer_invalid_input(self):
+    def test_get_choice_answer_invalid_input(self, fake_input, mc_q):
         """Test invalid choice - non-numeric"""
-        q = MultipleChoiceQuestion("Q?", ["A", "B"], "A")
-        with patch.object(QuizCLI, "_prompt_input", side_effect=["abc", "1"]):
-            with patch("builtins.print"):
-                answer = QuizCLI._get_choice_answer(q, False, "", None)
-                assert answer == "A"
+        fake_input("abc", "1")
+        answer = QuizCLI._get_choice_answer(mc_q, False, "", None)
+        assert answer == "A"
 
-    def test_get_choice_answer_empty_with_skip(self):
+    def test_get_choice_answer_empty_with_skip(self, fake_input, mc_q):
         """Test empty answer with skip enabled"""
-        q = MultipleChoiceQuestion("Q?", ["A", "B"], "A")
-        with patch.object(QuizCLI, "_prompt_input", return_value=""):
-            answer = QuizCLI._get_choice_answer(q, allow_skip=True, skip_help="", timer=None)
-            assert answer is None
+        fake_input("")
+        answer = QuizCLI._get_choice_answer(mc_q, allow_skip=True, skip_help="", timer=None)
+        assert answer is None
 
-    def test_get_multiple_select_answer(self):
+    def test_get_multiple_select_answer(self, fake_input, ms_q):
         """Test multiple select answer"""
-        q = MultipleSelectQuestion("Q?", ["A", "B", "C"], ["A", "B"])
-        with patch.object(QuizCLI, "_prompt_input", return_value="1,2"):
-            answer = QuizCLI._get_choice_answer(q, False, "", None)
-            assert answer == ["A", "B"]
+        fake_input("1,2")
+        answer = QuizCLI._get_choice_answer(ms_q, False, "", None)
+        assert answer == ["A", "B"]
 
-    def test_get_multiple_select_answer_invalid(self):
+    def test_get_multiple_select_answer_invalid(self, fake_input, ms_q):
         """Test multiple select with invalid number"""
-        q = MultipleSelectQuestion("Q?", ["A", "B", "C"], ["A", "B"])
-        with patch.object(QuizCLI, "_prompt_input", side_effect=["not_a_number", "1,2"]):
-            with patch("builtins.print"):
-                answer = QuizCLI._get_choice_answer(q, False, "", None)
-                assert answer == ["A", "B"]
+        fake_input("not_a_number", "1,2")
+        answer = QuizCLI._get_choice_answer(ms_q, False, "", None)
+        assert answer == ["A", "B"]
 
-    def test_get_choice_answer_handles_comma_separated(self):
+    def test_get_choice_answer_handles_comma_separated(self, fake_input, ms_q):
         """Test choice answer parsing comma-separated input"""
-        q = MultipleSelectQuestion("Q?", ["A", "B", "C"], ["A", "B"])
-        with patch.object(QuizCLI, "_prompt_input", return_value="1, 2"):
-            result = QuizCLI._get_choice_answer(q, False, "", None)
-            assert "A" in result
-            assert "B" in result
+        fake_input("1, 2")
+        result = QuizCLI._get_choice_answer(ms_q, False, "", None)
+        assert "A" in result
+        assert "B" in result
 
 
 class TestQuizCLITrueFalseAnswer:
     """Test true/false answer handling"""
 
-    def test_get_true_false_answer_true(self):
+    def test_get_true_false_answer_true(self, fake_input):
         """Test true answer input"""
-        with patch.object(QuizCLI, "_prompt_input", return_value="1"):
-            answer = QuizCLI._get_true_false_answer(False, "", None)
-            assert answer is True
+        fake_input("1")
+        answer = QuizCLI._get_true_false_answer(False, "", None)
+        assert answer is True
 
-    def test_get_true_false_answer_false(self):
+    def test_get_true_false_answer_false(self, fake_input):
         """Test false answer input"""
-        with patch.object(QuizCLI, "_prompt_input", return_value="2"):
-            answer = QuizCLI._get_true_false_answer(False, "", None)
-            assert answer is False
+        fake_input("2")
+        answer = QuizCLI._get_true_false_answer(False, "", None)
+        assert answer is False
 
-    def test_get_true_false_answer_invalid(self):
+    def test_get_true_false_answer_invalid(self, fake_input):
         """Test invalid true/false input"""
-        with patch.object(QuizCLI, "_prompt_input", side_effect=["3", "1"]):
-            with patch("builtins.print"):
-                answer = QuizCLI._get_true_false_answer(False, "", None)
-                assert answer is True
+        fake_input("3", "1")
+        answer = QuizCLI._get_true_false_answer(False, "", None)
+        assert answer is True
 
-    def test_get_true_false_answer_non_numeric(self):
+    def test_get_true_false_answer_non_numeric(self, fake_input):
         """Test non-numeric true/false input"""
-        with patch.object(QuizCLI, "_prompt_input", side_effect=["abc", "2"]):
-            with patch("builtins.print"):
-                answer = QuizCLI._get_true_false_answer(False, "", None)
-                assert answer is False
+        fake_input("abc", "2")
+        answer = QuizCLI._get_true_false_answer(False, "", None)
+        assert answer is False
 
-    def test_get_true_false_answer_empty_with_skip(self):
+    def test_get_true_false_answer_empty_with_skip(self, fake_input):
         """Test empty true/false with skip"""
-        with patch.object(QuizCLI, "_prompt_input", return_value=""):
-            answer = QuizCLI._get_true_false_answer(True, "", None)
-            assert answer is None
+        fake_input("")
+        answer = QuizCLI._get_true_false_answer(True, "", None)
+        assert answer is None
 
 
 class TestQuizCLITextAnswer:
     """Test short text answer handling"""
 
-    def test_get_text_answer(self):
+    def test_get_text_answer(self, fake_input):
         """Test getting text answer"""
-        with patch.object(QuizCLI, "_prompt_input", return_value="hello"):
-            answer = QuizCLI._get_text_answer(False, "", None)
-            assert answer == "hello"
+        fake_input("hello")
+        answer = QuizCLI._get_text_answer(False, "", None)
+        assert answer == "hello"
 
-    def test_get_text_answer_empty_with_skip(self):
+    def test_get_text_answer_empty_with_skip(self, fake_input):
         """Test empty text answer with skip"""
-        with patch.object(QuizCLI, "_prompt_input", return_value=""):
-            answer = QuizCLI._get_text_answer(True, "", None)
-            assert answer is None
+        fake_input("")
+        answer = QuizCLI._get_text_answer(True, "", None)
+        assert answer is None
 
-    def test_get_text_answer_empty_no_skip(self):
+    def test_get_text_answer_empty_no_skip(self, fake_input):
         """Test empty text answer without skip - retry"""
-        with patch.object(QuizCLI, "_prompt_input", side_effect=["", "answer"]):
-            with patch("builtins.print"):
-                answer = QuizCLI._get_text_answer(False, "", None)
-                assert answer == "answer"
+        fake_input("", "answer")
+        answer = QuizCLI._get_text_answer(False, "", None)
+        assert answer == "answer"
 
-    def test_get_text_answer_retries_on_empty(self):
+    def test_get_text_answer_retries_on_empty(self, fake_input):
         """Test text answer retries when empty"""
         q = ShortTextQuestion("Q?", "answer")
-        with patch.object(QuizCLI, "_prompt_input", side_effect=["", "test"]):
-            result = QuizCLI._get_text_answer(allow_skip=False, skip_help="", timer=None)
-            assert result == "test"
+        fake_input("", "test")
+        result = QuizCLI._get_text_answer(allow_skip=False, skip_help="", timer=None)
+        assert result == "test"
+
+    def test_get_text_answer_many_retries(self, fake_input):
+        """Test long runs of empty input don't exhaust the stack"""
+        inputs = [""] * (sys.getrecursionlimit() + 10) + ["answer"]
+        fake_input(*inputs)
+        assert QuizCLI._get_text_answer(False, "", None) == "answer"
 
 
 class TestQuizCLIMatchingAnswer:
     """Test matching answer handling"""
 
-    def test_get_matching_answer_empty_with_skip(self):
+    def test_get_matching_answer_empty_with_skip(self, fake_input):
         """Test empty matching answer with skip"""
         q = MatchingQuestion("Match", {"A": "1", "B": "2"})
-        with patch.object(QuizCLI, "_prompt_input", return_value=""):
-            answer = QuizCLI._get_matching_answer(q, True, "", None)
-            assert answer is None
+        # Skipped once per item
+        fake_input("", "")
+        answer = QuizCLI._get_matching_answer(q, True, "", None)
+        assert answer is None
 
 
 class TestQuizCLIPromptInput:
@@ -402,14 +505,133 @@ class TestQuizCLIPromptInput:
 
     def test_prompt_input_without_timer(self):
         """Test basic prompt input without timer"""
-        with patch("builtins.input", return_value="test input"):
+        with patch("sys.stdin", io.StringIO("test input\n")):
             result = QuizCLI._prompt_input("Enter: ", None)
             assert result == "test input"
 
+    def test_read_line_writes_prompt(self, capsys):
+        """Test piped input writes the prompt and strips the newline"""
+        with patch("sys.stdin", io.StringIO("answer\n")):
+            result = QuizCLI._read_line("Enter: ")
+        assert result == "answer"
+        assert capsys.readouterr().out == "Enter: "
+
+    def test_read_line_eof(self):
+        """Test piped input raises EOFError at end of input"""
+        with patch("sys.stdin", io.StringIO("")):
+            with pytest.raises(EOFError):
+                QuizCLI._read_line("Enter: ")
+
+    def test_read_line_uses_input_for_tty(self):
+        """Test terminal input still goes through input() when readline is loaded"""
+        stdin = MagicMock()
+        stdin.isatty.return_value = True
+        with patch("sys.stdin", stdin), patch("builtins.input", return_value="typed"), \
+                patch.dict("sys.modules", {"readline": MagicMock()}):
+            assert QuizCLI._read_line("Enter: ") == "typed"
+
+    def test_read_line_tty_without_readline(self):
+        """Test terminal input is read directly when readline isn't loaded"""
+        stdin = MagicMock()
+        stdin.isatty.return_value = True
+        stdin.readline.return_value = "typed\n"
+        with patch("sys.stdin", stdin), patch.dict("sys.modules"):
+            sys.modules.pop("readline", None)
+            assert QuizCLI._read_line("Enter: ") == "typed"
+
+
+class TestQuizCLIPromptYesNo:
+    """Test the y/n prompt"""
+
+    def test_prompt_yesno_piped_yes(self):
+        """Test piped y answer"""
+        with patch("sys.stdin", io.StringIO("y\n")):
+            assert QuizCLI._prompt_yesno("Continue? ") is True
+
+    def test_prompt_yesno_piped_eof(self, capsys):
+        """Test end of input counts as no and ends the prompt line"""
+        with patch("sys.stdin", io.StringIO("")):
+            assert QuizCLI._prompt_yesno("Continue? ") is False
+        assert capsys.readouterr().out == "Continue? \n"
+
+    @pytest.mark.slow
+    def test_prompt_yesno_terminal_timeout(self):
+        """Test an unanswered terminal prompt gives up after the timeout"""
+        pty = pytest.importorskip("pty")
+        master_fd, slave_fd = pty.openpty()
+        try:
+            with open(slave_fd, "r", closefd=False) as stdin, patch("sys.stdin", stdin):
+                assert QuizCLI._prompt_yesno("Continue? ", timeout=0.05) is False
+        finally:
+            os.close(master_fd)
+            os.close(slave_fd)
+
+
+class TestQuizCLIAsyncInput:
+    """Test event-loop based answer input"""
+
+    @staticmethod
+    async def _answer(question, timer=None):
+        return await QuizCLI.get_answer_async(question, allow_skip=False, timer=timer)
+
+    def test_get_answer_async_fallback(self, mc3_q):
+        """Test stdin without a file descriptor is read in a worker thread"""
+        with patch("sys.stdin", io.StringIO("2\n")):
+            answer = asyncio.run(QuizCLI.get_answer_async(mc3_q, allow_skip=False))
+        assert answer == "B"
+
+    def test_get_answer_async_pipe(self, tf_q):
+        """Test answers read from a pipe through the event loop"""
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"1\n")
+        try:
+            with open(read_fd, "r", closefd=False) as stdin, patch("sys.stdin", stdin):
+                answer = asyncio.run(self._answer(tf_q))
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+        assert answer is True
+
+    def test_get_answer_async_leaves_stdin_blocking(self, tf_q):
+        """Test stdin stays in blocking mode and the next line is left unread"""
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"1\n2\n")
+        try:
+            with open(read_fd, "r", closefd=False) as stdin, patch("sys.stdin", stdin):
+                answer = asyncio.run(self._answer(tf_q))
+            assert os.get_blocking(read_fd) is True
+            assert os.read(read_fd, 16) == b"2\n"
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+        assert answer is True
+
+    @pytest.mark.slow
+    def test_get_answer_async_timeout(self, tf_q):
+        """Test the timer stops waiting for an answer that never arrives"""
+        read_fd, write_fd = os.pipe()
+        try:
+            with open(read_fd, "r", closefd=False) as stdin, patch("sys.stdin", stdin):
+                answer = asyncio.run(self._answer(tf_q, TimerDisplay(0.2)))
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+        assert answer is None
+
 
 class TestQuizCLIHelperMethods:
     """Test QuizCLI helper methods"""
 
+    def test_option_index(self):
+        """Test option numbers map to 0-based indices"""
+        assert QuizCLI._option_index("1") == 0
+        assert QuizCLI._option_index("9") == 8
+        assert QuizCLI._option_index("12") == 11
+        assert QuizCLI._option_index("0") is None
+        assert QuizCLI._option_index("01") is None
+        assert QuizCLI._option_index("a") is None
+        assert QuizCLI._option_index("") is None
+
     def test_get_status_icon_correct(self):
         """Test status icon for correct answer"""
         icon = QuizCLI._get_status_icon(ResultStatus.CORRECT)
@@ -458,15 +680,10 @@ class TestQuizCLIHelperMethods:
         captured = capsys.readouterr()
         assert len(captured.out) > 0
 
-    def test_color_constants_are_strings(self):
-        """Test that color constants are valid ANSI codes"""
-        assert isinstance(QuizCLI.BOLD, str)
-        assert isinstance(QuizCLI.GREEN, str)
-        assert isinstance(QuizCLI.RED, str)
-
-    def test_clear_line_defined(self):
-        """Test that clear line code is defined"""
-        assert hasattr(QuizCLI, "CLEAR_LINE")
+    def test_style_constants_defined(self):
+        """Test that color and clear line codes are defined as strings"""
+        for name in ("BOLD", "GREEN", "RED", "CLEAR_LINE"):
+            assert isinstance(getattr(QuizCLI, name), str), name
 
     def test_timer_warning_levels(self):
         """Test different timer warning levels"""
@@ -1,5 +1,15 @@
 """Core tests - question types, quiz, and results"""
+import asyncio
+import copy
+import json
+import sys
+import time
 import pytest
+from dataclasses import replace
+from itertools import chain, repeat
+from types import MappingProxyType
+from unittest.mock import patch
+from quizy import core
 from quizy.core import (
     Quiz,
     Question,
@@ -12,72 +22,83 @@ from quizy.core import (
     QuizResult,
     ResultStatus,
     QuestionType,
+    count_matches,
 )
 
 
+def make_provider(answers):
+    """Answer provider that returns the given answers in order, ignoring the question"""
+    next_answer = iter(answers).__next__
+    return lambda q, idx: next_answer()
+
+
+@pytest.fixture(scope="module")
+def base_result():
+    """Canonical correct result; tests derive variants with dataclasses.replace"""
+    return QuestionResult(
+        question_index=0,
+        user_answer="A",
+        correct_answer="A",
+        status=ResultStatus.CORRECT,
+        time_taken=5.0,
+        score=1.0,
+    )
+
+
+# Statuses bound once for the hand-built result lists below
+_CORRECT = ResultStatus.CORRECT
+_INCORRECT = ResultStatus.INCORRECT
+_SKIPPED = ResultStatus.SKIPPED
+_TIMEOUT = ResultStatus.TIMEOUT
+
+# Matching pairs shared read-only across TestMatchingQuestion
+PAIRS_AB = MappingProxyType({"A": "1", "B": "2"})
+PAIRS_ABC = MappingProxyType({"A": "1", "B": "2", "C": "3"})
+
+# Seven correct answers followed by three incorrect ones, shared read-only.
+# Scoring only reads status and score, so two instances are repeated.
+SEVEN_OF_TEN = list(chain(
+    repeat(QuestionResult(0, "A", "A", _CORRECT, 5.0, 1.0), 7),
+    repeat(QuestionResult(0, "B", "A", _INCORRECT, 5.0, 0.0), 3),
+))
+
+
 class TestQuestionResult:
     """Test QuestionResult class"""
 
-    def test_question_result_creation(self):
+    def test_question_result_creation(self, base_result):
         """Test creating a question result"""
-        result = QuestionResult(
-            question_index=0,
-            user_answer="A",
-            correct_answer="A",
-            status=ResultStatus.CORRECT,
-            time_taken=5.0,
-            score=1.0,
-        )
-        assert result.is_correct is True
-        assert result.is_partial is False
+        assert base_result.is_correct is True
+        assert base_result.is_partial is False
 
-    def test_question_result_partial(self):
+    def test_question_result_partial(self, base_result):
         """Test partial credit result"""
-        result = QuestionResult(
-            question_index=0,
+        result = replace(
+            base_result,
             user_answer=["A", "B"],
             correct_answer=["A", "B", "C"],
             status=ResultStatus.PARTIAL,
-            time_taken=5.0,
             score=0.66,
         )
         assert result.is_correct is False
         assert result.is_partial is True
 
-    def test_question_result_to_dict(self):
+    def test_question_result_to_dict(self, base_result):
         """Test converting result to dictionary"""
-        result = QuestionResult(
-            question_index=0,
-            user_answer="A",
-            correct_answer="A",
-            status=ResultStatus.CORRECT,
-            time_taken=5.0,
-            score=1.0,
-        )
-        result_dict = result.to_dict()
+        result_dict = base_result.to_dict()
         assert result_dict["question_index"] == 0
         assert result_dict["status"] == "correct"
         assert result_dict["score"] == 1.0
 
-    def test_question_result_incorrect(self):
+    def test_question_result_incorrect(self, base_result):
         """Test incorrect question result"""
-        result = QuestionResult(
-            question_index=0,
-            user_answer="B",
-            correct_answer="A",
-            status=ResultStatus.INCORRECT,
-            time_taken=5.0,
-        )
+        result = replace(base_result, user_answer="B", status=ResultStatus.INCORRECT, score=0.0)
         assert result.is_correct is False
 
-    def test_question_result_timeout(self):
+    def test_question_result_timeout(self, base_result):
         """Test timeout result"""
-        result = QuestionResult(
-            question_index=0,
-            user_answer=None,
-            correct_answer="A",
-            status=ResultStatus.TIMEOUT,
-            time_taken=30.0,
+        result = replace(
+            base_result, user_answer=None, status=ResultStatus.TIMEOUT, time_taken=30.0, score=0.0
         )
         assert result.status == ResultStatus.TIMEOUT
         assert result.is_correct is False
@@ -98,6 +119,18 @@ class TestQuizResult:
         assert result.total_questions == 5
         assert result.correct_answers == 4
 
+    def test_totals_follow_edited_results(self):
+        """Test totals reflect results replaced or edited after a first read"""
+        result = QuizResult(title="Test", total_questions=10, correct_answers=7, time_taken=50.0)
+        result.question_results = [replace(r) for r in SEVEN_OF_TEN]
+        assert result.score_percentage == 70.0
+        result.question_results[0] = replace(result.question_results[0], score=0.0, status=_SKIPPED)
+        result.question_results[1].status = _TIMEOUT
+        result.question_results[1].score = 0.0
+        assert result.score_percentage == 50.0
+        assert result.skipped_count == 1
+        assert result.timeout_count == 1
+
     def test_quiz_result_score_percentage(self):
         """Test score percentage calculation"""
         result = QuizResult(
@@ -106,13 +139,7 @@ class TestQuizResult:
             correct_answers=7,
             time_taken=50.0,
         )
-        result.question_results = [
-            QuestionResult(i, "A", "A", ResultStatus.CORRECT, 5.0, 1.0)
-            for i in range(7)
-        ] + [
-            QuestionResult(i, "B", "A", ResultStatus.INCORRECT, 5.0, 0.0)
-            for i in range(7, 10)
-        ]
+        result.question_results = SEVEN_OF_TEN[:]
         assert result.score_percentage == 70.0
 
     def test_quiz_result_skipped_count(self):
@@ -124,9 +151,9 @@ class TestQuizResult:
             time_taken=25.0,
         )
         result.question_results = [
-            QuestionResult(0, "A", "A", ResultStatus.CORRECT, 5.0, 1.0),
-            QuestionResult(1, None, "B", ResultStatus.SKIPPED, 0.0, 0.0),
-            QuestionResult(2, None, "C", ResultStatus.SKIPPED, 0.0, 0.0),
+            QuestionResult(0, "A", "A", _CORRECT, 5.0, 1.0),
+            QuestionResult(1, None, "B", _SKIPPED, 0.0, 0.0),
+            QuestionResult(2, None, "C", _SKIPPED, 0.0, 0.0),
         ]
         assert result.skipped_count == 2
 
@@ -139,11 +166,31 @@ class TestQuizResult:
             time_taken=25.0,
         )
         result.question_results = [
-            QuestionResult(0, "A", "A", ResultStatus.CORRECT, 5.0, 1.0),
-            QuestionResult(1, None, "B", ResultStatus.TIMEOUT, 10.0, 0.0),
+            QuestionResult(0, "A", "A", _CORRECT, 5.0, 1.0),
+            QuestionResult(1, None, "B", _TIMEOUT, 10.0, 0.0),
         ]
         assert result.timeout_count == 1
 
+    def test_quiz_result_counts_follow_appends(self):
+        """Test cached counts are refreshed when results are added"""
+        result = QuizResult(
+            title="Test",
+            total_questions=2,
+            correct_answers=1,
+            time_taken=10.0,
+        )
+        result.question_results.append(
+            QuestionResult(0, "A", "A", ResultStatus.CORRECT, 5.0, 1.0)
+        )
+        assert result.score_percentage == 50.0
+        assert result.skipped_count == 0
+
+        result.question_results.append(
+            QuestionResult(1, None, "B", ResultStatus.SKIPPED, 0.0, 0.0)
+        )
+        assert result.skipped_count == 1
+        assert result.timeout_count == 0
+
     def test_quiz_result_average_time_per_question(self):
         """Test average time per question"""
         result = QuizResult(
@@ -167,6 +214,70 @@ class TestQuizResult:
         assert result_dict["total_questions"] == 2
         assert result_dict["correct_answers"] == 2
 
+    def test_quiz_result_to_records(self):
+        """Test tabular export matches the per-row dictionaries"""
+        result = QuizResult(
+            title="Test",
+            total_questions=1,
+            correct_answers=1,
+            time_taken=5.0,
+            question_results=[QuestionResult(0, "A", "A", ResultStatus.CORRECT, 5.0, 1.0)],
+        )
+        columns, rows = result.to_records()
+        assert [dict(zip(columns, row)) for row in rows] == result.to_dict()["question_results"]
+
+    def test_quiz_result_to_columns(self):
+        """Test column export transposes the tabular rows"""
+        result = QuizResult(
+            title="Test",
+            total_questions=2,
+            correct_answers=1,
+            time_taken=5.0,
+            question_results=[
+                QuestionResult(0, "A", "A", ResultStatus.CORRECT, 2.0, 1.0),
+                QuestionResult(1, None, "B", ResultStatus.SKIPPED, 3.0, 0.0),
+            ],
+        )
+        columns = result.to_columns()
+        assert columns["score"] == [1.0, 0.0]
+        assert columns["status"] == ["correct", "skipped"]
+        assert QuizResult("Empty", 0, 0, 0.0).to_columns()["score"] == []
+
+    def test_quiz_result_to_dict_without_details(self):
+        """Test summary export leaves out per-question results"""
+        result = QuizResult(
+            title="Test",
+            total_questions=1,
+            correct_answers=1,
+            time_taken=5.0,
+            question_results=[QuestionResult(0, "A", "A", ResultStatus.CORRECT, 5.0, 1.0)],
+        )
+        summary = result.to_dict(include_details=False)
+        assert "question_results" not in summary
+        assert summary == result.to_summary_dict()
+        assert list(result.iter_question_results()) == result.to_dict()["question_results"]
+
+    def test_quiz_result_to_json(self):
+        """Test JSON export round-trips to the dictionary form"""
+        result = QuizResult(
+            title="Test",
+            total_questions=1,
+            correct_answers=1,
+            time_taken=5.0,
+            question_results=[QuestionResult(0, "A", "A", ResultStatus.CORRECT, 5.0, 1.0)],
+        )
+        assert json.loads(result.to_json()) == result.to_dict()
+        assert "question_results" not in json.loads(result.to_json(include_details=False))
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_results_have_no_instance_dict(self):
+        """Test result dataclasses store fields in slots"""
+        question_result = QuestionResult(0, "A", "A", ResultStatus.CORRECT, 5.0, 1.0)
+        result = QuizResult("Test", 1, 1, 5.0, question_results=[question_result])
+        assert not hasattr(question_result, "__dict__")
+        assert not hasattr(result, "__dict__")
+        assert result.score_percentage == 100.0
+
     def test_quiz_result_with_zero_questions(self):
         """Test results with zero questions"""
         result = QuizResult(
@@ -219,27 +330,47 @@ class TestQuestionBaseClass:
         q = Question("Q?", "A")
         assert q.get_options() is None
 
+    def test_question_types_have_no_instance_dict(self):
+        """Test built-in question types store attributes in slots"""
+        questions = [
+            Question("Q?", "A"),
+            MultipleChoiceQuestion("Q?", ["A", "B"], "A"),
+            MultipleSelectQuestion("Q?", ["A", "B", "C"], ["A", "B"]),
+            ShortTextQuestion("Q?", "A"),
+            TrueFalseQuestion("Q?", True),
+            MatchingQuestion("Q?", {"a": "1", "b": "2"}),
+        ]
+        for q in questions:
+            assert not hasattr(q, "__dict__")
+
+    def test_questions_can_key_caches(self):
+        """Test questions hash by identity, so equal-looking questions stay distinct"""
+        q1 = MultipleChoiceQuestion("Q?", ["A", "B"], "A")
+        q2 = MultipleChoiceQuestion("Q?", ["A", "B"], "A")
+        graded = {(q1, "A"): True, (q2, "B"): False}
+        assert graded[(q1, "A")] is True
+        assert (q2, "A") not in graded
+
+
+@pytest.fixture(scope="class")
+def mc_2plus2():
+    """Shared by the read-only answer checks"""
+    return MultipleChoiceQuestion(
+        text="What is 2+2?", options=["3", "4", "5"], correct_answer="4"
+    )
+
 
 class TestMultipleChoiceQuestion:
     """Test multiple choice questions"""
 
-    def test_check_correct_answer(self):
-        q = MultipleChoiceQuestion(
-            text="What is 2+2?", options=["3", "4", "5"], correct_answer="4"
-        )
-        assert q.check_answer("4") is True
+    def test_check_correct_answer(self, mc_2plus2):
+        assert mc_2plus2.check_answer("4") is True
 
-    def test_check_incorrect_answer(self):
-        q = MultipleChoiceQuestion(
-            text="What is 2+2?", options=["3", "4", "5"], correct_answer="4"
-        )
-        assert q.check_answer("3") is False
+    def test_check_incorrect_answer(self, mc_2plus2):
+        assert mc_2plus2.check_answer("3") is False
 
-    def test_get_option_by_index(self):
-        q = MultipleChoiceQuestion(
-            text="What is 2+2?", options=["3", "4", "5"], correct_answer="4"
-        )
-        assert q.get_option_by_index(2) == "4"
+    def test_get_option_by_index(self, mc_2plus2):
+        assert mc_2plus2.get_option_by_index(2) == "4"
 
     def test_validation(self):
         q = MultipleChoiceQuestion(
@@ -270,7 +401,7 @@ class TestMultipleChoiceQuestion:
         )
         display1 = q.display_options
         display2 = q.display_options
-        assert display1 == display2
+        assert display1 is display2
 
     def test_no_shuffle(self):
         """Test non-shuffled options"""
@@ -281,6 +412,7 @@ class TestMultipleChoiceQuestion:
             shuffle_options=False,
         )
         assert q.display_options == ["A", "B", "C"]
+        assert q.display_options is q.options
 
     def test_option_index_zero(self):
         """Test get_option_by_index with 0 (invalid)"""
@@ -288,10 +420,9 @@ class TestMultipleChoiceQuestion:
         result = q.get_option_by_index(0)
         assert result is None
 
-    def test_option_index_out_of_range(self):
+    def test_option_index_out_of_range(self, mc_ab):
         """Test get_option_by_index out of range"""
-        q = MultipleChoiceQuestion("Q?", ["A", "B"], "A")
-        result = q.get_option_by_index(10)
+        result = mc_ab.get_option_by_index(10)
         assert result is None
 
     def test_with_all_options(self):
@@ -305,32 +436,48 @@ class TestMultipleChoiceQuestion:
         assert q.check_answer("Option A") is False
 
 
+@pytest.fixture(scope="class")
+def ms_languages():
+    """Shared by the read-only answer checks"""
+    return MultipleSelectQuestion(
+        text="Select correct",
+        options=["Python", "JavaScript", "HTML", "Java"],
+        correct_answers=["Python", "JavaScript", "Java"],
+    )
+
+
 class TestMultipleSelectQuestion:
     """Test multiple select questions"""
 
-    def test_check_all_correct(self):
-        q = MultipleSelectQuestion(
-            text="Select correct",
-            options=["Python", "JavaScript", "HTML", "Java"],
-            correct_answers=["Python", "JavaScript", "Java"],
-        )
-        assert q.check_answer(["Python", "JavaScript", "Java"]) is True
+    @pytest.mark.parametrize("container", [list, tuple, frozenset])
+    def test_check_all_correct(self, ms_languages, container):
+        assert ms_languages.check_answer(container(("Python", "JavaScript", "Java"))) is True
 
-    def test_missing_one_answer(self):
+    def test_check_set_and_tuple_answers(self):
         q = MultipleSelectQuestion(
             text="Select correct",
             options=["Python", "JavaScript", "HTML", "Java"],
-            correct_answers=["Python", "JavaScript", "Java"],
+            correct_answers=["Python", "Java"],
         )
-        assert q.check_answer(["Python", "Java"]) is False
+        assert q.check_answer({"Python", "Java"}) is True
+        assert q.check_answer(("Java", "Python")) is True
+        assert q.check_answer("Python") is False
 
-    def test_extra_incorrect_answer(self):
-        q = MultipleSelectQuestion(
-            text="Select correct",
-            options=["Python", "JavaScript", "HTML", "Java"],
-            correct_answers=["Python", "JavaScript", "Java"],
-        )
-        assert q.check_answer(["Python", "JavaScript", "Java", "HTML"]) is False
+    @pytest.mark.parametrize("container", [list, tuple, frozenset])
+    def test_missing_one_answer(self, ms_languages, container):
+        assert ms_languages.check_answer(container(("Python", "Java"))) is False
+
+    @pytest.mark.parametrize("container", [list, tuple, frozenset])
+    def test_extra_incorrect_answer(self, ms_languages, container):
+        assert ms_languages.check_answer(container(("Python", "JavaScript", "Java", "HTML"))) is False
+
+    def test_reports_every_answer_missing_from_options(self):
+        with pytest.raises(ValueError, match=r"\['X', 'Y'\]"):
+            MultipleSelectQuestion(
+                text="Q?",
+                options=["A", "B"],
+                correct_answers=["X", "A", "Y"],
+            )
 
     def test_requires_minimum_two_answers(self):
         with pytest.raises(ValueError):
@@ -358,7 +505,7 @@ class TestMultipleSelectQuestion:
             allow_partial_credit=True
         )
         result = q.check_answer(["A"])
-        assert result == 0.5
+        assert result == pytest.approx(0.5, abs=1e-9)
 
     def test_wrong_answers_no_partial_credit(self):
         """Test multiple select all wrong without partial credit"""
@@ -401,7 +548,22 @@ class TestMultipleSelectQuestion:
             allow_partial_credit=True
         )
         result = q.check_answer(["B", "D"])
-        assert result == pytest.approx(2/3)
+        assert result == pytest.approx(2/3, abs=1e-9)
+
+    def test_correct_answer_change_applies_to_later_checks(self):
+        """Test reassigning correct_answer after construction is honoured"""
+        q = MultipleSelectQuestion("Q?", ["A", "B", "C"], ["A", "B"])
+        q.correct_answer = ["B", "C"]
+        assert q.check_answer(["B", "C"]) is True
+        assert q.check_answer(["A", "B"]) is False
+
+    def test_correct_answer_appended_in_place(self):
+        """Test an answer appended to the existing list is graded"""
+        q = MultipleSelectQuestion("Q?", ["A", "B", "C"], ["A", "B"])
+        assert q.check_answer(["A", "B"]) is True
+        q.correct_answer.append("C")
+        assert q.check_answer(["A", "B"]) is False
+        assert q.check_answer(["A", "B", "C"]) is True
 
     def test_validate_config(self):
         """Test validation of multiple select"""
@@ -421,104 +583,72 @@ class TestMultipleSelectQuestion:
         )
         display1 = q.display_options
         display2 = q.display_options
-        assert display1 == display2
+        assert display1 is display2
 
 
 class TestShortTextQuestion:
     """Test short text questions"""
 
-    def test_case_insensitive_match(self):
-        q = ShortTextQuestion(
-            text="What year?", correct_answer="1991", case_sensitive=False
-        )
-        assert q.check_answer("1991") is True
-        assert q.check_answer("1992") is False
-
-    def test_case_sensitive_match(self):
-        q = ShortTextQuestion(
-            text="Symbol?", correct_answer="Au", case_sensitive=True
-        )
-        assert q.check_answer("Au") is True
-        assert q.check_answer("au") is False
-
-    def test_accepted_variations(self):
-        q = ShortTextQuestion(
-            text="Symbol?",
-            correct_answer="Au",
-            case_sensitive=True,
-            accepted_variations=["au", "AU"],
-        )
-        assert q.check_answer("Au") is True
-        assert q.check_answer("au") is True
-        assert q.check_answer("AU") is True
-        assert q.check_answer("ag") is False
-
-    def test_whitespace_trimming(self):
-        q = ShortTextQuestion(text="Year?", correct_answer="1991")
-        assert q.check_answer("  1991  ") is True
-
-    def test_with_explanation(self):
-        """Test short text question with explanation"""
-        q = ShortTextQuestion(
-            "Q?",
-            "answer",
-            explanation="This is the answer"
-        )
-        assert q.explanation == "This is the answer"
-
-    def test_with_time_limit(self):
-        """Test short text with time limit"""
-        q = ShortTextQuestion("Q?", "answer", time_limit=30.0)
-        assert q.time_limit == 30.0
-
-    def test_with_metadata(self):
-        """Test short text with metadata"""
-        q = ShortTextQuestion(
-            "Q?",
-            "answer",
-            metadata={"difficulty": "hard"}
-        )
-        assert q.metadata["difficulty"] == "hard"
-
-    def test_case_sensitive_false(self):
-        """Test case insensitive matching"""
-        q = ShortTextQuestion(
-            text="Q?", correct_answer="Python", case_sensitive=False
-        )
-        assert q.check_answer("python") is True
-        assert q.check_answer("PYTHON") is True
-
-    def test_accepted_variations_with_case_sensitive(self):
-        """Test accepted variations with case sensitivity"""
-        q = ShortTextQuestion(
-            text="Q?",
-            correct_answer="Au",
-            case_sensitive=True,
-            accepted_variations=["gold"],
-        )
-        assert q.check_answer("Au") is True
-        assert q.check_answer("gold") is True
-        assert q.check_answer("au") is False
-
-    def test_whitespace_with_variations(self):
-        """Test whitespace trimming with variations"""
-        q = ShortTextQuestion(
-            text="Q?",
-            correct_answer="hello",
-            accepted_variations=["hi"],
-        )
-        assert q.check_answer("  hello  ") is True
-        assert q.check_answer("  hi  ") is True
-
-    def test_no_variations_exact_case(self):
-        """Test short text without variations - exact case match"""
-        q = ShortTextQuestion(
-            "Q?",
-            "Hello",
-            case_sensitive=True
-        )
-        assert q.check_answer("Hello") is True
-        assert q.check_answer("hello") is False
+    @pytest.mark.parametrize(
+        "kwargs,answer,expected",
+        [
+            ({"correct_answer": "1991", "case_sensitive": False}, "1991", True),
+            ({"correct_answer": "1991", "case_sensitive": False}, "1992", False),
+            ({"correct_answer": "Au", "case_sensitive": True}, "Au", True),
+            ({"correct_answer": "Au", "case_sensitive": True}, "au", False),
+            ({"correct_answer": " Paris ", "accepted_variations": ["Paris, France\n"]}, "paris", True),
+            ({"correct_answer": " Paris ", "accepted_variations": ["Paris, France\n"]}, "  paris, france ", True),
+            ({"correct_answer": "Au", "case_sensitive": True, "accepted_variations": ["au", "AU"]}, "Au", True),
+            ({"correct_answer": "Au", "case_sensitive": True, "accepted_variations": ["au", "AU"]}, "au", True),
+            ({"correct_answer": "Au", "case_sensitive": True, "accepted_variations": ["au", "AU"]}, "AU", True),
+            ({"correct_answer": "Au", "case_sensitive": True, "accepted_variations": ["au", "AU"]}, "ag", False),
+            ({"correct_answer": "1991"}, "  1991  ", True),
+            ({"correct_answer": "Python", "case_sensitive": False}, "python", True),
+            ({"correct_answer": "Python", "case_sensitive": False}, "PYTHON", True),
+            ({"correct_answer": "Au", "case_sensitive": True, "accepted_variations": ["gold"]}, "Au", True),
+            ({"correct_answer": "Au", "case_sensitive": True, "accepted_variations": ["gold"]}, "gold", True),
+            ({"correct_answer": "Au", "case_sensitive": True, "accepted_variations": ["gold"]}, "au", False),
+            ({"correct_answer": "hello", "accepted_variations": ["hi"]}, "  hello  ", True),
+            ({"correct_answer": "hello", "accepted_variations": ["hi"]}, "  hi  ", True),
+            ({"correct_answer": "Hello", "case_sensitive": True}, "Hello", True),
+            ({"correct_answer": "Hello", "case_sensitive": True}, "hello", False),
+            ({"correct_answer": "answer", "accepted_variations": []}, "answer", True),
+            ({"correct_answer": "hello", "accepted_variations": ["hi", "hey", "howdy"]}, "hi", True),
+            ({"correct_answer": "hello", "accepted_variations": ["hi", "hey", "howdy"]}, "hey", True),
+            ({"correct_answer": "hello", "accepted_variations": ["hi", "hey", "howdy"]}, "goodbye", False),
+            ({"correct_answer": "primary", "case_sensitive": False, "accepted_variations": ["backup"]}, "PRIMARY", True),
+            ({"correct_answer": "primary", "case_sensitive": False, "accepted_variations": ["backup"]}, "BACKUP", True),
+        ],
+    )
+    def test_check_answer(self, kwargs, answer, expected):
+        """Test matching against the answer and variations, by case and whitespace"""
+        q = ShortTextQuestion(text="Q?", **kwargs)
+        assert q.check_answer(answer) is expected
+
+    def test_attribute_changes_apply_to_later_checks(self):
+        """Test reassigning the answer settings after construction is honoured"""
+        q = ShortTextQuestion("Q?", "Paris")
+        assert q.check_answer("paris") is True
+        q.case_sensitive = True
+        assert q.check_answer("paris") is False
+        q.accepted_variations = ["paris"]
+        assert q.check_answer("paris") is True
+        q.correct_answer = "Lyon"
+        assert q.check_answer("Paris") is False
+        assert q.check_answer("Lyon") is True
+
+    def test_variation_appended_in_place(self):
+        """Test a variation appended to the existing list is accepted"""
+        q = ShortTextQuestion("Q?", "Paris", accepted_variations=["Paname"])
+        assert q.check_answer("ville lumiere") is False
+        q.accepted_variations.append("Ville Lumiere")
+        assert q.check_answer("ville lumiere") is True
+
+    def test_non_string_answer_fails_at_check_time(self):
+        """Test a non-str correct answer is only rejected when it is checked"""
+        q = ShortTextQuestion("Q?", 1991)
+        with pytest.raises(AttributeError):
+            q.check_answer("1991")
 
     def test_validate_config(self):
         """Test validation of short text"""
@@ -537,113 +667,50 @@ class TestShortTextQuestion:
         q = ShortTextQuestion("Q?", "answer")
         assert q.get_options() is None
 
-    def test_empty_variations_list(self):
-        """Test short text with empty variations"""
-        q = ShortTextQuestion(
-            "Q?",
-            "answer",
-            accepted_variations=[]
-        )
-        assert q.check_answer("answer") is True
-
-    def test_accepted_variations_list(self):
-        """Test short text with accepted variations list"""
-        q = ShortTextQuestion(
-            "Q?",
-            "hello",
-            accepted_variations=["hi", "hey", "howdy"]
-        )
-        assert q.check_answer("hi") is True
-        assert q.check_answer("hey") is True
-        assert q.check_answer("goodbye") is False
-
-    def test_with_variations_case_insensitive_mixed(self):
-        """Test case insensitive with variations"""
-        q = ShortTextQuestion(
-            "Q?",
-            "primary",
-            case_sensitive=False,
-            accepted_variations=["backup"]
-        )
-        assert q.check_answer("PRIMARY") is True
-        assert q.check_answer("BACKUP") is True
-
 
 class TestTrueFalseQuestion:
     """Test true/false questions"""
 
-    def test_boolean_true(self):
-        q = TrueFalseQuestion(text="Is true?", correct_answer=True)
-        assert q.check_answer(True) is True
-        assert q.check_answer(False) is False
-
-    def test_string_true_variations(self):
-        q = TrueFalseQuestion(text="Is true?", correct_answer=True)
-        assert q.check_answer("true") is True
-        assert q.check_answer("yes") is True
-        assert q.check_answer("y") is True
-        assert q.check_answer("1") is True
+    @pytest.mark.parametrize(
+        "correct_answer,answer,expected",
+        [
+            (True, True, True),
+            (True, False, False),
+            (True, "true", True),
+            (True, "yes", True),
+            (True, "YES", True),
+            (True, "y", True),
+            (True, "1", True),
+            (True, 1, True),
+            (True, 42, True),
+            (False, False, True),
+            (False, True, False),
+            (False, "false", True),
+            (False, "no", True),
+            (False, "0", True),
+            (False, 0, True),
+            (False, 0.0, True),
+        ],
+    )
+    def test_check_answer(self, correct_answer, answer, expected):
+        """Test bools, string spellings and numbers against the statement"""
+        q = TrueFalseQuestion(text="Q?", correct_answer=correct_answer)
+        assert q.check_answer(answer) is expected
+
+    def test_other_answer_types(self):
+        class Text(str):
+            pass
 
-    def test_numeric_true(self):
         q = TrueFalseQuestion(text="Is true?", correct_answer=True)
-        assert q.check_answer(1) is True
-        assert q.check_answer(42) is True
-
-    def test_boolean_false(self):
-        q = TrueFalseQuestion(text="Is false?", correct_answer=False)
-        assert q.check_answer(False) is True
-        assert q.check_answer(True) is False
-
-    def test_string_false_variations(self):
-        q = TrueFalseQuestion(text="Is false?", correct_answer=False)
-        assert q.check_answer("false") is True
-        assert q.check_answer("no") is True
-        assert q.check_answer("0") is True
-
-    def test_numeric_false(self):
-        q = TrueFalseQuestion(text="Is false?", correct_answer=False)
-        assert q.check_answer(0) is True
+        for _ in range(2):  # second round is served from the cached dispatch
+            assert q.check_answer(Text(" Yes ")) is True
+            assert q.check_answer(None) is False
+            assert q.check_answer(["true"]) is False
 
     def test_non_boolean_raises_error(self):
         with pytest.raises(ValueError):
             TrueFalseQuestion(text="Q?", correct_answer="true")
 
-    def test_with_explanation(self):
-        """Test true/false with explanation"""
-        q = TrueFalseQuestion(
-            "Q?",
-            True,
-            explanation="True because..."
-        )
-        assert q.explanation == "True because..."
-
-    def test_yes_variation(self):
-        """Test 'yes' as true"""
-        q = TrueFalseQuestion("Q?", True)
-        assert q.check_answer("yes") is True
-
-    def test_no_variation(self):
-        """Test 'no' as false"""
-        q = TrueFalseQuestion("Q?", False)
-        assert q.check_answer("no") is True
-
-    def test_string_yes_lowercase(self):
-        """Test true with lowercase 'yes'"""
-        q = TrueFalseQuestion("Q?", True)
-        assert q.check_answer("YES") is True
-
-    def test_with_float_zero(self):
-        """Test false with float zero"""
-        q = TrueFalseQuestion("Q?", False)
-        assert q.check_answer(0.0) is True
-
-    def test_with_1_and_0(self):
-        """Test 1 as true and 0 as false"""
-        q_true = TrueFalseQuestion("?", True)
-        q_false = TrueFalseQuestion("?", False)
-        assert q_true.check_answer(1) is True
-        assert q_false.check_answer(0) is True
-
     def test_validate_config(self):
         """Test true/false validation"""
         q = TrueFalseQuestion("Q?", True)
@@ -660,57 +727,46 @@ class TestTrueFalseQuestion:
 class TestMatchingQuestion:
     """Test matching questions"""
 
-    def test_correct_match(self):
+    def test_partial_credit_ignores_unknown_none_match(self):
         q = MatchingQuestion(
             text="Match",
-            pairs={"France": "Paris", "Germany": "Berlin", "Italy": "Rome"},
-        )
-        assert (
-            q.check_answer(
-                {"France": "Paris", "Germany": "Berlin", "Italy": "Rome"}
-            )
-            is True
-        )
-
-    def test_one_wrong_match(self):
-        q = MatchingQuestion(
-            text="Match", pairs={"France": "Paris", "Germany": "Berlin"}
-        )
-        assert q.check_answer({"France": "Berlin", "Germany": "Berlin"}) is False
+            pairs={"France": "Paris", "Germany": "Berlin"},
+            allow_partial_credit=True,
+        )
+        assert q.check_answer({"France": "Paris", "Spain": None}) == pytest.approx(0.5, abs=1e-9)
+        assert q.check_answer({"France": "Paris", "Germany": "Berlin"}) is True
+
+    @pytest.mark.parametrize(
+        "pairs,partial,answer,expected",
+        [
+            (PAIRS_ABC, False, {"A": "1", "B": "2", "C": "3"}, True),
+            (PAIRS_AB, False, {"A": "2", "B": "2"}, False),
+            (PAIRS_AB, False, {"A": "1", "B": "2"}, True),
+            (PAIRS_AB, True, {"A": "1", "B": "2"}, True),
+            (PAIRS_AB, True, {"A": "1", "B": "1"}, 0.5),
+            (PAIRS_AB, True, {"A": "1", "B": "wrong"}, 0.5),
+        ],
+    )
+    def test_check_answer(self, pairs, partial, answer, expected):
+        """Test full matches score True and partial credit scores the matched share"""
+        q = MatchingQuestion("Match", pairs, allow_partial_credit=partial)
+        result = q.check_answer(answer)
+        assert result == pytest.approx(expected, abs=1e-9)
+        assert type(result) is type(expected)
 
     def test_wrong_type(self):
-        q = MatchingQuestion(
-            text="Match", pairs={"France": "Paris", "Germany": "Berlin"}
-        )
+        q = MatchingQuestion(text="Match", pairs=PAIRS_AB)
         assert q.check_answer(["France", "Paris"]) is False
 
     def test_minimum_two_pairs_required(self):
         with pytest.raises(ValueError):
             MatchingQuestion(text="Q?", pairs={"a": "1"})
 
-    def test_with_explanation(self):
-        """Test matching with explanation"""
-        q = MatchingQuestion(
-            "Match",
-            {"A": "1", "B": "2"},
-            explanation="Match the pairs"
-        )
-        assert q.explanation == "Match the pairs"
-
-    def test_with_time_limit(self):
-        """Test matching with time limit"""
-        q = MatchingQuestion(
-            "Match",
-            {"A": "1", "B": "2"},
-            time_limit=60.0
-        )
-        assert q.time_limit == 60.0
-
     def test_shuffle_answers_caching(self):
         """Test matching answers are cached after shuffle"""
         q = MatchingQuestion(
             "Match",
-            {"A": "1", "B": "2", "C": "3"},
+            PAIRS_ABC,
             shuffle_answers=True
         )
         first = q.display_answers
@@ -719,25 +775,15 @@ class TestMatchingQuestion:
 
     def test_wrong_type_input(self):
         """Test matching with wrong input type"""
-        q = MatchingQuestion("Match", {"A": "1", "B": "2"})
+        q = MatchingQuestion("Match", PAIRS_AB)
         result = q.check_answer("not a dict")
         assert result is False
 
-    def test_partial_correct(self):
-        """Test matching with partial credit"""
-        q = MatchingQuestion(
-            "Match",
-            {"A": "1", "B": "2"},
-            allow_partial_credit=True
-        )
-        result = q.check_answer({"A": "1", "B": "wrong"})
-        assert result == 0.5
-
     def test_no_shuffle(self):
         """Test matching without shuffling"""
         q = MatchingQuestion(
             "Match",
-            {"A": "1", "B": "2"},
+            PAIRS_AB,
             shuffle_answers=False
         )
         answers = q.display_answers
@@ -745,19 +791,19 @@ class TestMatchingQuestion:
 
     def test_validate_config(self):
         """Test matching validation"""
-        q = MatchingQuestion("Q?", {"A": "1", "B": "2"})
+        q = MatchingQuestion("Q?", PAIRS_AB)
         is_valid, error = q.validate_config()
         assert is_valid is True
 
     def test_validate_config_empty_text(self):
         """Test matching validation with empty text"""
-        q = MatchingQuestion("", {"A": "1", "B": "2"})
+        q = MatchingQuestion("", PAIRS_AB)
         is_valid, error = q.validate_config()
         assert is_valid is False
 
     def test_get_options(self):
         """Test matching get_options returns dict"""
-        q = MatchingQuestion("Q?", {"A": "1", "B": "2"})
+        q = MatchingQuestion("Q?", PAIRS_AB)
         options = q.get_options()
         assert isinstance(options, dict)
         assert "prompts" in options
@@ -773,14 +819,37 @@ class TestMatchingQuestion:
         assert set(options["prompts"]) == set(pairs.keys())
         assert set(options["answers"]) == set(pairs.values())
 
-    def test_all_correct_partial_credit_disabled(self):
-        """Test matching full credit when partial disabled"""
-        q = MatchingQuestion(
-            "Match",
-            {"A": "1", "B": "2"},
-            allow_partial_credit=False
+
+@pytest.fixture(scope="class")
+def prototype_quiz():
+    """Two-question quiz built once per class; tests get copies via ``quiz``"""
+    quiz = Quiz("Test")
+    quiz.add_question(MultipleChoiceQuestion("Q1?", ["A", "B"], "A"))
+    quiz.add_question(MultipleChoiceQuestion("Q2?", ["X", "Y"], "X"))
+    return quiz
+
+
+@pytest.fixture
+def quiz(prototype_quiz):
+    """Shallow copy of the prototype with its own question list, safe to mutate"""
+    clone = copy.copy(prototype_quiz)
+    clone.questions = list(prototype_quiz.questions)
+    return clone
+
+
+@pytest.fixture(scope="module")
+def simple_result():
+    """Result of answering a one-question quiz correctly, for tests that only read it"""
+    quiz = Quiz("Test")
+    quiz.add_question(
+        MultipleChoiceQuestion(
+            "What is 2+2?",
+            ["3", "4", "5"],
+            correct_answer="4",
+            explanation="2+2 equals 4",
         )
-        assert q.check_answer({"A": "1", "B": "2"}) is True
+    )
+    return quiz.execute(answer_provider=make_provider(["4"]))
 
 
 class TestQuiz:
@@ -794,14 +863,7 @@ class TestQuiz:
         quiz.add_question(TrueFalseQuestion("Q2?", correct_answer=True))
 
         answers = ["A", True]
-        answer_idx = [0]
-
-        def answer_provider(q, idx):
-            answer = answers[answer_idx[0]]
-            answer_idx[0] += 1
-            return answer
-
-        result = quiz.execute(answer_provider=answer_provider)
+        result = quiz.execute(answer_provider=make_provider(answers))
 
         assert result.correct_answers == 2
         assert result.score_percentage == 100.0
@@ -816,14 +878,7 @@ class TestQuiz:
         )
 
         answers = ["A", "Y"]
-        answer_idx = [0]
-
-        def answer_provider(q, idx):
-            answer = answers[answer_idx[0]]
-            answer_idx[0] += 1
-            return answer
-
-        result = quiz.execute(answer_provider=answer_provider)
+        result = quiz.execute(answer_provider=make_provider(answers))
 
         assert result.correct_answers == 1
         assert result.score_percentage == 50.0
@@ -840,17 +895,184 @@ class TestQuiz:
         )
 
         answers = [None, "Y"]
-        answer_idx = [0]
+        result = quiz.execute(answer_provider=make_provider(answers))
+
+        assert result.skipped_count == 1
+        assert result.correct_answers == 1
+
+    def test_execute_counts_match_a_rescan(self):
+        quiz = Quiz("Test", allow_skip=True)
+        quiz.add_question(MultipleChoiceQuestion("Q1?", ["A", "B"], correct_answer="A"))
+        quiz.add_question(MultipleChoiceQuestion("Q2?", ["A", "B"], correct_answer="A"))
+        quiz.add_question(
+            MatchingQuestion("M?", {"a": "1", "b": "2"}, allow_partial_credit=True)
+        )
+        answers = iter(["A", None, {"a": "1", "b": "1"}])
+
+        result = quiz.execute(answer_provider=lambda q, idx: next(answers))
+
+        rescanned = QuizResult(
+            title=result.title,
+            total_questions=result.total_questions,
+            correct_answers=result.correct_answers,
+            time_taken=result.time_taken,
+            question_results=list(result.question_results),
+        )
+        assert result.score_percentage == rescanned.score_percentage == 50.0
+        assert result.skipped_count == rescanned.skipped_count == 1
+        assert result.timeout_count == rescanned.timeout_count == 0
+
+    def test_memoize_reuses_answers_for_repeated_questions(self):
+        quiz = Quiz("Test", enable_memoize=True)
+        quiz.add_question(MultipleChoiceQuestion("Same?", ["A", "B"], correct_answer="A"))
+        quiz.add_question(MultipleChoiceQuestion("Same?", ["A", "B"], correct_answer="A"))
+        quiz.add_question(TrueFalseQuestion("Same?", True))
+        calls = []
 
         def answer_provider(q, idx):
-            answer = answers[answer_idx[0]]
-            answer_idx[0] += 1
-            return answer
+            calls.append(idx)
+            return True if isinstance(q, TrueFalseQuestion) else "A"
 
         result = quiz.execute(answer_provider=answer_provider)
+        assert calls == [0, 2]
+        assert result.correct_answers == 3
 
-        assert result.skipped_count == 1
-        assert result.correct_answers == 1
+        async def async_provider(q, idx):
+            return answer_provider(q, idx)
+
+        asyncio.run(quiz.execute_async(async_provider))
+        assert calls == [0, 2, 0, 2]
+
+    def test_memoize_is_scoped_to_one_run(self):
+        quiz = Quiz("Test", enable_memoize=True)
+        quiz.add_question(MultipleChoiceQuestion("Q?", ["A", "B"], correct_answer="A"))
+
+        first = quiz.execute(answer_provider=lambda q, idx: "A")
+        second = quiz.execute(answer_provider=lambda q, idx: "B")
+        assert first.correct_answers == 1
+        assert second.correct_answers == 0
+
+    def test_memoize_tells_apart_questions_with_the_same_text(self):
+        quiz = Quiz("Test", enable_memoize=True)
+        quiz.add_question(MultipleChoiceQuestion("Pick one", ["A", "B"], correct_answer="A"))
+        quiz.add_question(MultipleChoiceQuestion("Pick one", ["C", "D"], correct_answer="D"))
+        calls = []
+
+        def answer_provider(q, idx):
+            calls.append(idx)
+            return q.correct_answer
+
+        result = quiz.execute(answer_provider=answer_provider)
+        assert calls == [0, 1]
+        assert result.correct_answers == 2
+
+    @pytest.mark.slow
+    def test_execute_async_concurrent_overlaps_answers(self):
+        quiz = Quiz("Test")
+        for i in range(4):
+            quiz.add_question(MultipleChoiceQuestion(f"Q{i}?", ["A", "B"], correct_answer="A"))
+        quiz.add_question(
+            MultipleChoiceQuestion("Slow?", ["A", "B"], correct_answer="A", time_limit=0.05)
+        )
+        in_flight = []
+
+        async def answer_provider(q, idx):
+            in_flight.append(idx)
+            await asyncio.sleep(1 if q.text == "Slow?" else 0.1)
+            return "A"
+
+        start = time.perf_counter()
+        result = asyncio.run(quiz.execute_async_concurrent(answer_provider, max_concurrency=5))
+
+        assert time.perf_counter() - start < 0.5
+        assert sorted(in_flight) == [0, 1, 2, 3, 4]
+        assert result.correct_answers == 4
+        assert result.question_results[4].status == ResultStatus.TIMEOUT
+
+    def test_execute_async_concurrent_times_each_answer_once(self):
+        quiz = Quiz("Test")
+        quiz.add_question(MultipleChoiceQuestion("Q1?", ["A", "B"], "A", time_limit=5))
+        quiz.add_question(MultipleChoiceQuestion("Q2?", ["A", "B"], "A", time_limit=5))
+        limits = []
+        bounded = core._bounded
+
+        async def recording_bounded(awaitable, time_limit):
+            limits.append(time_limit)
+            return await bounded(awaitable, time_limit)
+
+        async def answer_provider(q, idx):
+            return "A"
+
+        with patch("quizy.core._bounded", recording_bounded):
+            result = asyncio.run(quiz.execute_async_concurrent(answer_provider))
+        assert sorted(limit for limit in limits if limit) == [5, 5]
+        assert result.correct_answers == 2
+
+    def test_execute_async_concurrent_passes_run_order_index(self):
+        questions = [MultipleChoiceQuestion(f"Q{i}?", ["A", "B"], "A") for i in range(6)]
+        quiz = Quiz("Test", questions=questions + [questions[0]], randomize_order=True)
+        asked = []
+
+        async def answer_provider(q, idx):
+            asked.append((idx, q.text))
+            return "A"
+
+        with patch("quizy.core.random.sample", side_effect=lambda seq, k: list(reversed(seq))):
+            result = asyncio.run(quiz.execute_async_concurrent(answer_provider))
+
+        run_order = list(reversed(quiz.questions))
+        assert sorted(asked) == [(i, q.text) for i, q in enumerate(run_order)]
+        assert [r.question_index for r in result.question_results] == list(range(7))
+        assert result.correct_answers == 7
+
+    def test_execute_async_question_timeout(self):
+        quiz = Quiz("Test")
+        quiz.add_question(
+            MultipleChoiceQuestion("Q1?", ["A", "B"], correct_answer="A", time_limit=0.01)
+        )
+        quiz.add_question(MultipleChoiceQuestion("Q2?", ["A", "B"], correct_answer="A"))
+
+        async def answer_provider(q, idx):
+            if idx == 0:
+                await asyncio.sleep(1)
+            return "A"
+
+        for asyncio_timeout in (core._asyncio_timeout, None):
+            with patch("quizy.core._asyncio_timeout", asyncio_timeout):
+                result = asyncio.run(quiz.execute_async(answer_provider))
+            assert result.question_results[0].status == ResultStatus.TIMEOUT
+            assert result.question_results[1].status == ResultStatus.CORRECT
+            assert result.timeout_count == 1
+
+    def test_false_answer_is_recorded_as_given(self):
+        quiz = Quiz("Test")
+        quiz.add_question(TrueFalseQuestion("Sky is green?", False))
+        seen = []
+
+        result = quiz.execute(
+            answer_provider=lambda q, idx: False,
+            result_callback=lambda q, i, answer, status, t: seen.append(answer),
+        )
+
+        assert result.question_results[0].user_answer is False
+        assert seen == [False]
+
+    @pytest.mark.parametrize("allow_skip", [False, True])
+    def test_missing_answer_is_skipped(self, allow_skip):
+        quiz = Quiz("Test", allow_skip=allow_skip)
+        quiz.add_question(
+            MultipleChoiceQuestion("Q1?", ["A", "B"], correct_answer="A")
+        )
+
+        async def async_provider(q, idx):
+            return None
+
+        for result in (
+            quiz.execute(answer_provider=lambda q, idx: None),
+            asyncio.run(quiz.execute_async(async_provider)),
+        ):
+            assert result.skipped_count == 1
+            assert result.question_results[0].status == ResultStatus.SKIPPED
 
     def test_multiple_select_execution(self):
         quiz = Quiz("Test")
@@ -862,92 +1084,96 @@ class TestQuiz:
             )
         )
 
-        def answer_provider(q, idx):
-            return ["A", "C"]
-
-        result = quiz.execute(answer_provider=answer_provider)
+        result = quiz.execute(answer_provider=make_provider([["A", "C"]]))
 
         assert result.correct_answers == 1
         assert result.score_percentage == 100.0
 
-    def test_empty_quiz_invalid(self):
-        quiz = Quiz("Empty")
+    @pytest.mark.parametrize(
+        "questions,expected_valid",
+        [
+            ([], False),
+            ([MultipleChoiceQuestion("Q?", ["A", "B"], correct_answer="A")], True),
+        ],
+        ids=["empty", "one_question"],
+    )
+    def test_validate(self, questions, expected_valid):
+        quiz = Quiz("Test")
+        quiz.add_questions(questions)
         is_valid, errors = quiz.validate()
-        assert is_valid is False
-        assert len(errors) > 0
+        assert is_valid is expected_valid
+        assert bool(errors) is not expected_valid
 
-    def test_valid_quiz(self):
-        quiz = Quiz("Valid")
-        quiz.add_question(
-            MultipleChoiceQuestion("Q?", ["A", "B"], correct_answer="A")
-        )
-        is_valid, errors = quiz.validate()
-        assert is_valid is True
-        assert len(errors) == 0
+    def test_untimed_quiz_skips_clock_check(self, mc_ab):
+        """Test quiz without a time limit never checks the clock"""
+        quiz = Quiz("Test")
+        quiz.add_question(mc_ab)
+
+        with patch.object(Quiz, "is_time_up", side_effect=AssertionError):
+            result = quiz.execute(answer_provider=lambda q, idx: "A")
+
+        assert result.correct_answers == 1
+
+    def test_quiz_time_limit_stops_execution(self):
+        """Test questions after the quiz deadline are recorded as timeouts"""
+        quiz = Quiz("Test", time_limit=0.01)
+        for i in range(3):
+            quiz.add_question(MultipleChoiceQuestion(f"Q{i}?", ["A", "B"], "AB"[i % 2]))
+
+        def answer_provider(q, idx):
+            time.sleep(0.02)
+            return "A"
 
-    def test_with_time_limit(self):
-        """Test quiz with time limit"""
-        quiz = Quiz("Test", time_limit=300.0)
-        assert quiz.time_limit == 300.0
+        result = quiz.execute(answer_provider=answer_provider)
+
+        assert result.correct_answers == 1
+        assert result.timeout_count == 2
+        assert [r.question_index for r in result.question_results] == [0, 1, 2]
+        assert [r.correct_answer for r in result.question_results] == ["A", "B", "A"]
+        assert quiz.is_time_up() is True
 
-    def test_remove_question(self):
+    def test_remove_question(self, quiz, prototype_quiz):
         """Test removing a question from quiz"""
-        quiz = Quiz("Test")
-        q1 = MultipleChoiceQuestion("Q1?", ["A", "B"], "A")
-        quiz.add_question(q1)
         quiz.remove_question(0)
-        assert quiz.get_question_count() == 0
+        assert quiz.get_question_count() == 1
+        assert quiz.get_questions()[0].text == "Q2?"
+        assert prototype_quiz.get_question_count() == 2
 
-    def test_get_all_questions(self):
+    def test_get_all_questions(self, quiz, prototype_quiz):
         """Test getting all questions from quiz"""
-        quiz = Quiz("Test")
-        q1 = MultipleChoiceQuestion("Q1?", ["A", "B"], "A")
-        q2 = MultipleChoiceQuestion("Q2?", ["X", "Y"], "X")
-        quiz.add_question(q1)
-        quiz.add_question(q2)
-        
+        q1, q2 = prototype_quiz.questions
         questions = quiz.get_questions()
         assert len(questions) == 2
         assert q1 in questions
         assert q2 in questions
 
-    def test_get_question_count(self):
+    def test_get_question_count(self, quiz):
         """Test getting question count"""
-        quiz = Quiz("Test")
-        quiz.add_question(MultipleChoiceQuestion("Q1?", ["A", "B"], "A"))
-        quiz.add_question(MultipleChoiceQuestion("Q2?", ["X", "Y"], "X"))
-        
         assert quiz.get_question_count() == 2
 
-    def test_randomize_order(self):
-        """Test randomizing question order"""
-        quiz = Quiz("Test", randomize_order=True)
-        for i in range(5):
-            quiz.add_question(
-                MultipleChoiceQuestion(f"Q{i}?", ["A", "B"], "A")
-            )
-        
-        is_valid, errors = quiz.validate()
-        assert is_valid is True
-
-    def test_show_progress_false(self):
-        """Test quiz with show_progress disabled"""
-        quiz = Quiz("Test", show_progress=False)
-        quiz.add_question(MultipleChoiceQuestion("Q?", ["A", "B"], "A"))
-        is_valid, _ = quiz.validate()
-        assert is_valid is True
-
-    def test_allow_skip_true(self):
-        """Test quiz with skip enabled"""
-        quiz = Quiz("Test", allow_skip=True)
-        quiz.add_question(MultipleChoiceQuestion("Q?", ["A", "B"], "A"))
-        is_valid, _ = quiz.validate()
-        assert is_valid is True
-
-    def test_shuffle_options_true(self):
-        """Test quiz with option shuffling"""
-        quiz = Quiz("Test", shuffle_options=True)
-        quiz.add_question(MultipleChoiceQuestion("Q?", ["A", "B"], "A"))
+    def test_randomize_order_asks_each_question_once(self):
+        """Test randomized execution covers every question without reordering the quiz"""
+        questions = [MultipleChoiceQuestion(f"Q{i}?", ["A", "B"], "A") for i in range(5)]
+        quiz = Quiz("Test", questions=list(questions), randomize_order=True)
+        asked = []
+        quiz.execute(lambda q, idx: asked.append(q) or "A")
+        assert sorted(asked, key=questions.index) == questions
+        assert quiz.questions == questions
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"randomize_order": True},
+            {"show_progress": False},
+            {"allow_skip": True},
+            {"shuffle_options": True},
+        ],
+        ids=["randomize_order", "show_progress_false", "allow_skip", "shuffle_options"],
+    )
+    def test_boolean_option_keeps_quiz_valid(self, mc_ab, kwargs):
+        """Test each boolean quiz option leaves a one-question quiz valid"""
+        quiz = Quiz("Test", **kwargs)
+        quiz.add_question(mc_ab)
         is_valid, _ = quiz.validate()
         assert is_valid is True
 
@@ -970,6 +1196,37 @@ class TestQuiz:
         is_valid, errors = quiz.validate()
         assert is_valid is True
 
+    def test_grade_batch_counts_multiple_choice_answers(self):
+        """Test batch grading only scores multiple choice columns"""
+        quiz = Quiz("Batch")
+        quiz.add_question(MultipleChoiceQuestion("Q1?", ["A", "B"], "A"))
+        quiz.add_question(TrueFalseQuestion("TF?", True))
+        quiz.add_question(MultipleChoiceQuestion("Q2?", ["C", "D"], "D"))
+        answers = [
+            ["A", True, "D"],
+            ["B", True, "D"],
+            ["B", False, None],
+        ]
+        assert quiz.grade_batch(answers) == [2, 1, 0]
+        with patch("quizy.core.optional_numpy", return_value=None):
+            assert quiz.grade_batch(answers) == [2, 1, 0]
+
+    def test_count_matches_with_token_ids(self):
+        """Test counting matching positions in rows of integer IDs"""
+        rows = [[1, 2, 3], [1, 0, 3], [0, 0, 0]]
+        assert count_matches(rows, [1, 2, 3]) == [3, 2, 0]
+        with patch("quizy.core.optional_numpy", return_value=None):
+            assert count_matches(rows, [1, 2, 3]) == [3, 2, 0]
+
+    @pytest.mark.parametrize("rows", [[[1, 2]], [[1, 2, 3], [1, 2, 3, 4]]])
+    def test_count_matches_rejects_length_mismatch(self, rows):
+        """Test rows of a different length than the key fail the same way with or without numpy"""
+        with pytest.raises(ValueError):
+            count_matches(rows, [1, 2, 3])
+        with patch("quizy.core.optional_numpy", return_value=None):
+            with pytest.raises(ValueError):
+                count_matches(rows, [1, 2, 3])
+
     def test_complex_quiz(self):
         """Test complex quiz with all question types"""
         quiz = Quiz(
@@ -1004,63 +1261,16 @@ class TestQuiz:
         assert is_valid is True
         assert quiz.get_question_count() == 5
 
-    def test_to_dict(self):
+    def test_to_dict(self, simple_result):
         """Test quiz result to dictionary conversion"""
-        quiz = Quiz("Test")
-        quiz.add_question(
-            MultipleChoiceQuestion("Q?", ["A", "B"], correct_answer="A")
-        )
-
-        def answer_provider(q, idx):
-            return "A"
-
-        result = quiz.execute(answer_provider=answer_provider)
-        result_dict = result.to_dict()
+        result_dict = simple_result.to_dict()
         assert "title" in result_dict
         assert "score_percentage" in result_dict
         assert "question_results" in result_dict
 
-    def test_with_explanation(self):
+    def test_with_explanation(self, simple_result):
         """Test quiz with explanations"""
-        quiz = Quiz("Test")
-        quiz.add_question(
-            MultipleChoiceQuestion(
-                "What is 2+2?",
-                ["3", "4", "5"],
-                correct_answer="4",
-                explanation="2+2 equals 4",
-            )
-        )
-
-        def answer_provider(q, idx):
-            return "4"
-
-        result = quiz.execute(answer_provider=answer_provider)
-        assert result.correct_answers == 1
-
-
-class TestQuestionTypes:
-    """Test question type detection"""
-
-    def test_multiple_choice_type(self):
-        q = MultipleChoiceQuestion("Q?", ["A", "B"], "A")
-        assert q.question_type == QuestionType.MULTIPLE_CHOICE
-
-    def test_multiple_select_type(self):
-        q = MultipleSelectQuestion("Q?", ["A", "B", "C"], ["A", "B"])
-        assert q.question_type == QuestionType.MULTIPLE_SELECT
-
-    def test_short_text_type(self):
-        q = ShortTextQuestion("Q?", "answer")
-        assert q.question_type == QuestionType.SHORT_TEXT
-
-    def test_true_false_type(self):
-        q = TrueFalseQuestion("Q?", True)
-        assert q.question_type == QuestionType.TRUE_FALSE
-
-    def test_matching_type(self):
-        q = MatchingQuestion("Q?", {"a": "1", "b": "2"})
-        assert q.question_type == QuestionType.MATCHING
+        assert simple_result.correct_answers == 1
 
 
 class TestEnums:
@@ -1083,6 +1293,45 @@ class TestEnums:
         assert ResultStatus.PARTIAL.value == "partial"
 
 
+class TestConstructorPassthrough:
+    """Test constructors store optional settings unchanged"""
+
+    @pytest.mark.parametrize(
+        "cls,kwargs,attr,expected",
+        [
+            (
+                ShortTextQuestion,
+                {"text": "Q?", "correct_answer": "answer", "explanation": "This is the answer"},
+                "explanation",
+                "This is the answer",
+            ),
+            (ShortTextQuestion, {"text": "Q?", "correct_answer": "answer", "time_limit": 30.0}, "time_limit", 30.0),
+            (
+                ShortTextQuestion,
+                {"text": "Q?", "correct_answer": "answer", "metadata": {"difficulty": "hard"}},
+                "metadata",
+                {"difficulty": "hard"},
+            ),
+            (
+                TrueFalseQuestion,
+                {"text": "Q?", "correct_answer": True, "explanation": "True because..."},
+                "explanation",
+                "True because...",
+            ),
+            (
+                MatchingQuestion,
+                {"text": "Match", "pairs": {"A": "1", "B": "2"}, "explanation": "Match the pairs"},
+                "explanation",
+                "Match the pairs",
+            ),
+            (MatchingQuestion, {"text": "Match", "pairs": {"A": "1", "B": "2"}, "time_limit": 60.0}, "time_limit", 60.0),
+            (Quiz, {"title": "Test", "time_limit": 300.0}, "time_limit", 300.0),
+        ],
+    )
+    def test_attribute_passthrough(self, cls, kwargs, attr, expected):
+        assert getattr(cls(**kwargs), attr) == expected
+
+
 class TestMetadata:
     """Test metadata storage"""
 
@@ -1101,11 +1350,6 @@ class TestMetadata:
         assert q.metadata["topic"] == "math"
         assert "basic" in q.metadata["tags"]
 
-    def test_empty_metadata_default(self):
-        q = MultipleChoiceQuestion(
-            text="Q?",
-            options=["A", "B"],
-            correct_answer="A",
-        )
-        assert isinstance(q.metadata, dict)
-        assert len(q.metadata) == 0
+    def test_empty_metadata_default(self, mc_ab):
+        assert isinstance(mc_ab.metadata, dict)
+        assert len(mc_ab.metadata) == 0
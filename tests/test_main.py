@@ -1,66 +1,59 @@
 """Main module tests"""
 import pytest
-from unittest.mock import patch
-from quizy.main import main
 
+main = pytest.importorskip("quizy.main").main
 
-class TestMain:
-    """Test main function"""
 
-    @patch("builtins.input", return_value="1")
-    @patch("quizy.main.quiz_101")
-    def test_main_quiz_101_selection(self, mock_101, mock_input):
-        """Test main with quiz 101 selection"""
-        try:
-            main()
-        except SystemExit:
-            pass
-        mock_101.start.assert_called_once()
+class _QuizStub:
+    """Stands in for a quiz module, counting start() calls"""
 
-    @patch("builtins.input", return_value="2")
-    @patch("quizy.main.quiz_102")
-    def test_main_quiz_102_selection(self, mock_102, mock_input):
-        """Test main with quiz 102 selection"""
-        try:
-            main()
-        except SystemExit:
-            pass
-        mock_102.start.assert_called_once()
+    def __init__(self):
+        self.started = 0
 
-    @patch("builtins.input", return_value="invalid")
-    def test_main_invalid_choice(self, mock_input):
-        """Test main with invalid choice"""
-        with pytest.raises(SystemExit):
-            main()
+    def start(self):
+        self.started += 1
 
-    @patch("builtins.input", side_effect=KeyboardInterrupt())
-    def test_main_keyboard_interrupt(self, mock_input):
-        """Test main with keyboard interrupt"""
-        with pytest.raises(SystemExit):
-            main()
 
-    @patch("builtins.input", side_effect=EOFError())
-    def test_main_eof_error(self, mock_input):
-        """Test main with EOF error"""
-        with pytest.raises(SystemExit):
-            main()
+@pytest.fixture
+def patched_input(monkeypatch):
+    """Patch input() to return a choice, or raise it when it is an exception"""
+    def _patch(choice):
+        if isinstance(choice, BaseException):
+            def fake_input(prompt=""):
+                raise choice
+        else:
+            def fake_input(prompt=""):
+                return choice
+        monkeypatch.setattr("builtins.input", fake_input)
+    return _patch
 
-    @patch("builtins.input", return_value="1")
-    @patch("quizy.main.quiz_101")
-    def test_main_quiz_101_start_called(self, mock_101, mock_input):
-        """Test main calls quiz_101.start()"""
-        try:
-            main()
-        except SystemExit:
-            pass
-        assert mock_101.start.called
 
-    @patch("builtins.input", return_value="2")
-    @patch("quizy.main.quiz_102")
-    def test_main_quiz_102_start_called(self, mock_102, mock_input):
-        """Test main calls quiz_102.start()"""
+class TestMain:
+    """Test main function"""
+
+    @pytest.mark.parametrize(
+        "choice,target",
+        [("1", "quizy.main.quiz_101"), ("2", "quizy.main.quiz_102")],
+        ids=["quiz_101", "quiz_102"],
+    )
+    def test_main_starts_selected_quiz(self, monkeypatch, patched_input, choice, target):
+        """Test main calls start() on the selected quiz"""
+        quiz = _QuizStub()
+        monkeypatch.setattr(target, quiz)
+        patched_input(choice)
         try:
             main()
         except SystemExit:
             pass
-        assert mock_102.start.called
+        assert quiz.started == 1
+
+    @pytest.mark.parametrize(
+        "choice",
+        ["invalid", KeyboardInterrupt(), EOFError()],
+        ids=["invalid_choice", "keyboard_interrupt", "eof_error"],
+    )
+    def test_main_exits(self, patched_input, choice):
+        """Test main exits on an invalid choice or interrupted input"""
+        patched_input(choice)
+        with pytest.raises(SystemExit):
+            main()
@@ -0,0 +1,118 @@
+"""MCP server tests - tool dispatch, response cache and validation"""
+import asyncio
+import json
+import pytest
+
+pytest.importorskip("mcp")
+
+import mcp.types as types
+from quizy import mcp_server
+from quizy.core import TrueFalseQuestion
+
+
+class FakeGenerator:
+    """Stands in for AIQuestionGenerator, recording each request"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def generate_questions_set_async(self, topic, num_questions, question_types, difficulty):
+        self.calls.append(topic)
+        return [TrueFalseQuestion(f"Is {topic} fun?", True)]
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    fake = FakeGenerator()
+    monkeypatch.setattr(mcp_server, "_GENERATOR", fake)
+    monkeypatch.setattr(mcp_server, "_RESPONSE_CACHE", mcp_server.OrderedDict())
+    return fake
+
+
+def call(name, arguments):
+    """Send a CallToolRequest through the server's registered handler and decode the JSON reply"""
+    request = types.CallToolRequest(
+        method="tools/call", params=types.CallToolRequestParams(name=name, arguments=arguments)
+    )
+    handler = mcp_server.server.request_handlers[types.CallToolRequest]
+    result = asyncio.run(handler(request)).root
+    return json.loads(result.content[0].text)
+
+
+class TestCallToolDispatch:
+    """Test tool calls are routed by name"""
+
+    def test_generate_quizzes_batch(self, generator):
+        data = call("generate_quizzes_batch", {"topics": ["Python", "Rust"], "num_questions": 1})
+        assert [quiz["topic"] for quiz in data["quizzes"]] == ["Python", "Rust"]
+        assert generator.calls == ["Python", "Rust"]
+
+    def test_generate_quiz(self, generator):
+        data = call("generate_quiz", {"topic": "Python", "num_questions": 1})
+        assert data["topic"] == "Python"
+        assert data["questions"][0]["type"] == "TrueFalseQuestion"
+
+    def test_validate_question(self):
+        data = call(
+            "validate_question",
+            {"question_text": "Is the sky blue?", "question_type": "TRUE_FALSE", "correct_answer": "True"},
+        )
+        assert data["valid"] is True
+
+    @pytest.mark.parametrize("answer", [["True"], {"answer": "True"}])
+    def test_validate_true_false_unhashable_answer(self, answer):
+        result = asyncio.run(mcp_server.validate_question("Is the sky blue?", "TRUE_FALSE", correct_answer=answer))
+        data = json.loads(result[0].text)
+        assert data["issues"] == ["Answer must be True or False"]
+
+    def test_unknown_tool(self):
+        assert "error" in call("no_such_tool", {})
+
+    def test_unexpected_argument(self):
+        data = call("analyze_difficulty", {"questions_json": "[]", "extra": 1})
+        assert data["error"].startswith("Invalid arguments for analyze_difficulty")
+
+
+class TestResponseCache:
+    """Test generated quizzes are reused only for the same request"""
+
+    def test_question_type_order_is_part_of_the_key(self):
+        key = mcp_server._response_key("Python", 3, "easy", ["TRUE_FALSE", "MULTIPLE_CHOICE"])
+        reversed_key = mcp_server._response_key("Python", 3, "easy", ["MULTIPLE_CHOICE", "TRUE_FALSE"])
+        assert key != reversed_key
+
+    def test_hit_echoes_the_current_topic(self, generator):
+        call("generate_quiz", {"topic": "python", "num_questions": 1})
+        data = call("generate_quiz", {"topic": " Python ", "num_questions": 1})
+        assert data["topic"] == " Python "
+        assert generator.calls == ["python"]
+
+    def test_batch_shares_the_cache(self, generator):
+        call("generate_quiz", {"topic": "Python", "num_questions": 1})
+        data = call("generate_quizzes_batch", {"topics": ["python", "Rust"], "num_questions": 1})
+        assert [quiz["topic"] for quiz in data["quizzes"]] == ["python", "Rust"]
+        assert generator.calls == ["Python", "Rust"]
+
+    @pytest.mark.parametrize("raw,expected", [("60", 60.0), ("soon", 1800.0), ("nan", 1800.0)])
+    def test_ttl_setting(self, monkeypatch, raw, expected):
+        monkeypatch.setenv("QUIZY_MCP_CACHE_TTL", raw)
+        assert mcp_server._env_seconds("QUIZY_MCP_CACHE_TTL", 1800.0) == expected
+
+
+class TestQuestionPayload:
+    """Test generated questions are serialized with the fields they carry"""
+
+    def test_attributes_set_in_init_are_included(self):
+        class PairsQuestion(TrueFalseQuestion):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.pairs = {"a": "1"}
+
+        payload = mcp_server._question_payload(PairsQuestion("Q?", True))
+        assert payload == {
+            "text": "Q?",
+            "type": "PairsQuestion",
+            "time_limit": None,
+            "correct_answer": True,
+            "pairs": {"a": "1"},
+        }